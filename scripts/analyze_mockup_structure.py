@@ -1,78 +1,495 @@
 """
-페이지 목업 이미지 분석 스크립트
-헤더, 히어로, footer 영역을 감지하여 구조를 분석
+페이지 목업 구조 분석 스크립트
+기획서 PDF의 텍스트 스팬(page.get_text("dict")), 채워진 도형(page.get_drawings()), 이미지 배치 영역으로
+각 페이지의 헤더, 히어로, 새소식 그리드, footer 영역을 감지하여 페이지별 JSON으로 저장
+
+감지 기준 (페이지 크기 대비 비율):
+    header    - 상단 HEADER_BAND 안의 가로로 넓은 도형 배경 또는 가로로 나열된 텍스트(메뉴) 행
+    hero      - header와 footer 사이에서 가장 큰 이미지 (너비 HERO_MIN_WIDTH, 높이 HERO_MIN_HEIGHT 이상)
+    news_grid - 크기가 비슷하고 같은 높이에 나란히 놓인 이미지/도형 카드 GRID_MIN_ITEMS개 이상
+    footer    - 하단 FOOTER_BAND 안의 가로로 넓은 도형 배경 또는 텍스트 줄
+
+결과 형식 (docs/layout/page3.json):
+    {
+      "page": 3, "fingerprint": "<페이지 지문>", "size": [960, 540],
+      "regions": {
+        "header": {"bbox": [x0, y0, x1, y1], "background": "#000000", "logo": "page3_img2_...", "items": [...], "buttons": [...]},
+        "hero": {"bbox": [...], "image": "page3_img39_2080x1234", "headline": "...", "texts": [...]},
+        "news_grid": {"bbox": [...], "title": "새소식", "rows": 1, "columns": 4, "items": [...]},
+        "footer": {"bbox": [...], "background": null, "texts": [...]}
+      },
+      "counts": {"spans": 42, "shapes": 7, "images": 12}
+    }
+    감지되지 않은 영역은 null, 이미지 이름은 추출 파일명(page3_img39_2080x1234.jpeg)의 확장자 제외
+
+분석 결과는 페이지 지문(pdf_catalog.page_fingerprint - 페이지 크기, 콘텐츠 스트림, 이미지 스트림)별로
+.build-cache/layout-cache.json에 캐시하므로, 기획서가 수정되면 바뀐 페이지만 다시 분석함.
+지문에는 페이지 번호가 없으므로 캐시에는 페이지 번호를 뺀 이미지 이름(img39_2080x1234)을 저장하고,
+JSON을 쓸 때 현재 페이지 번호를 붙임 (앞에 슬라이드가 추가되어도 이름이 밀리지 않음)
+
+사용법:
+    python scripts/analyze_mockup_structure.py
+    python scripts/analyze_mockup_structure.py --pages 3 11 -o docs/layout
+    python scripts/analyze_mockup_structure.py --no-cache
 """
 
+import argparse
+import json
 import sys
+import time
 from pathlib import Path
 
-# 이미지 설명 기반 구조 분석 (실제 이미지 분석은 복잡하므로 설명 기반으로)
-mockup_structure = {
-    "header": {
-        "background": "검은색 배경",
-        "logo": {
-            "position": "왼쪽 상단",
-            "text": "SPECIAL FORCE REMASTERED",
-            "color": "흰색 텍스트"
-        },
-        "navigation": {
-            "position": "로고 오른쪽",
-            "items": ["새소식", "게임정보", "미디어", "고객센터"],
-            "color": "흰색 텍스트"
-        },
-        "right_icons": {
-            "position": "오른쪽 상단",
-            "items": [
-                {"type": "YouTube", "color": "빨간색"},
-                {"type": "채팅/커피컵", "color": "녹색"}
-            ]
-        },
-        "game_start_button": {
-            "position": "오른쪽 상단",
-            "text": "GAME START",
-            "color": "노란색 배경, 검은색 텍스트"
-        }
-    },
-    "hero": {
-        "background": "병사 이미지 (중앙)",
-        "overlay_text": {
-            "main": "다시, 우리는 스페셜포스다!",
-            "sub": "전설적 국민 FPS의 재탄생",
-            "position": "이미지 위 오버레이",
-            "color": "흰색"
-        },
-        "shield_logo": {
-            "position": "왼쪽 하단",
-            "visible": "부분적으로 병사에 가려짐"
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install PyMuPDF")
+    sys.exit(1)
+
+from pdf_catalog import image_placements, page_fingerprint, placement_index
+
+LAYOUT_VERSION = 2
+LAYOUT_CACHE = ".build-cache/layout-cache.json"
+LAYOUT_DIR = "docs/layout"
+# 영역 감지 기준 (페이지 크기 대비 비율)
+HEADER_BAND = 0.18
+FOOTER_BAND = 0.15
+BAR_MIN_WIDTH = 0.6
+NAV_MIN_ITEMS = 3
+NAV_MIN_SPREAD = 0.3
+HERO_MIN_WIDTH = 0.5
+HERO_MIN_HEIGHT = 0.25
+GRID_MIN_ITEMS = 3
+# 카드 크기/정렬 허용 오차 (카드 크기 대비)
+GRID_TOLERANCE = 0.15
+# 카드로 볼 도형/이미지 면적 범위 (페이지 면적 대비)
+CARD_MIN_AREA = 0.005
+CARD_MAX_AREA = 0.2
+# 히어로 위 오버레이 텍스트 최대 개수
+HERO_MAX_TEXTS = 10
+
+
+def _hex_color(color):
+    """스팬 색상(정수 sRGB) 또는 도형 색상((r, g, b) 0~1)을 #rrggbb로 변환"""
+    if color is None:
+        return None
+    if isinstance(color, int):
+        return f"#{color:06x}"
+    return "#" + "".join(f"{round(channel * 255):02x}" for channel in color[:3])
+
+
+def _box(rect):
+    """JSON용 bbox [x0, y0, x1, y1]"""
+    return [round(value, 1) for value in tuple(rect)]
+
+
+def _union(rects):
+    """여러 영역을 모두 포함하는 영역"""
+    result = fitz.Rect(rects[0])
+    for rect in rects[1:]:
+        result |= rect
+    return result
+
+
+def _center_inside(rect, area):
+    """rect의 중심이 area 안에 있는지"""
+    return area.contains(fitz.Point((rect.x0 + rect.x1) / 2, (rect.y0 + rect.y1) / 2))
+
+
+def collect_elements(page, image_list=None):
+    """
+    페이지의 텍스트 스팬, 채워진 도형, 이미지 배치 영역
+
+    Returns:
+        {'spans': [{'bbox', 'text', 'size', 'color', 'bold'}, ...],
+         'shapes': [{'bbox', 'fill'}, ...],
+         'images': [{'bbox', 'name'}, ...]}
+        이미지 이름은 페이지 번호를 뺀 img39_2080x1234 형태 (page_image_names에서 페이지 번호를 붙임)
+    """
+    spans = []
+    for block in page.get_text("dict")['blocks']:
+        if block['type'] != 0:
+            continue
+        for line in block['lines']:
+            for span in line['spans']:
+                text = span['text'].strip()
+                if text:
+                    spans.append({
+                        'bbox': fitz.Rect(span['bbox']),
+                        'text': text,
+                        'size': round(span['size'], 1),
+                        'color': _hex_color(span['color']),
+                        'bold': bool(span['flags'] & 16),
+                    })
+
+    page_area = abs(page.rect)
+    shapes = [
+        {'bbox': fitz.Rect(drawing['rect']), 'fill': _hex_color(drawing['fill'])}
+        for drawing in page.get_drawings()
+        if drawing.get('fill') is not None and abs(fitz.Rect(drawing['rect'])) >= page_area * CARD_MIN_AREA
+    ]
+
+    if image_list is None:
+        image_list = page.get_images(full=True)
+    placements = placement_index(page, image_list) if image_list else {}
+    images = []
+    for img_index, img in enumerate(image_list):
+        # 추출 스크립트의 파일명 규칙 (pdf_catalog.image_filename, 확장자와 페이지 번호 제외)
+        name = f"img{img_index + 1}"
+        if img[2] > 0 and img[3] > 0:
+            name += f"_{img[2]}x{img[3]}"
+        for rect, _ in image_placements(page, img[0], placements):
+            if not rect.is_empty:
+                images.append({'bbox': fitz.Rect(rect), 'name': name})
+
+    return {'spans': spans, 'shapes': shapes, 'images': images}
+
+
+def group_rows(spans):
+    """세로 중심이 비슷한 스팬끼리 행으로 묶기 (위에서부터, 행 안에서는 왼쪽부터)"""
+    rows = []
+    for span in sorted(spans, key=lambda span: (span['bbox'].y0 + span['bbox'].y1) / 2):
+        center = (span['bbox'].y0 + span['bbox'].y1) / 2
+        if rows:
+            last = rows[-1]
+            last_center = sum((item['bbox'].y0 + item['bbox'].y1) / 2 for item in last) / len(last)
+            if abs(center - last_center) <= max(item['size'] for item in last + [span]) * 0.6:
+                last.append(span)
+                continue
+        rows.append([span])
+    return [sorted(row, key=lambda span: span['bbox'].x0) for row in rows]
+
+
+def _widest_bar(shapes, band, page_rect):
+    """band 안에 있는 가로로 넓은 도형 중 가장 넓은 것 (없으면 None)"""
+    bars = [
+        shape for shape in shapes
+        if band.contains(shape['bbox']) and shape['bbox'].width >= page_rect.width * BAR_MIN_WIDTH
+    ]
+    return max(bars, key=lambda shape: shape['bbox'].width) if bars else None
+
+
+def detect_header(elements, page_rect):
+    """상단 배경 띠와 메뉴 행으로 header 감지"""
+    band = fitz.Rect(page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y0 + page_rect.height * HEADER_BAND)
+    bar = _widest_bar(elements['shapes'], band, page_rect)
+    band_spans = [span for span in elements['spans'] if band.contains(span['bbox'])]
+    nav_row = None
+    for row in group_rows(band_spans):
+        spread = row[-1]['bbox'].x1 - row[0]['bbox'].x0
+        if len(row) >= NAV_MIN_ITEMS and spread >= page_rect.width * NAV_MIN_SPREAD:
+            nav_row = row
+            break
+    if bar is None and nav_row is None:
+        return None
+
+    bbox = _union(([bar['bbox']] if bar else []) + [span['bbox'] for span in nav_row or []])
+    # 배경 띠 안의 작은 도형 중 텍스트가 들어 있는 것은 버튼 (GAME START 등)
+    buttons = []
+    for shape in elements['shapes']:
+        if shape is bar or not bbox.intersects(shape['bbox']) or shape['bbox'].width >= page_rect.width * BAR_MIN_WIDTH:
+            continue
+        texts = [span for span in band_spans if _center_inside(span['bbox'], shape['bbox'])]
+        if texts:
+            buttons.append({'bbox': _box(shape['bbox']), 'text': " ".join(span['text'] for span in texts),
+                            'fill': shape['fill']})
+    button_texts = {button['text'] for button in buttons}
+    items = [span['text'] for span in nav_row or [] if span['text'] not in button_texts]
+    logos = sorted(
+        (image for image in elements['images'] if _center_inside(image['bbox'], bbox)),
+        key=lambda image: image['bbox'].x0,
+    )
+    return {
+        'bbox': _box(bbox),
+        'background': bar['fill'] if bar else None,
+        'logo': logos[0]['name'] if logos else None,
+        'items': items,
+        'buttons': buttons,
+    }
+
+
+def detect_footer(elements, page_rect):
+    """하단 배경 띠와 텍스트 줄로 footer 감지"""
+    band = fitz.Rect(page_rect.x0, page_rect.y1 - page_rect.height * FOOTER_BAND, page_rect.x1, page_rect.y1)
+    bar = _widest_bar(elements['shapes'], band, page_rect)
+    band_spans = [span for span in elements['spans'] if band.contains(span['bbox'])]
+    # 쪽 번호처럼 텍스트 하나만 있는 경우는 footer로 보지 않음
+    if bar is None and len(band_spans) < 2:
+        return None
+
+    rects = ([bar['bbox']] if bar else []) + [span['bbox'] for span in band_spans]
+    return {
+        'bbox': _box(_union(rects)),
+        'background': bar['fill'] if bar else None,
+        'texts': [" ".join(span['text'] for span in row) for row in group_rows(band_spans)],
+    }
+
+
+def detect_hero(elements, page_rect, top, bottom):
+    """header와 footer 사이의 가장 큰 이미지(없으면 도형)로 히어로 감지"""
+    def candidates(items):
+        return [
+            item for item in items
+            if item['bbox'].width >= page_rect.width * HERO_MIN_WIDTH
+            and item['bbox'].height >= page_rect.height * HERO_MIN_HEIGHT
+            and top <= (item['bbox'].y0 + item['bbox'].y1) / 2 <= bottom
+        ]
+
+    found = candidates(elements['images']) or candidates(elements['shapes'])
+    if not found:
+        return None
+    hero = max(found, key=lambda item: abs(item['bbox']))
+    overlay = sorted(
+        (span for span in elements['spans'] if _center_inside(span['bbox'], hero['bbox'])),
+        key=lambda span: (-span['size'], span['bbox'].y0),
+    )[:HERO_MAX_TEXTS]
+    return {
+        'bbox': _box(hero['bbox']),
+        'image': hero.get('name'),
+        'headline': overlay[0]['text'] if overlay else None,
+        'texts': [{'text': span['text'], 'size': span['size'], 'color': span['color']} for span in overlay],
+    }
+
+
+def _similar_size(a, b):
+    """두 영역의 너비/높이가 허용 오차 안에서 같은지"""
+    return (abs(a.width - b.width) <= b.width * GRID_TOLERANCE
+            and abs(a.height - b.height) <= b.height * GRID_TOLERANCE)
+
+
+def detect_news_grid(elements, page_rect, exclude):
+    """크기가 비슷한 카드가 나란히 놓인 가장 큰 묶음으로 새소식 그리드 감지"""
+    page_area = abs(page_rect)
+    cards = []
+    seen = set()
+    # 이미지를 먼저 넣어 같은 위치의 테두리 도형보다 이미지 이름이 남도록 함
+    for item in elements['images'] + elements['shapes']:
+        rect = item['bbox']
+        key = tuple(round(value) for value in rect)
+        if key in seen or any(rect.intersects(other) for other in exclude):
+            continue
+        if not CARD_MIN_AREA * page_area <= abs(rect) <= CARD_MAX_AREA * page_area:
+            continue
+        seen.add(key)
+        cards.append(item)
+
+    groups = []
+    for card in sorted(cards, key=lambda card: (card['bbox'].y0, card['bbox'].x0)):
+        for group in groups:
+            if _similar_size(card['bbox'], group[0]['bbox']):
+                group.append(card)
+                break
+        else:
+            groups.append([card])
+
+    best = None
+    for group in groups:
+        rows = []
+        for card in group:
+            if rows and abs(card['bbox'].y0 - rows[-1][0]['bbox'].y0) <= card['bbox'].height * GRID_TOLERANCE:
+                rows[-1].append(card)
+            else:
+                rows.append([card])
+        columns = max(len(row) for row in rows)
+        if len(group) < GRID_MIN_ITEMS or columns < 2:
+            continue
+        if best is None or len(group) > len(best[0]):
+            best = (group, rows, columns)
+    if best is None:
+        return None
+
+    group, rows, columns = best
+    bbox = _union([card['bbox'] for card in group])
+    items = []
+    for row in rows:
+        for card in sorted(row, key=lambda card: card['bbox'].x0):
+            rect = card['bbox']
+            # 카드 안이나 바로 아래(카드 높이의 절반 이내)의 텍스트를 캡션으로 사용
+            caption_area = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y1 + rect.height * 0.5)
+            caption = [span for span in elements['spans'] if _center_inside(span['bbox'], caption_area)]
+            items.append({
+                'bbox': _box(rect),
+                'image': card.get('name'),
+                'caption': " ".join(span['text'] for span in sorted(caption, key=lambda span: span['bbox'].y0)),
+            })
+            bbox |= _union([rect] + [span['bbox'] for span in caption])
+
+    # 그리드 바로 위의 가장 큰 텍스트를 제목으로 사용 (새소식 등)
+    title_area = fitz.Rect(bbox.x0, bbox.y0 - page_rect.height * 0.15, bbox.x1, bbox.y0)
+    titles = [span for span in elements['spans'] if _center_inside(span['bbox'], title_area)]
+    title = max(titles, key=lambda span: (span['size'], span['bbox'].y1)) if titles else None
+    return {
+        'bbox': _box(bbox),
+        'title': title['text'] if title else None,
+        'rows': len(rows),
+        'columns': columns,
+        'items': items,
+    }
+
+
+def analyze_page(page, image_list=None):
+    """페이지 하나의 레이아웃 분석 (페이지 번호와 무관하므로 페이지 지문별로 캐시함)"""
+    elements = collect_elements(page, image_list)
+    page_rect = page.rect
+    header = detect_header(elements, page_rect)
+    footer = detect_footer(elements, page_rect)
+    top = header['bbox'][3] if header else page_rect.y0
+    bottom = footer['bbox'][1] if footer else page_rect.y1
+    hero = detect_hero(elements, page_rect, top, bottom)
+    exclude = [fitz.Rect(region['bbox']) for region in (header, footer, hero) if region]
+    return {
+        'size': [round(page_rect.width, 1), round(page_rect.height, 1)],
+        'regions': {
+            'header': header,
+            'hero': hero,
+            'news_grid': detect_news_grid(elements, page_rect, exclude),
+            'footer': footer,
         },
-        "weapon_scope": {
-            "position": "오른쪽 하단",
-            "type": "저격 스코프/무기 부착물"
-        }
-    },
-    "footer": {
-        "position": "페이지 하단",
-        "description": "이미지 설명에 명시되지 않음 - 일반적인 footer 구조 사용"
+        'counts': {name: len(items) for name, items in elements.items()},
     }
-}
-
-print("=" * 60)
-print("페이지 목업 구조 분석 결과")
-print("=" * 60)
-print("\n[헤더 구조]")
-print(f"  배경: {mockup_structure['header']['background']}")
-print(f"  로고: {mockup_structure['header']['logo']['text']} ({mockup_structure['header']['logo']['color']})")
-print(f"  네비게이션: {', '.join(mockup_structure['header']['navigation']['items'])}")
-print(f"  우측 아이콘: {', '.join([item['type'] for item in mockup_structure['header']['right_icons']['items']])}")
-print(f"  GAME START 버튼: {mockup_structure['header']['game_start_button']['color']}")
-
-print("\n[히어로 섹션 구조]")
-print(f"  배경: {mockup_structure['hero']['background']}")
-print(f"  메인 텍스트: {mockup_structure['hero']['overlay_text']['main']}")
-print(f"  서브 텍스트: {mockup_structure['hero']['overlay_text']['sub']}")
-print(f"  방패 로고: {mockup_structure['hero']['shield_logo']['position']}")
-
-print("\n[Footer 구조]")
-print(f"  위치: {mockup_structure['footer']['position']}")
-
-print("\n" + "=" * 60)
\ No newline at end of file
+
+
+def page_image_names(layout, page_num):
+    """캐시된 레이아웃의 이미지 이름에 페이지 번호를 붙인 사본 (img39_2080x1234 -> page3_img39_2080x1234)"""
+    layout = json.loads(json.dumps(layout))
+    regions = layout['regions']
+
+    def named(name):
+        return f"page{page_num}_{name}" if name else name
+
+    if regions['header']:
+        regions['header']['logo'] = named(regions['header']['logo'])
+    if regions['hero']:
+        regions['hero']['image'] = named(regions['hero']['image'])
+    if regions['news_grid']:
+        for item in regions['news_grid']['items']:
+            item['image'] = named(item['image'])
+    return layout
+
+
+def load_layout_cache(cache_path):
+    """레이아웃 캐시 읽기 (없거나 버전이 다르면 빈 캐시)"""
+    cache_path = Path(cache_path)
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == LAYOUT_VERSION:
+                return cache
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable layout cache {cache_path}: {e}")
+    return {'version': LAYOUT_VERSION, 'pages': {}}
+
+
+def save_layout_cache(cache_path, cache):
+    """레이아웃 캐시 저장"""
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+
+def analyze_layout(pdf_path, output_dir, cache_path=None, pages=None):
+    """
+    기획서 전체(또는 지정한 페이지)의 레이아웃을 분석하여 페이지별 JSON 저장
+
+    Args:
+        pdf_path: 기획서 PDF 경로
+        output_dir: 페이지별 JSON을 저장할 디렉토리
+        cache_path: 레이아웃 캐시 경로 (None이면 캐시 사용 안 함)
+        pages: 분석할 페이지 번호 목록 (1부터, None이면 전체)
+
+    Returns:
+        (페이지별 레이아웃 리스트, 캐시에서 가져온 페이지 수)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache = load_layout_cache(cache_path) if cache_path else {'version': LAYOUT_VERSION, 'pages': {}}
+    seen = {}
+    layouts = []
+    cached_count = 0
+    stream_hashes = {}
+
+    with fitz.open(pdf_path) as pdf_document:
+        page_numbers = pages or range(1, len(pdf_document) + 1)
+        for page_num in page_numbers:
+            if not 1 <= page_num <= len(pdf_document):
+                print(f"  [SKIP] page{page_num}: out of range (1-{len(pdf_document)})")
+                continue
+            page = pdf_document[page_num - 1]
+            image_list = page.get_images(full=True)
+            fingerprint = page_fingerprint(pdf_document, page, image_list, stream_hashes)
+            layout = cache['pages'].get(fingerprint)
+            if layout is None:
+                layout = analyze_page(page, image_list)
+            else:
+                cached_count += 1
+            seen[fingerprint] = layout
+            layouts.append(dict({'page': page_num, 'fingerprint': fingerprint}, **page_image_names(layout, page_num)))
+
+    for layout in layouts:
+        with open(output_dir / f"page{layout['page']}.json", 'w', encoding='utf-8') as f:
+            json.dump(layout, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+    if pages is None:
+        # 전체 분석 시 기획서에서 사라진 페이지의 결과와 캐시 항목 정리
+        current = {f"page{layout['page']}.json" for layout in layouts}
+        for path in output_dir.glob('page*.json'):
+            if path.name not in current:
+                path.unlink()
+        cache['pages'] = seen
+    else:
+        cache['pages'].update(seen)
+    if cache_path:
+        save_layout_cache(cache_path, cache)
+    return layouts, cached_count
+
+
+def describe_regions(regions):
+    """출력용 영역 요약"""
+    parts = []
+    if regions['header']:
+        parts.append(f"header({len(regions['header']['items'])} items)")
+    if regions['hero']:
+        parts.append(f"hero({regions['hero']['image'] or 'shape'})")
+    if regions['news_grid']:
+        parts.append(f"news_grid({regions['news_grid']['rows']}x{regions['news_grid']['columns']})")
+    if regions['footer']:
+        parts.append("footer")
+    return ", ".join(parts) or "no regions"
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="기획서 페이지 레이아웃(header/hero/새소식 그리드/footer) 자동 분석")
+    parser.add_argument('--pdf', type=Path, default=project_root / "SF리마스터 웹기획서_260115.pdf",
+                        help="기획서 PDF 경로")
+    parser.add_argument('-o', '--output', type=Path, default=project_root / LAYOUT_DIR,
+                        help=f"페이지별 JSON 저장 디렉토리 (기본값: {LAYOUT_DIR})")
+    parser.add_argument('--pages', type=int, nargs='+', help="분석할 페이지 번호 (기본값: 전체)")
+    parser.add_argument('--no-cache', action='store_true', help="캐시를 무시하고 모든 페이지를 다시 분석")
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"[ERROR] PDF file not found: {args.pdf}")
+        sys.exit(1)
+
+    print(f"Analyzing page layouts: {args.pdf.name}")
+    print("=" * 60)
+    start = time.perf_counter()
+    cache_path = None if args.no_cache else project_root / LAYOUT_CACHE
+    layouts, cached_count = analyze_layout(args.pdf, args.output, cache_path, args.pages)
+    elapsed = time.perf_counter() - start
+
+    for layout in layouts:
+        print(f"  [OK] page{layout['page']}: {describe_regions(layout['regions'])}")
+
+    print("\n" + "=" * 60)
+    print(f"[DONE] {len(layouts)} page(s) analyzed in {elapsed:.2f}s "
+          f"({cached_count} from cache) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
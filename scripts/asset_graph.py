@@ -0,0 +1,316 @@
+"""
+자산 참조 그래프
+HTML/CSS/JS가 참조하는 자산을 종류(문서, CSS, 스크립트, 폰트, 이미지, 미디어)와 함께 찾아
+페이지 하나가 내려받는 모든 자산을 추적
+
+- HTML: <link rel=stylesheet/preload/icon>, <script src>, <img src/data-src>, <video>/<source>,
+  <style>와 style 속성의 url(), 그 밖의 /assets, /src 경로
+- CSS: @import(부모 CSS의 렌더링 차단 여부를 이어받음), @font-face의 url()은 폰트, 나머지 url()은 이미지
+- JS: 문자열로 넣는 경로 (main.js의 hero-bg-fallback.jpeg 배경처럼 실행 중에 불러오는 자산)
+
+첫 화면을 그리기 전에 받아야 하는 자산(렌더링 차단 CSS와 그 @import, <head>의 동기 스크립트,
+preload - 단 onload로 적용하는 비동기 CSS는 제외)을 critical로 표시하고, loading="lazy"/data-src 이미지와 영상은 lazy로 표시함.
+외부 URL(https://...)은 크기를 알 수 없으므로 요청 수에만 포함
+
+build_assets.py(해시 이름 변경), check_budget.py(페이지 용량 예산),
+cleanup_unused_images.py/auto_map_images.py(사용 중인 이미지 확인)가 함께 사용
+"""
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path, PurePosixPath
+
+# 따옴표, 괄호, 공백, 쉼표(srcset)로 구분되는 절대/상대 경로
+# 예: src="/assets/a.png", url(../images/b.png), 'url(/assets/c.jpeg)', srcset="/a.webp 768w, /b.webp 1024w"
+URL_PATTERN = re.compile(r'''(?<![\w:/])(?:\.{1,2}/|/)[^\s'"`()<>,;]+''')
+CSS_URL_PATTERN = re.compile(r'''url\(\s*['"]?([^'")]+?)['"]?\s*\)''')
+CSS_IMPORT_PATTERN = re.compile(r'''@import\s+(?:url\(\s*)?['"]?([^'")\s;]+)['"]?\s*\)?([^;]*);''')
+FONT_FACE_PATTERN = re.compile(r'@font-face\s*{[^}]*}', re.IGNORECASE)
+EXTERNAL_PATTERN = re.compile(r'^(?:https?:)?//', re.IGNORECASE)
+
+# 사이트 안의 자산으로 보는 최상위 디렉토리 (그 밖의 경로는 페이지 링크 등으로 간주)
+ASSET_ROOTS = ('assets/', 'src/')
+
+KIND_BY_SUFFIX = {
+    '.html': 'document',
+    '.css': 'css',
+    '.js': 'script',
+    '.woff2': 'font', '.woff': 'font', '.ttf': 'font', '.otf': 'font',
+    '.png': 'image', '.jpg': 'image', '.jpeg': 'image', '.gif': 'image',
+    '.webp': 'image', '.avif': 'image', '.svg': 'image', '.ico': 'image',
+    '.mp4': 'media', '.webm': 'media',
+}
+# preload의 as 값 -> 자산 종류
+PRELOAD_KINDS = {'style': 'css', 'script': 'script', 'font': 'font', 'image': 'image', 'video': 'media'}
+TEXT_KINDS = ('document', 'css', 'script')
+
+
+def resolve_reference(url, site_path):
+    """참조 경로를 사이트 경로로 변환 (쿼리/프래그먼트는 분리하여 반환)"""
+    split = re.search(r'[?#]', url)
+    path, suffix = (url[:split.start()], url[split.start():]) if split else (url, '')
+    if path.startswith('/'):
+        resolved = path.lstrip('/')
+    else:
+        resolved = str(PurePosixPath(site_path).parent / path)
+    # ../ 정리 (사이트 루트 밖으로 나가는 경로는 무시)
+    parts = []
+    for part in resolved.split('/'):
+        if part in ('', '.'):
+            continue
+        if part == '..':
+            if not parts:
+                return None, suffix
+            parts.pop()
+            continue
+        parts.append(part)
+    return '/'.join(parts), suffix
+
+
+def find_references(text, site_path, files):
+    """텍스트 파일이 참조하는 빌드 대상 파일의 사이트 경로 집합"""
+    references = set()
+    for match in URL_PATTERN.finditer(text):
+        resolved, _ = resolve_reference(match.group(0), site_path)
+        if resolved in files:
+            references.add(resolved)
+    return references
+
+
+def asset_kind(path):
+    """확장자로 자산 종류 결정 (알 수 없으면 'other')"""
+    return KIND_BY_SUFFIX.get(PurePosixPath(path).suffix.lower(), 'other')
+
+
+def _reference(url, site_path, kind=None, critical=False, lazy=False):
+    """참조 항목 딕셔너리 (사이트 밖 경로나 data: URI는 None)"""
+    url = url.strip()
+    if not url or url.startswith(('data:', '#', 'mailto:', 'tel:', 'javascript:')):
+        return None
+    if EXTERNAL_PATTERN.match(url):
+        return {'path': url, 'kind': kind or asset_kind(url.split('?')[0]),
+                'critical': critical, 'lazy': lazy, 'external': True}
+    resolved, _ = resolve_reference(url, site_path)
+    if not resolved or not resolved.startswith(ASSET_ROOTS):
+        return None
+    return {'path': resolved, 'kind': kind or asset_kind(resolved),
+            'critical': critical, 'lazy': lazy, 'external': False}
+
+
+class _HTMLReferenceParser(HTMLParser):
+    """HTML 태그의 자산 참조 수집"""
+
+    def __init__(self, site_path):
+        super().__init__(convert_charrefs=True)
+        self.site_path = site_path
+        self.references = []
+        self.in_head = False
+        self.in_style = False
+        # <noscript> 안의 CSS는 스크립트가 꺼진 경우에만 쓰이므로 렌더링 차단으로 보지 않음
+        self.in_noscript = False
+        # srcset 후보는 브라우저가 하나만 받으므로 src로만 계산 (나머지 경로 검색에서 제외)
+        self.alternatives = set()
+
+    def add(self, url, **options):
+        reference = _reference(url, self.site_path, **options)
+        if reference is not None:
+            self.references.append(reference)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: (value or '') for name, value in attrs}
+        if tag == 'head':
+            self.in_head = True
+        elif tag == 'body':
+            self.in_head = False
+        elif tag == 'style':
+            self.in_style = True
+        elif tag == 'noscript':
+            self.in_noscript = True
+        elif tag == 'link' and attrs.get('href'):
+            rel = attrs.get('rel', '').lower().split()
+            if 'stylesheet' in rel:
+                # media="print" 등 화면과 맞지 않는 CSS는 렌더링을 막지 않음
+                media = attrs.get('media', 'all').lower()
+                blocking = media in ('all', 'screen', '') and 'disabled' not in attrs and not self.in_noscript
+                self.add(attrs['href'], kind='css', critical=blocking)
+            elif 'preload' in rel:
+                # onload에서 rel을 stylesheet로 바꾸는 비동기 CSS는 렌더링을 막지 않음
+                kind = PRELOAD_KINDS.get(attrs.get('as', '').lower())
+                self.add(attrs['href'], kind=kind, critical=not (kind == 'css' and 'onload' in attrs))
+            elif 'icon' in rel or 'apple-touch-icon' in rel:
+                self.add(attrs['href'], kind='image')
+            elif 'modulepreload' in rel:
+                self.add(attrs['href'], kind='script', critical=True)
+        elif tag == 'script' and attrs.get('src'):
+            blocking = self.in_head and not ({'async', 'defer'} & set(attrs)) and attrs.get('type') != 'module'
+            self.add(attrs['src'], kind='script', critical=blocking)
+        elif tag == 'img':
+            url = attrs.get('src') or attrs.get('data-src')
+            if url:
+                lazy = attrs.get('loading', '').lower() == 'lazy' or 'data-src' in attrs and not attrs.get('src')
+                self.add(url, kind='image', lazy=lazy)
+        elif tag in ('video', 'audio', 'source') and attrs.get('src'):
+            self.add(attrs['src'], kind='media' if tag != 'source' else None, lazy=True)
+        for candidate in attrs.get('srcset', '').split(','):
+            if candidate.strip():
+                self.alternatives.add(candidate.split()[0])
+        if tag == 'video' and attrs.get('poster'):
+            self.add(attrs['poster'], kind='image')
+        if attrs.get('style'):
+            for match in CSS_URL_PATTERN.finditer(attrs['style']):
+                self.add(match.group(1), kind='image')
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.in_head = False
+        elif tag == 'style':
+            self.in_style = False
+        elif tag == 'noscript':
+            self.in_noscript = False
+
+    def handle_data(self, data):
+        if self.in_style:
+            self.references.extend(css_references(data, self.site_path, critical=True))
+
+
+def html_references(text, site_path):
+    """HTML의 자산 참조 목록"""
+    parser = _HTMLReferenceParser(site_path)
+    parser.feed(text)
+    parser.close()
+    references = parser.references
+    # 태그 속성 밖의 경로 (인라인 스크립트 등) - 다른 페이지로 가는 링크는 제외
+    known = {reference['path'] for reference in references}
+    for match in URL_PATTERN.finditer(text):
+        if match.group(0) in parser.alternatives:
+            continue
+        reference = _reference(match.group(0), site_path)
+        if reference and not reference['external'] and reference['path'] not in known \
+                and reference['kind'] != 'document':
+            known.add(reference['path'])
+            references.append(reference)
+    return references
+
+
+def css_references(text, site_path, critical=True):
+    """CSS의 자산 참조 목록 (@import는 critical을 이어받음)"""
+    references = []
+    imported = set()
+    for match in CSS_IMPORT_PATTERN.finditer(text):
+        media = match.group(2).strip().lower()
+        reference = _reference(match.group(1), site_path, kind='css',
+                               critical=critical and media in ('', 'all', 'screen'))
+        if reference:
+            imported.add(match.start(1))
+            references.append(reference)
+
+    font_spans = [match.span() for match in FONT_FACE_PATTERN.finditer(text)]
+    for match in CSS_URL_PATTERN.finditer(text):
+        if match.start(1) in imported:
+            continue
+        in_font_face = any(start <= match.start() < end for start, end in font_spans)
+        reference = _reference(match.group(1), site_path, kind='font' if in_font_face else None)
+        if reference:
+            if reference['kind'] == 'other':
+                reference['kind'] = 'image'
+            references.append(reference)
+    return references
+
+
+def script_references(text, site_path):
+    """JS 문자열의 자산 참조 목록 (실행 중에 불러오므로 critical 아님)"""
+    references = []
+    seen = set()
+    for match in URL_PATTERN.finditer(text):
+        reference = _reference(match.group(0), site_path)
+        # '//' 주석은 외부 URL로 해석되므로 사이트 경로만 사용
+        if reference and not reference['external'] and reference['path'] not in seen \
+                and reference['kind'] != 'document':
+            seen.add(reference['path'])
+            references.append(reference)
+    return references
+
+
+def file_references(text, site_path):
+    """텍스트 파일 종류에 맞는 참조 목록"""
+    kind = asset_kind(site_path)
+    if kind == 'document':
+        return html_references(text, site_path)
+    if kind == 'css':
+        return css_references(text, site_path)
+    if kind == 'script':
+        return script_references(text, site_path)
+    return []
+
+
+def collect_site_files(root):
+    """빌드 결과(dist/) 등 사이트 루트의 자산 파일 {사이트 경로: 파일 경로} (사전 압축본 제외)"""
+    files = {}
+    for top in ASSET_ROOTS:
+        for path in sorted((Path(root) / top).rglob('*')):
+            if path.is_file() and path.suffix not in ('.br', '.gz'):
+                files[path.relative_to(root).as_posix()] = path
+    return files
+
+
+def build_graph(files):
+    """
+    참조 그래프 생성
+
+    Args:
+        files: {사이트 경로: 파일 경로} (build_assets.collect_files 결과)
+
+    Returns:
+        {'files': files, 'references': {사이트 경로: [참조 항목, ...]}}
+        참조 항목은 {'path', 'kind', 'critical', 'lazy', 'external'} 딕셔너리
+    """
+    references = {}
+    for site_path, path in files.items():
+        if asset_kind(site_path) in TEXT_KINDS:
+            references[site_path] = file_references(path.read_text(encoding='utf-8'), site_path)
+    return {'files': files, 'references': references}
+
+
+def page_assets(graph, page):
+    """
+    페이지가 내려받는 모든 자산 (페이지 자신 포함)
+    여러 경로로 참조되면 하나라도 critical이면 critical, 모두 lazy일 때만 lazy
+
+    Returns:
+        {경로: {'kind', 'critical', 'lazy', 'external', 'exists', 'referrers'}}
+    """
+    files = graph['files']
+    assets = {page: {'kind': 'document', 'critical': True, 'lazy': False, 'external': False,
+                     'exists': page in files, 'referrers': []}}
+    queue = [page]
+    while queue:
+        parent = queue.pop(0)
+        for reference in graph['references'].get(parent, []):
+            path = reference['path']
+            critical = assets[parent]['critical'] and reference['critical']
+            lazy = reference['lazy'] or assets[parent]['lazy']
+            asset = assets.get(path)
+            if asset is None:
+                assets[path] = {'kind': reference['kind'], 'critical': critical, 'lazy': lazy,
+                                'external': reference['external'], 'exists': path in files,
+                                'referrers': [parent]}
+                queue.append(path)
+                continue
+            if parent not in asset['referrers']:
+                asset['referrers'].append(parent)
+            asset['lazy'] = asset['lazy'] and lazy
+            # critical로 바뀌면 하위 참조(@import 등)에도 다시 반영
+            if critical and not asset['critical']:
+                asset['critical'] = True
+                queue.append(path)
+    return assets
+
+
+def referenced_paths(graph, kind=None):
+    """그래프 전체에서 참조되는 사이트 경로 집합 (없는 파일 포함, 외부 URL 제외)"""
+    return {
+        reference['path']
+        for references in graph['references'].values()
+        for reference in references
+        if not reference['external'] and (kind is None or reference['kind'] == kind)
+    }
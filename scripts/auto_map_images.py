@@ -1,10 +1,13 @@
 """
 자동으로 누락된 이미지를 탐지하고 매핑하는 스크립트
 """
-import shutil
-import re
 from pathlib import Path
 
+from asset_graph import build_graph, referenced_paths
+from blob_store import BlobStore
+from build_assets import collect_files
+from image_mapping import build_index, load_config, resolve_rule, target_path
+
 # 프로젝트 루트 경로
 project_root = Path(__file__).parent.parent
 other_dir = project_root / "assets" / "images" / "other"
@@ -23,29 +26,8 @@ for dir_path in target_dirs.values():
     dir_path.mkdir(parents=True, exist_ok=True)
 
 # HTML, CSS, JS 파일에서 참조하는 이미지 경로 추출
-required_images = set()
-
-# HTML 파일 스캔
-html_file = project_root / "src" / "html" / "index.html"
-if html_file.exists():
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # src="..." 또는 src='...' 패턴 추출
-        for match in re.finditer(r'src=["\']([^"\']+)["\']', content):
-            path = match.group(1)
-            if path.startswith('/assets/images/'):
-                required_images.add(path[1:])  # 앞의 '/' 제거
-
-# JavaScript 파일 스캔
-js_file = project_root / "src" / "js" / "main.js"
-if js_file.exists():
-    with open(js_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # url(...) 패턴 추출
-        for match in re.finditer(r'url\(([^)]+)\)', content):
-            path = match.group(1).strip('\'"')
-            if path.startswith('/assets/images/'):
-                required_images.add(path[1:])
+# (src/srcset, CSS url(), JS에서 넣는 배경 이미지 등 - asset_graph.py 참조)
+required_images = referenced_paths(build_graph(collect_files(project_root)), kind='image')
 
 print(f"Found {len(required_images)} required image paths in code")
 print("Checking for missing images...\n")
@@ -63,52 +45,44 @@ if not missing_images:
 else:
     print(f"\nFound {len(missing_images)} missing images. Attempting to map from extracted images...\n")
     
-    # extracted 이미지 목록 가져오기
-    extracted_files = list(other_dir.glob('*.png')) + list(other_dir.glob('*.jpg')) + list(other_dir.glob('*.jpeg'))
-    
+    # 추출 이미지 색인 (별칭 포함, 파일명/페이지 번호/내용 해시로 바로 조회)
+    index = build_index(other_dir)
+    store = BlobStore(project_root)
+    # 대체 규칙 (assets/images/image-mapping.json의 "auto" 세트): 타겟 경로 -> 규칙
+    fallback_rules = {
+        Path(rule['target']).with_suffix('').as_posix(): rule
+        for rule in load_config(project_root)['sets']['auto']
+    }
+
     # 매핑 시도
     for missing_path in missing_images:
         # 경로에서 파일명 추출
         filename = Path(missing_path).name
         target_folder = Path(missing_path).parent.name
-        
+        name_without_ext = Path(filename).stem
+
         print(f"Searching for replacement for {filename} in {target_folder} folder...")
-        
-        # 파일명 기반으로 유사한 이미지 찾기
-        found = False
-        
+
         # 1. 파일명과 정확히 일치하는 경우 찾기 (다른 확장자 포함)
-        name_without_ext = Path(filename).stem
-        for ext_file in extracted_files:
-            if Path(ext_file).stem.lower() == name_without_ext.lower():
-                target_path = target_dirs[target_folder] / filename
-                # 확장자 유지
-                if ext_file.suffix.lower() != target_path.suffix.lower():
-                    filename = name_without_ext + ext_file.suffix.lower()
-                    target_path = target_dirs[target_folder] / filename
-                
-                shutil.copy2(ext_file, target_path)
-                print(f"  [OK] Mapped: {ext_file.name} -> {target_folder}/{filename}")
-                found = True
-                break
-        
-        # 2. 페이지 1의 큰 이미지를 hero fallback으로 사용
-        if not found and 'hero-bg-fallback' in filename.lower() and target_folder == 'hero':
-            # page1의 큰 이미지 찾기 (img3, img4, img5 등)
-            for page1_img in sorted(other_dir.glob('page1_img*.png')) + sorted(other_dir.glob('page1_img*.jpg')):
-                # 큰 이미지일 가능성이 높은 것 (번호가 큰 것)
-                if int(re.search(r'img(\d+)', page1_img.name).group(1)) >= 3:
-                    target_path = target_dirs[target_folder] / filename
-                    # JPG로 변환할 필요는 없고, PNG면 그대로 사용
-                    if page1_img.suffix.lower() == '.png' and filename.endswith('.jpg'):
-                        filename = name_without_ext + '.png'
-                        target_path = target_dirs[target_folder] / filename
-                    shutil.copy2(page1_img, target_path)
-                    print(f"  [OK] Mapped: {page1_img.name} -> {target_folder}/{filename}")
-                    found = True
-                    break
-        
-        if not found:
+        source = index['by_stem'].get(name_without_ext.lower())
+
+        # 2. 대체 규칙 (예: 페이지 1의 큰 이미지를 hero fallback으로 사용)
+        if source is None:
+            rule = fallback_rules.get(f"{target_folder}/{name_without_ext}")
+            if rule is not None:
+                source, _, warning = resolve_rule(rule, index)
+                if warning:
+                    print(f"  [WARN] {warning}")
+
+        if source is None:
             print(f"  [FAIL] Could not find replacement for {filename}")
+            continue
+
+        # 확장자는 실제 소스 파일 확장자 유지
+        destination = target_path(target_dirs[target_folder].parent, f"{target_folder}/{filename}", source)
+        method = store.place(index['files'][source], destination, index['hashes'][source])
+        print(f"  [OK] Mapped: {source.name} -> {target_folder}/{destination.name} ({method})")
+
+    print(f"\n[INFO] Placement: {store.summary()}")
 
 print("\n[COMPLETE] Auto-mapping finished!")
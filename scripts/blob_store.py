@@ -0,0 +1,229 @@
+"""
+추출 이미지 내용 주소 저장소
+매핑 스크립트가 추출 이미지(assets/images/other)를 hero/, features/, news/로 복사하면 같은 바이트가
+두 벌씩 생기므로(main-hero.jpeg와 page3_img39_2080x1234.jpeg), 이미지를 내용 해시(BLAKE2) 이름으로
+저장소에 한 번만 두고 사이트 폴더에는 링크로 배치함
+
+배치 방법 (앞에서부터 시도):
+    hardlink - 같은 파일시스템이면 디스크 공간을 쓰지 않고 같은 파일을 가리킴
+    reflink  - FICLONE (Btrfs/XFS 등) 복사 후 수정 시에만 블록이 나뉨
+    copy     - 둘 다 불가능하면 복사
+
+저장소에 넣을 때도 원본을 하드링크하므로 추출 파일, 저장소, 사이트 폴더가 모두 같은 데이터를 공유함.
+하드링크된 파일을 제자리에서 수정하면 다른 이름도 함께 바뀌므로, 이미지를 쓰는 스크립트는
+새 파일로 쓴 뒤 교체해야 함 (optimize_images.py, pdf_catalog.ImageWriter는 교체 방식으로 씀)
+optimize_images.py로 다시 인코딩한 배포 이미지는 저장소와 다른 파일이 되므로, 그 원본의 최적화 결과
+(image-optimization.json에 기록된 해시)와 같은 내용이면 다시 배치하지 않고 그대로 둠
+
+저장소: .build-cache/image-store/<해시 앞 2자리>/<해시>.<확장자> (git에 포함하지 않음)
+
+사용법 (저장소 상태 확인, 사이트 폴더에서 더 이상 쓰지 않는 이미지 정리):
+    python scripts/blob_store.py
+    python scripts/blob_store.py --prune
+"""
+
+import argparse
+import json
+import os
+import shutil
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 등 fcntl이 없는 환경은 reflink 없이 hardlink/copy만 사용
+    fcntl = None
+
+from image_manifest import file_hash
+
+STORE_DIR = ".build-cache/image-store"
+# optimize_images.RECORD_FILE (원본 해시별 최적화 결과 기록)
+OPTIMIZATION_RECORD = "assets/images/image-optimization.json"
+# linux/fs.h의 FICLONE (_IOW(0x94, 9, int)), Python 3.12 미만의 fcntl에는 상수가 없음
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+PLACEMENT_METHODS = ('unchanged', 'optimized', 'hardlink', 'reflink', 'copy')
+
+
+def _reflink(source, target):
+    """FICLONE으로 source를 target에 복제 (지원하지 않으면 OSError)"""
+    if fcntl is None:
+        raise OSError("reflink is not supported on this platform")
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            target.unlink()
+            raise
+
+
+def link_or_copy(source, target):
+    """
+    source를 target에 배치 (hardlink -> reflink -> copy 순서)
+    target이 이미 있으면 지우고 새로 만듦 (기존 파일의 다른 링크는 그대로 유지)
+
+    Returns:
+        사용한 방법 ('hardlink' | 'reflink' | 'copy')
+    """
+    source, target = Path(source), Path(target)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    try:
+        os.link(source, target)
+        return 'hardlink'
+    except OSError:
+        pass
+    try:
+        _reflink(source, target)
+        return 'reflink'
+    except OSError:
+        pass
+    shutil.copyfile(source, target)
+    return 'copy'
+
+
+def load_optimized_outputs(project_root):
+    """
+    optimize_images.py의 최적화 기록에서 원본별 결과 해시 읽기
+
+    Returns:
+        {원본 내용 해시: 최적화 결과 해시} (기록이 없거나 읽을 수 없으면 빈 딕셔너리)
+    """
+    record_path = Path(project_root) / OPTIMIZATION_RECORD
+    if not record_path.exists():
+        return {}
+    try:
+        with open(record_path, 'r', encoding='utf-8') as f:
+            images = json.load(f).get('images', {})
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Ignoring unreadable optimization record {record_path}: {e}")
+        return {}
+    return {digest: entry['output'] for digest, entry in images.items() if entry.get('output')}
+
+
+class BlobStore:
+    """
+    내용 해시로 이미지를 한 번만 저장하고 사이트 폴더에 링크로 배치하는 저장소
+
+    사용 예:
+        store = BlobStore(project_root)
+        method = store.place(extracted_path, project_root / "assets/images/hero/main-hero.jpeg")
+        print(store.stats)  # {'unchanged': 0, 'optimized': 0, 'hardlink': 1, 'reflink': 0, 'copy': 0, ...}
+    """
+
+    def __init__(self, project_root, store_dir=STORE_DIR):
+        self.root = Path(project_root) / store_dir
+        self.optimized = load_optimized_outputs(project_root)
+        self.stats = {method: 0 for method in PLACEMENT_METHODS}
+        self.stats.update({'stored': 0, 'linked_bytes': 0})
+
+    def blob_path(self, digest, suffix):
+        """해시에 해당하는 저장소 경로"""
+        return self.root / digest[:2] / f"{digest}{suffix.lower()}"
+
+    def put(self, source, digest=None):
+        """
+        파일을 저장소에 추가 (이미 있으면 그대로) 하고 저장소 경로 반환
+
+        Args:
+            source: 추가할 파일
+            digest: 이미 알고 있는 내용 해시 (이미지 매니페스트 등, 없으면 계산)
+        """
+        source = Path(source)
+        digest = digest or file_hash(source)
+        blob = self.blob_path(digest, source.suffix)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스와 겹쳐도 깨진 파일이 남지 않도록 임시 이름으로 만든 뒤 교체
+            temp = blob.with_name(blob.name + f".{os.getpid()}.tmp")
+            link_or_copy(source, temp)
+            os.replace(temp, blob)
+            self.stats['stored'] += 1
+        return blob
+
+    def place(self, source, target, digest=None):
+        """
+        source 내용을 저장소에 넣고 target에 링크로 배치
+        target이 이미 같은 파일이거나 source를 optimize_images.py로 다시 인코딩한 결과이면 그대로 둠
+
+        Returns:
+            사용한 방법 ('unchanged' | 'optimized' | 'hardlink' | 'reflink' | 'copy')
+        """
+        digest = digest or file_hash(source)
+        blob = self.put(source, digest)
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        optimized = self.optimized.get(digest)
+        if target.exists() and os.path.samefile(blob, target):
+            method = 'unchanged'
+        elif optimized is not None and target.exists() and file_hash(target) == optimized:
+            method = 'optimized'
+        else:
+            method = link_or_copy(blob, target)
+        self.stats[method] += 1
+        if method in ('unchanged', 'hardlink', 'reflink'):
+            self.stats['linked_bytes'] += blob.stat().st_size
+        return method
+
+    def summary(self):
+        """배치 결과 한 줄 요약"""
+        counts = ", ".join(f"{self.stats[method]} {method}" for method in PLACEMENT_METHODS if self.stats[method])
+        return (f"{counts or 'nothing placed'} | {self.stats['stored']} new blob(s), "
+                f"{self.stats['linked_bytes'] / 1024:.0f} KB shared instead of copied")
+
+    def blobs(self):
+        """저장소의 모든 파일"""
+        if not self.root.exists():
+            return []
+        return sorted(path for path in self.root.glob('*/*') if path.is_file() and not path.name.endswith('.tmp'))
+
+    def prune(self):
+        """
+        저장소 밖에서 링크하지 않는 파일 삭제 (추출 폴더와 사이트 폴더에서 모두 지워진 이미지)
+        reflink/copy로 배치한 파일은 링크 수로 구분할 수 없으므로 다음 배치 때 다시 저장됨
+
+        Returns:
+            (삭제한 파일 수, 바이트 수)
+        """
+        removed = 0
+        removed_bytes = 0
+        for blob in self.blobs():
+            info = blob.stat()
+            if info.st_nlink <= 1:
+                blob.unlink()
+                removed += 1
+                removed_bytes += info.st_size
+        for directory in self.root.glob('*'):
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+        return removed, removed_bytes
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="추출 이미지 내용 주소 저장소 상태 확인/정리")
+    parser.add_argument('--prune', action='store_true',
+                        help="추출 폴더와 사이트 폴더 어디에서도 링크하지 않는 파일 삭제")
+    args = parser.parse_args()
+
+    store = BlobStore(project_root)
+    print(f"Image store: {store.root}")
+    print("=" * 60)
+
+    blobs = store.blobs()
+    total = sum(blob.stat().st_size for blob in blobs)
+    shared = [blob for blob in blobs if blob.stat().st_nlink > 1]
+    # 저장소 밖의 링크 수만큼 복사본을 만들지 않은 것
+    saved = sum(blob.stat().st_size * (blob.stat().st_nlink - 2) for blob in shared if blob.stat().st_nlink > 2)
+    print(f"[INFO] {len(blobs)} blob(s), {total / 1024:.0f} KB")
+    print(f"[INFO] {len(shared)} blob(s) linked from the working tree, "
+          f"{saved / 1024:.0f} KB of duplicate copies avoided")
+
+    if args.prune:
+        removed, removed_bytes = store.prune()
+        print(f"[DONE] Pruned {removed} unreferenced blob(s) ({removed_bytes / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+정적 자산 빌드 스크립트
+assets/와 src/를 dist/로 복사하면서 각 파일 이름에 내용 해시를 붙이고
+(news-001.jpeg -> news-001.3f9a2c1d.jpeg), HTML/CSS/JS의 참조 경로를 해시된 이름으로 바꿈
+
+vercel.json은 /assets, /src/css, /src/js를 1년간 immutable로 캐시하므로,
+내용이 바뀌면 URL도 바뀌어야 오래된 파일이 캐시에 남지 않음.
+HTML은 고정 URL로 접근하므로 이름을 바꾸지 않음
+
+HTML이 불러오는 로컬 CSS는 critical_css.py로 하나의 번들(<페이지>.bundle.css)로 합치고,
+첫 화면에 필요한 규칙만 <head>에 인라인함 (번들은 비동기 로드).
+번들에서는 HTML/JS가 쓰지 않는 선택자를 purge_css.py로 제거
+
+HTML의 <img>에는 image_attributes.py로 width/height, loading/decoding 속성과
+플레이스홀더 배경을 넣음 (원본 HTML은 그대로 두고 dist/의 HTML에만 적용)
+
+빌드 결과의 페이지와 자산으로 service_worker.py가 precache 목록을 가진 dist/sw.js를 만듦
+
+출력:
+    dist/<원래 경로의 해시된 파일>
+    dist/asset-manifest.json  ({"/assets/images/news/news-001.jpeg": "/assets/images/news/news-001.3f9a2c1d.jpeg", ...})
+    dist/sw.js                (서비스 워커, 이름은 고정)
+
+사용법:
+    python scripts/build_assets.py
+    python scripts/build_assets.py -o dist
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path, PurePosixPath
+
+from asset_graph import URL_PATTERN, find_references, resolve_reference
+from critical_css import inline_critical_css
+from purge_css import collect_usage, purge_rules
+from image_attributes import (PLACEHOLDER_CACHE, inject_image_attributes, load_placeholders,
+                              new_stats, save_placeholders)
+from image_manifest import content_hash
+from service_worker import generate_service_worker
+
+# 빌드에 포함하는 최상위 디렉토리
+SOURCE_DIRS = ('assets', 'src')
+# 추출 작업용 폴더와 문서/매니페스트는 배포하지 않음
+# (반응형 파생본은 git에 포함하지 않는 로컬 생성물이므로 빌드 결과가 작업 환경마다 달라지지 않도록 제외)
+EXCLUDED_DIRS = ('assets/images/other', 'assets/fonts/source', 'assets/images/responsive')
+EXCLUDED_NAMES = ('README.md',)
+EXCLUDED_SUFFIXES = ('.json', '.md')
+
+# 참조 경로를 해시된 이름으로 바꾸는 텍스트 파일
+TEXT_SUFFIXES = ('.html', '.css', '.js')
+# 이름을 바꾸지 않는 파일 (고정 URL로 접근)
+UNHASHED_SUFFIXES = ('.html',)
+
+HASH_LENGTH = 8
+MANIFEST_NAME = "asset-manifest.json"
+
+def collect_files(project_root):
+    """빌드할 파일 목록 {사이트 경로(assets/...): 파일 경로}"""
+    project_root = Path(project_root)
+    files = {}
+    for top in SOURCE_DIRS:
+        for path in sorted((project_root / top).rglob('*')):
+            if not path.is_file():
+                continue
+            site_path = path.relative_to(project_root).as_posix()
+            if any(site_path == excluded or site_path.startswith(excluded + '/') for excluded in EXCLUDED_DIRS):
+                continue
+            if path.name in EXCLUDED_NAMES or path.suffix.lower() in EXCLUDED_SUFFIXES:
+                continue
+            files[site_path] = path
+    return files
+
+
+def hashed_name(site_path, data):
+    """내용 해시를 붙인 사이트 경로 (assets/a.png -> assets/a.<해시>.png)"""
+    path = PurePosixPath(site_path)
+    if path.suffix.lower() in UNHASHED_SUFFIXES:
+        return site_path
+    digest = content_hash(data)[:HASH_LENGTH]
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def rewrite_references(text, site_path, renamed):
+    """텍스트의 참조 경로를 해시된 이름으로 바꿈 (원래 표기 방식 - 절대/상대 - 유지)"""
+    def replace(match):
+        url = match.group(0)
+        resolved, suffix = resolve_reference(url, site_path)
+        target = renamed.get(resolved)
+        if target is None or target == resolved:
+            return url
+        if url.startswith('/'):
+            return '/' + target + suffix
+        # 상대 경로는 파일 이름 부분만 교체 (디렉토리는 그대로이므로)
+        path = url[:len(url) - len(suffix)] if suffix else url
+        return path[:path.rfind('/') + 1] + PurePosixPath(target).name + suffix
+
+    return URL_PATTERN.sub(replace, text)
+
+
+def bundle_stylesheets(files, purge=True):
+    """
+    HTML마다 critical CSS를 인라인하고 CSS 번들을 빌드 대상에 추가
+    (purge=True면 모든 페이지/JS에서 쓰지 않는 선택자를 번들에서 제거)
+
+    Returns:
+        {사이트 경로: 텍스트} 바뀐 HTML과 새로 만든 번들 (files에도 번들 경로 추가)
+    """
+    sources = {}
+
+    def read_text(site_path):
+        if site_path in sources:
+            return sources[site_path]
+        return files[site_path].read_text(encoding='utf-8')
+
+    usage = collect_usage(files) if purge else None
+    purge_unused = (lambda rules: purge_rules(rules, usage)) if purge else None
+
+    for site_path in sorted(files):
+        if PurePosixPath(site_path).suffix.lower() != '.html':
+            continue
+        result = inline_critical_css(read_text(site_path), site_path, files, read_text, purge=purge_unused)
+        if result is None:
+            continue
+        html, target, bundle, stats = result
+        sources[site_path] = html
+        sources[target] = bundle
+        # 디스크에 없는 생성 파일 (내용은 sources에서 읽음)
+        files[target] = files[stats['stylesheets'][0]].with_name(PurePosixPath(target).name)
+    return sources
+
+
+def build_order(files, sources=None):
+    """
+    참조되는 파일이 먼저 오도록 정렬 (이미지 -> CSS -> HTML 순)
+    텍스트 파일은 참조 경로를 바꾼 뒤의 내용으로 해시해야 하므로 의존 순서가 필요
+    sources에 있는 파일은 디스크 대신 그 내용을 사용 (빌드 중 변환/생성된 파일)
+    """
+    sources = sources or {}
+    texts = {}
+    dependencies = {}
+    for site_path, path in files.items():
+        if path.suffix.lower() in TEXT_SUFFIXES:
+            if site_path in sources:
+                texts[site_path] = sources[site_path]
+            else:
+                texts[site_path] = path.read_text(encoding='utf-8')
+            dependencies[site_path] = find_references(texts[site_path], site_path, files) - {site_path}
+        else:
+            dependencies[site_path] = set()
+
+    order = []
+    state = {}
+
+    def visit(site_path, chain):
+        if state.get(site_path) == 'done':
+            return
+        if state.get(site_path) == 'visiting':
+            raise ValueError("circular asset reference: " + " -> ".join(chain + [site_path]))
+        state[site_path] = 'visiting'
+        for dependency in sorted(dependencies[site_path]):
+            visit(dependency, chain + [site_path])
+        state[site_path] = 'done'
+        order.append(site_path)
+
+    for site_path in sorted(files):
+        visit(site_path, [])
+    return order, texts
+
+
+def build_assets(project_root, output_dir, critical_css=True, purge=True, service_worker=True):
+    """
+    해시된 자산을 output_dir에 빌드
+    (critical_css=False면 CSS를 번들로 합치지 않음, purge=False면 번들에서 규칙을 제거하지 않음,
+    service_worker=False면 sw.js를 만들지 않음)
+
+    Returns:
+        ({원래 사이트 경로: 해시된 사이트 경로} 매니페스트 (앞에 / 포함), <img> 속성 주입 통계,
+         service_worker.generate_service_worker() 결과 또는 None)
+    """
+    project_root = Path(project_root)
+    output_dir = Path(output_dir)
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+
+    files = collect_files(project_root)
+    sources = bundle_stylesheets(files, purge=purge) if critical_css else {}
+    order, texts = build_order(files, sources)
+    renamed = {}
+
+    def resolve_image(url, site_path):
+        resolved, _ = resolve_reference(url, site_path)
+        return files.get(resolved)
+
+    placeholder_path = project_root / PLACEHOLDER_CACHE
+    placeholders = load_placeholders(placeholder_path)
+    image_stats = new_stats()
+    for site_path in order:
+        if site_path in texts:
+            text = texts[site_path]
+            # 해시된 이름으로 바꾸기 전에 원래 경로로 이미지 파일을 찾음
+            if PurePosixPath(site_path).suffix.lower() == '.html':
+                text = inject_image_attributes(text, site_path, resolve_image, placeholders, image_stats)
+            data = rewrite_references(text, site_path, renamed).encode('utf-8')
+        else:
+            data = files[site_path].read_bytes()
+        renamed[site_path] = hashed_name(site_path, data)
+
+        target = output_dir / renamed[site_path]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+
+    manifest = {
+        '/' + site_path: '/' + renamed[site_path]
+        for site_path in sorted(renamed)
+        if renamed[site_path] != site_path
+    }
+    with open(output_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+    # 새로 계산한 플레이스홀더는 캐시에 저장 (Pillow가 없는 배포 빌드에서 재사용)
+    if image_stats['computed']:
+        save_placeholders(placeholder_path, placeholders)
+
+    worker = None
+    if service_worker:
+        worker = generate_service_worker(output_dir, project_root / "vercel.json")
+    return manifest, image_stats, worker
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="내용 해시 파일명으로 정적 자산 빌드")
+    parser.add_argument('-o', '--output', default=project_root / "dist", type=Path,
+                        help="빌드 결과 디렉토리 (기본값: dist)")
+    parser.add_argument('--no-critical-css', action='store_true',
+                        help="CSS 번들/critical CSS 인라인 없이 원래 <link>를 유지")
+    parser.add_argument('--no-purge', action='store_true',
+                        help="CSS 번들에서 사용하지 않는 규칙을 제거하지 않음")
+    parser.add_argument('--no-service-worker', action='store_true',
+                        help="서비스 워커(sw.js)를 만들지 않음")
+    args = parser.parse_args()
+
+    print(f"Building assets into {args.output}")
+    print("=" * 60)
+    try:
+        manifest, image_stats, worker = build_assets(project_root, args.output,
+                                                     critical_css=not args.no_critical_css,
+                                                     purge=not args.no_purge,
+                                                     service_worker=not args.no_service_worker)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    for original, hashed in manifest.items():
+        print(f"  [OK] {original} -> {PurePosixPath(hashed).name}")
+
+    for url in image_stats['missing']:
+        print(f"  [WARN] Image not found: {url}")
+    if image_stats['uncached']:
+        print(f"  [WARN] {image_stats['uncached']} image(s) without cached placeholder "
+              f"(run scripts/image_attributes.py with Pillow installed)")
+
+    print("\n" + "=" * 60)
+    print(f"[DONE] {len(manifest)} files fingerprinted")
+    print(f"[INFO] <img>: {image_stats['sized']}/{image_stats['images']} sized, "
+          f"{image_stats['lazy']} lazy, {image_stats['placeholders']} placeholders")
+    print(f"[INFO] Manifest: {args.output / MANIFEST_NAME}")
+    if worker is not None:
+        print(f"[INFO] Service worker: {worker['path']} (version {worker['version']}, "
+              f"{len(worker['urls'])} precached URLs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Pretendard 폰트 서브셋 빌드 스크립트
+CDN의 pretendard.min.css 전체를 받는 대신, 페이지에서 실제로 쓰는 글자와 굵기만 남긴
+WOFF2 파일을 만들어 직접 호스팅
+
+1. src/html, src/js, src/css에서 화면에 나오는 글자 수집
+   (HTML 텍스트와 alt/title/aria-label 등 속성, JS 문자열, CSS content)
+2. CSS에서 실제로 사용하는 font-weight 수집 (var(--font-weight-*) 포함)
+3. 굵기별로 라틴/한글 두 조각의 WOFF2 서브셋 생성 (unicode-range로 필요한 조각만 내려받음)
+4. src/css/fonts.css에 @font-face 작성, HTML의 CDN <link>를 로컬 CSS와 preload로 교체
+
+원본 폰트는 Pretendard 배포본(https://github.com/orioncactus/pretendard/releases)의
+public/static/Pretendard-<굵기>.otf 파일을 assets/fonts/source/에 넣어두면 됨 (저장소에는 포함하지 않음)
+
+사용법:
+    python scripts/build_fonts.py
+    python scripts/build_fonts.py --source ~/Downloads/Pretendard-1.3.9/public/static --force
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    import brotli  # noqa: F401  (WOFF2 압축에 필요)
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install fonttools brotli")
+    sys.exit(1)
+
+FONT_FAMILY = "Pretendard"
+SOURCE_EXTENSIONS = ('.otf', '.ttf', '.woff2', '.woff')
+WEIGHT_NAMES = {
+    100: 'Thin',
+    200: 'ExtraLight',
+    300: 'Light',
+    400: 'Regular',
+    500: 'Medium',
+    600: 'SemiBold',
+    700: 'Bold',
+    800: 'ExtraBold',
+    900: 'Black',
+}
+KEYWORD_WEIGHTS = {'normal': 400, 'bold': 700}
+# 본문 기본 굵기는 CSS에 명시하지 않아도 항상 포함
+DEFAULT_WEIGHT = 400
+
+# 숫자, 날짜 등 나중에 동적으로 들어올 수 있는 글자는 항상 포함
+ALWAYS_INCLUDED = set(range(0x20, 0x7F))
+# 텍스트로 보이는 HTML 속성
+TEXT_ATTRIBUTES = ('alt', 'title', 'placeholder', 'aria-label', 'value')
+# 서브셋 조각: (이름, 해당 여부 판단 함수)
+# 라틴 조각은 모든 페이지에서 쓰이고, 한글 조각은 한글이 있을 때만 내려받음
+CHUNKS = (
+    ('latin', lambda codepoint: codepoint < 0x1100 or 0x2000 <= codepoint < 0x2C00),
+    ('korean', lambda codepoint: not (codepoint < 0x1100 or 0x2000 <= codepoint < 0x2C00)),
+)
+# 첫 화면에서 바로 쓰이는 조각은 preload
+PRELOAD_CHUNKS = ((DEFAULT_WEIGHT, 'korean'),)
+
+CDN_LINK_PATTERN = re.compile(r'[ \t]*<link[^>]*cdn\.jsdelivr\.net/gh/orioncactus/pretendard[^>]*>[ \t]*\n?')
+JS_STRING_PATTERN = re.compile(r'''(['"`])((?:\\.|(?!\1)[^\\\n])*)\1''')
+CSS_CONTENT_PATTERN = re.compile(r'''(?<![-\w])content\s*:\s*(['"])(.*?)\1''')
+CSS_VARIABLE_PATTERN = re.compile(r'(--[\w-]+)\s*:\s*([^;}]+)')
+CSS_WEIGHT_PATTERN = re.compile(r'(?<![-\w])font-weight\s*:\s*([^;}]+)')
+CSS_SHORTHAND_PATTERN = re.compile(r'(?<![-\w])font\s*:\s*([^;}]+)')
+
+SUBSET_MANIFEST = "font-subset.json"
+
+
+class TextCollector(HTMLParser):
+    """HTML에서 화면에 표시되는 텍스트 수집 (주석, 스타일 제외)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts = []
+        self.scripts = []
+        self.skip = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self.skip = tag
+        for name, value in attrs:
+            if name in TEXT_ATTRIBUTES and value:
+                self.texts.append(value)
+
+    def handle_endtag(self, tag):
+        if tag == self.skip:
+            self.skip = None
+
+    def handle_data(self, data):
+        if self.skip == 'script':
+            self.scripts.append(data)
+        elif self.skip is None:
+            self.texts.append(data)
+
+
+def collect_codepoints(src_root):
+    """페이지에서 사용하는 글자의 코드포인트 집합"""
+    src_root = Path(src_root)
+    texts = []
+    for html_file in sorted(src_root.rglob('*.html')):
+        collector = TextCollector()
+        collector.feed(html_file.read_text(encoding='utf-8'))
+        texts.extend(collector.texts)
+        texts.extend(_js_strings('\n'.join(collector.scripts)))
+    for js_file in sorted(src_root.rglob('*.js')):
+        texts.extend(_js_strings(js_file.read_text(encoding='utf-8')))
+    for css_file in sorted(src_root.rglob('*.css')):
+        texts.extend(match.group(2) for match in CSS_CONTENT_PATTERN.finditer(css_file.read_text(encoding='utf-8')))
+
+    codepoints = set(ALWAYS_INCLUDED)
+    for text in texts:
+        codepoints.update(ord(char) for char in text if char.isprintable())
+    return codepoints
+
+
+def _js_strings(source):
+    """JS 소스의 문자열 리터럴 (주석의 글자는 포함하지 않음)"""
+    return [match.group(2) for match in JS_STRING_PATTERN.finditer(source)]
+
+
+def collect_weights(src_root):
+    """CSS에서 실제로 사용하는 font-weight 값 집합"""
+    variables = {}
+    declarations = []
+    for css_file in sorted(Path(src_root).rglob('*.css')):
+        css = css_file.read_text(encoding='utf-8')
+        for name, value in CSS_VARIABLE_PATTERN.findall(css):
+            variables[name] = value.strip()
+        declarations.extend(CSS_WEIGHT_PATTERN.findall(css))
+        # font 단축 속성의 굵기 (예: font: 700 1rem/1.5 var(--font-family))
+        for value in CSS_SHORTHAND_PATTERN.findall(css):
+            declarations.extend(token for token in value.split() if token.isdigit() or token in KEYWORD_WEIGHTS)
+
+    weights = {DEFAULT_WEIGHT}
+    for value in declarations:
+        value = value.replace('!important', '').strip()
+        # var(--x) 참조는 정의된 값으로 치환 (중첩 참조 포함)
+        for _ in range(10):
+            match = re.fullmatch(r'var\(\s*(--[\w-]+)\s*(?:,\s*([^)]+))?\)', value)
+            if not match:
+                break
+            value = variables.get(match.group(1), match.group(2) or '').strip()
+        if value in KEYWORD_WEIGHTS:
+            weights.add(KEYWORD_WEIGHTS[value])
+        elif value.isdigit() and int(value) in WEIGHT_NAMES:
+            weights.add(int(value))
+    return weights
+
+
+def find_source_font(source_dir, weight):
+    """굵기에 해당하는 원본 폰트 파일 (Pretendard-Bold.otf 등)"""
+    for ext in SOURCE_EXTENSIONS:
+        path = Path(source_dir) / f"{FONT_FAMILY}-{WEIGHT_NAMES[weight]}{ext}"
+        if path.exists():
+            return path
+    return None
+
+
+def unicode_range(codepoints):
+    """코드포인트 집합을 unicode-range 값으로 변환 (연속 구간은 U+AC00-AC0F 형태)"""
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ", ".join(
+        f"U+{first:X}" if first == last else f"U+{first:X}-{last:X}"
+        for first, last in ranges
+    )
+
+
+def subset_font(source, output, codepoints):
+    """원본 폰트에서 codepoints만 남긴 WOFF2 생성. 실제로 포함된 코드포인트 반환"""
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['kern', 'liga', 'calt', 'ccmp', 'locl', 'mark', 'mkmk',
+                               'ljmo', 'vjmo', 'tjmo']
+    options.hinting = False
+    options.desubroutinize = True
+    options.name_IDs = [0, 1, 2, 3, 4, 5, 6]
+
+    font = TTFont(source)
+    # 원본 폰트에 없는 글자는 unicode-range에서도 빼서 시스템 폰트로 대체되도록 함
+    supported = set(font.getBestCmap()) & set(codepoints)
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(unicodes=sorted(supported))
+    subsetter.subset(font)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    font.flavor = 'woff2'
+    font.save(output)
+    font.close()
+    return supported
+
+
+def font_face(weight, chunk, url, codepoints):
+    """@font-face 규칙 문자열"""
+    return (
+        "@font-face {\n"
+        f"  font-family: '{FONT_FAMILY}';\n"
+        "  font-style: normal;\n"
+        f"  font-weight: {weight};\n"
+        "  font-display: swap;\n"
+        f"  src: url({url}) format('woff2');\n"
+        f"  unicode-range: {unicode_range(codepoints)};\n"
+        "}\n"
+    )
+
+
+def replace_cdn_link(html, fonts_css_url, preload_urls):
+    """HTML의 Pretendard CDN <link>를 로컬 fonts.css와 폰트 preload로 교체"""
+    match = CDN_LINK_PATTERN.search(html)
+    if match is None:
+        return html
+    indent = re.match(r'[ \t]*', match.group(0)).group(0)
+    lines = [
+        f'{indent}<link rel="preload" as="font" type="font/woff2" crossorigin href="{url}">'
+        for url in preload_urls
+    ]
+    lines.append(f'{indent}<link rel="stylesheet" href="{fonts_css_url}">')
+    return html[:match.start()] + "\n".join(lines) + "\n" + html[match.end():]
+
+
+def _fingerprint(codepoints, weights, sources):
+    """서브셋 재생성 여부를 판단하는 입력 지문 (글자, 굵기, 원본 폰트 내용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(sorted(codepoints)).encode())
+    digest.update(repr(sorted(weights)).encode())
+    for weight in sorted(sources):
+        digest.update(Path(sources[weight]).read_bytes())
+    return digest.hexdigest()
+
+
+def build_fonts(project_root, source_dir, force=False):
+    """
+    폰트 서브셋 빌드
+
+    Returns:
+        생성한(또는 최신 상태인) 폰트 파일 목록. 원본 폰트가 없으면 None
+    """
+    project_root = Path(project_root)
+    src_root = project_root / "src"
+    output_dir = project_root / "assets" / "fonts" / "pretendard"
+    fonts_css = src_root / "css" / "fonts.css"
+
+    codepoints = collect_codepoints(src_root)
+    weights = collect_weights(src_root)
+    print(f"[INFO] {len(codepoints)} glyphs used, weights: {', '.join(str(w) for w in sorted(weights))}")
+
+    sources = {}
+    for weight in sorted(weights):
+        source = find_source_font(source_dir, weight)
+        if source is None:
+            print(f"[ERROR] Source font not found: {source_dir}/{FONT_FAMILY}-{WEIGHT_NAMES[weight]}.otf")
+            return None
+        sources[weight] = source
+
+    manifest_path = output_dir / SUBSET_MANIFEST
+    fingerprint = _fingerprint(codepoints, weights, sources)
+    if not force and manifest_path.exists() and fonts_css.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        if previous.get('fingerprint') == fingerprint and all(
+            (output_dir / name).exists() for name in previous['files']
+        ):
+            print("[SKIP] Font subsets are up to date")
+            return previous['files']
+
+    # 이전 빌드의 서브셋 정리 (굵기가 빠졌을 수 있음)
+    if output_dir.exists():
+        for old_file in output_dir.glob('*.woff2'):
+            old_file.unlink()
+
+    rules = ["/* 자동 생성 파일 - scripts/build_fonts.py로 다시 생성하세요 */\n"]
+    files = []
+    preload_urls = []
+    for weight in sorted(weights):
+        for chunk, belongs in CHUNKS:
+            chunk_codepoints = {codepoint for codepoint in codepoints if belongs(codepoint)}
+            if not chunk_codepoints:
+                continue
+            filename = f"pretendard-{weight}-{chunk}.woff2"
+            output = output_dir / filename
+            supported = subset_font(sources[weight], output, chunk_codepoints)
+            if not supported:
+                output.unlink()
+                continue
+
+            url = "/" + output.relative_to(project_root).as_posix()
+            rules.append(font_face(weight, chunk, url, supported))
+            files.append(filename)
+            if (weight, chunk) in PRELOAD_CHUNKS:
+                preload_urls.append(url)
+
+            original_size = sources[weight].stat().st_size
+            print(f"  [OK] {filename}: {len(supported)} glyphs, "
+                  f"{output.stat().st_size / 1024:.1f} KB (source {original_size / 1024:.0f} KB)")
+            missing = len(chunk_codepoints) - len(supported)
+            if missing and chunk != 'latin':
+                print(f"  [WARN] {missing} used characters are not in {sources[weight].name}")
+
+    fonts_css.write_text("\n".join(rules), encoding='utf-8')
+    print(f"  [OK] {fonts_css.relative_to(project_root)}")
+
+    fonts_css_url = "/" + fonts_css.relative_to(project_root).as_posix()
+    for html_file in sorted(src_root.rglob('*.html')):
+        html = html_file.read_text(encoding='utf-8')
+        updated = replace_cdn_link(html, fonts_css_url, preload_urls)
+        if updated != html:
+            html_file.write_text(updated, encoding='utf-8')
+            print(f"  [OK] {html_file.relative_to(project_root)}: CDN link replaced with {fonts_css_url}")
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint, 'files': files}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return files
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="Pretendard 폰트 서브셋 빌드")
+    parser.add_argument('-s', '--source', default=project_root / "assets" / "fonts" / "source",
+                        type=Path, help="Pretendard-<굵기>.otf 원본 폰트 폴더")
+    parser.add_argument('--force', action='store_true', help="최신 상태여도 다시 생성")
+    args = parser.parse_args()
+
+    print("Building Pretendard font subsets...")
+    print("=" * 60)
+    files = build_fonts(project_root, args.source, force=args.force)
+    if files is None:
+        print("\nPretendard 배포본의 public/static/Pretendard-<굵기>.otf 파일을 원본 폴더에 넣어주세요:")
+        print("https://github.com/orioncactus/pretendard/releases")
+        sys.exit(1)
+
+    print("\n" + "=" * 60)
+    print(f"[DONE] {len(files)} font files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+반응형 이미지 파생본 생성 스크립트
+매핑된 원본 이미지(hero, features, news)를 사이트 브레이크포인트(variables.css의
+768/1024px, 데스크톱 1920px) 너비로 줄여 WebP/AVIF로 저장하고,
+srcset에 바로 넣을 수 있는 메타데이터를 매니페스트로 기록
+
+원본 내용(BLAKE2 해시)과 변환 설정이 그대로이고 파생본이 모두 있으면 다시 만들지 않음
+
+출력:
+    assets/images/responsive/<폴더>/<이름>-<너비>.<webp|avif>
+    assets/images/responsive/responsive-manifest.json
+
+사용법:
+    python scripts/build_responsive_images.py
+    python scripts/build_responsive_images.py --workers 4 --force
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install Pillow")
+    sys.exit(1)
+
+from image_manifest import file_hash
+
+# 변환 대상 폴더 (map_mockups_only.py가 채우는 폴더)
+SOURCE_FOLDERS = ('hero', 'features', 'news')
+# 같은 이름의 원본이 여러 확장자로 있으면 앞쪽 확장자를 사용 (index.html은 .jpeg 참조)
+SOURCE_EXTENSIONS = ('.jpeg', '.jpg', '.png')
+
+# variables.css 브레이크포인트 (모바일 768, 태블릿 1024) + 데스크톱 최대 너비
+BREAKPOINT_WIDTHS = (768, 1024, 1920)
+FORMAT_SETTINGS = {
+    'avif': {'quality': 55},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+RESPONSIVE_DIR = "responsive"
+MANIFEST_NAME = "responsive-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def find_sources(images_root):
+    """변환할 원본 이미지 목록 (폴더별, 이름별로 하나씩)"""
+    sources = []
+    for folder in SOURCE_FOLDERS:
+        folder_path = Path(images_root) / folder
+        if not folder_path.exists():
+            continue
+        by_stem = {}
+        for path in sorted(folder_path.iterdir()):
+            ext = path.suffix.lower()
+            if ext not in SOURCE_EXTENSIONS:
+                continue
+            current = by_stem.get(path.stem)
+            if current is None or SOURCE_EXTENSIONS.index(ext) < SOURCE_EXTENSIONS.index(current.suffix.lower()):
+                by_stem[path.stem] = path
+        sources.extend(by_stem[stem] for stem in sorted(by_stem))
+    return sources
+
+
+def available_formats():
+    """현재 Pillow 빌드에서 저장 가능한 파생본 형식"""
+    formats = []
+    for fmt in FORMAT_SETTINGS:
+        if features.check(fmt):
+            formats.append(fmt)
+        else:
+            print(f"[WARN] Pillow has no {fmt.upper()} support, skipping {fmt} variants")
+    return formats
+
+
+def target_widths(source_width):
+    """원본보다 크게 늘리지 않도록 브레이크포인트 너비를 원본 너비로 제한"""
+    return sorted({min(width, source_width) for width in BREAKPOINT_WIDTHS})
+
+
+def variant_settings(formats):
+    """파생본 재생성 여부를 판단하는 변환 설정"""
+    return {
+        'widths': list(BREAKPOINT_WIDTHS),
+        'formats': {fmt: FORMAT_SETTINGS[fmt] for fmt in formats},
+    }
+
+
+def public_path(path, project_root):
+    """사이트에서 사용하는 절대 경로 (/assets/...)"""
+    return '/' + Path(path).relative_to(project_root).as_posix()
+
+
+def build_variants(source, output_dir, formats, digest):
+    """
+    원본 하나의 파생본 생성 (프로세스 풀 워커)
+    원본은 한 번만 디코딩하고, 큰 너비부터 차례로 줄여 나가며 저장
+
+    Returns:
+        매니페스트 항목 딕셔너리
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source) as image:
+        image.load()
+        source_width, source_height = image.size
+        # 투명도가 없는 이미지는 RGB로 변환 (팔레트/CMYK 원본 대응)
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        current = image.convert('RGBA' if has_alpha else 'RGB')
+
+    variants = {fmt: [] for fmt in formats}
+    for width in sorted(target_widths(source_width), reverse=True):
+        height = max(1, round(source_height * width / source_width))
+        if current.size != (width, height):
+            current = current.resize((width, height), Image.LANCZOS)
+        for fmt in formats:
+            target = output_dir / f"{Path(source).stem}-{width}.{fmt}"
+            current.save(target, fmt.upper(), **FORMAT_SETTINGS[fmt])
+            variants[fmt].append({
+                'file': target.name,
+                'width': width,
+                'height': height,
+                'size': target.stat().st_size,
+            })
+
+    for fmt in formats:
+        variants[fmt].sort(key=lambda variant: variant['width'])
+
+    return {
+        'hash': digest,
+        'width': source_width,
+        'height': source_height,
+        'size': Path(source).stat().st_size,
+        'variants': variants,
+    }
+
+
+def is_up_to_date(entry, digest, settings, output_dir):
+    """원본 내용과 설정이 같고 파생본이 모두 디스크에 있는지 확인"""
+    if entry is None or entry.get('hash') != digest or entry.get('settings') != settings:
+        return False
+    return all(
+        (Path(output_dir) / variant['file']).exists()
+        for variants in entry['variants'].values()
+        for variant in variants
+    )
+
+
+def srcset(entry, fmt, base_url):
+    """매니페스트 항목의 srcset 문자열 ("/assets/... 768w, ...")"""
+    return ", ".join(
+        f"{base_url}/{variant['file']} {variant['width']}w"
+        for variant in entry['variants'].get(fmt, [])
+    )
+
+
+def load_manifest(manifest_path):
+    """파생본 매니페스트 읽기 (없거나 버전이 다르면 빈 매니페스트)"""
+    manifest_path = Path(manifest_path)
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable manifest {manifest_path}: {e}")
+    return {'version': MANIFEST_VERSION, 'images': {}}
+
+
+def save_manifest(manifest_path, manifest):
+    """파생본 매니페스트 저장"""
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def remove_stale_variants(old_entry, output_dir, new_entry=None):
+    """이전 실행에서 만들었지만 이번에 만들지 않은 파생본 삭제"""
+    if old_entry is None:
+        return
+    kept = set()
+    if new_entry is not None:
+        kept = {variant['file'] for variants in new_entry['variants'].values() for variant in variants}
+    for variants in old_entry['variants'].values():
+        for variant in variants:
+            path = Path(output_dir) / variant['file']
+            if variant['file'] not in kept and path.exists():
+                path.unlink()
+
+
+def build_responsive_images(project_root, workers=None, force=False):
+    """
+    매핑된 이미지의 반응형 파생본 생성
+
+    Returns:
+        갱신된 매니페스트
+    """
+    project_root = Path(project_root)
+    images_root = project_root / "assets" / "images"
+    responsive_root = images_root / RESPONSIVE_DIR
+    responsive_root.mkdir(parents=True, exist_ok=True)
+    manifest_path = responsive_root / MANIFEST_NAME
+
+    formats = available_formats()
+    if not formats:
+        print("[ERROR] No supported output format (WebP/AVIF) available")
+        return None
+    settings = variant_settings(formats)
+
+    manifest = load_manifest(manifest_path)
+    previous = manifest['images']
+    images = {}
+    jobs = []
+    for source in find_sources(images_root):
+        key = source.relative_to(project_root).as_posix()
+        output_dir = responsive_root / source.parent.name
+        digest = file_hash(source)
+        if not force and is_up_to_date(previous.get(key), digest, settings, output_dir):
+            images[key] = previous[key]
+            print(f"  [SKIP] {key} (up to date)")
+            continue
+        jobs.append((key, source, output_dir, digest))
+
+    start = time.perf_counter()
+    if jobs:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (key, output_dir, executor.submit(build_variants, source, output_dir, formats, digest))
+                for key, source, output_dir, digest in jobs
+            ]
+            for key, output_dir, future in futures:
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    print(f"  [FAIL] {key}: {e}")
+                    continue
+                # 너비 목록/형식이 바뀌어 더 이상 만들지 않는 파생본은 정리
+                remove_stale_variants(previous.get(key), output_dir, entry)
+                entry['settings'] = settings
+                base_url = public_path(output_dir, project_root)
+                entry['srcset'] = {fmt: srcset(entry, fmt, base_url) for fmt in formats}
+                images[key] = entry
+
+                sizes = ", ".join(
+                    f"{fmt} {sum(variant['size'] for variant in entry['variants'][fmt]) / 1024:.0f} KB"
+                    for fmt in formats
+                )
+                widths = "/".join(str(variant['width']) for variant in entry['variants'][formats[0]])
+                print(f"  [OK] {key} ({entry['width']}x{entry['height']}, {entry['size'] / 1024:.0f} KB) "
+                      f"-> {widths}w | {sizes}")
+
+    # 원본이 사라진 항목의 파생본 삭제
+    for key, entry in previous.items():
+        if key not in images and not (project_root / key).exists():
+            remove_stale_variants(entry, responsive_root / Path(key).parent.name)
+            print(f"  [DELETED] variants of {key}")
+
+    manifest['images'] = images
+    save_manifest(manifest_path, manifest)
+
+    elapsed = time.perf_counter() - start
+    if jobs:
+        print(f"\n[INFO] Built {len(jobs)} source(s) in {elapsed:.2f}s ({workers} workers)")
+    return manifest
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="반응형 이미지 파생본(WebP/AVIF) 생성")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="사용할 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument('--force', action='store_true',
+                        help="최신 상태인 파생본도 다시 생성")
+    args = parser.parse_args()
+
+    print("Building responsive image variants...")
+    print("=" * 60)
+    manifest = build_responsive_images(project_root, workers=args.workers, force=args.force)
+    if manifest is None:
+        sys.exit(1)
+
+    print("\n" + "=" * 60)
+    print(f"[DONE] {len(manifest['images'])} images in manifest")
+    print(f"[INFO] Manifest: {project_root / 'assets' / 'images' / RESPONSIVE_DIR / MANIFEST_NAME}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+페이지 용량/요청 수 예산 검사
+자산 참조 그래프(asset_graph.py)로 페이지별 전체 전송량, 첫 로드 전송량(지연 로딩 제외),
+critical path 전송량과 요청 수를 계산하고 performance-budget.json의 예산과 비교
+
+배포되는 상태를 측정하기 위해 build_assets.py로 임시 디렉토리에 빌드한 결과를 검사함
+(<img> 지연 로딩 속성 주입 포함). 텍스트 자산은 gzip(6단계) 압축 크기를 전송량으로 사용.
+마지막으로 통과한 검사 결과(.build-cache/budget-report.json)와 비교해 추가/삭제/크기가 바뀐 자산을 함께 출력하므로
+매핑 스크립트 실행 후 어떤 이미지 때문에 예산을 넘었는지 바로 확인할 수 있음
+
+예산을 넘으면 종료 코드 1
+
+사용법:
+    python scripts/check_budget.py
+    python scripts/check_budget.py --dist dist      # 이미 빌드한 결과 검사
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from asset_graph import TEXT_KINDS, build_graph, collect_site_files, page_assets
+from build_assets import MANIFEST_NAME, build_assets
+
+BUDGET_FILE = "performance-budget.json"
+REPORT_CACHE = ".build-cache/budget-report.json"
+# 예산 항목: (키, 설명, 단위)
+METRICS = (
+    ('total_kb', 'Total transfer', 'KB'),
+    ('initial_kb', 'Initial load transfer', 'KB'),
+    ('critical_kb', 'Critical path transfer', 'KB'),
+    ('requests', 'Requests', ''),
+    ('critical_requests', 'Critical requests', ''),
+)
+# 크기 변화로 출력할 최소 차이
+DIFF_THRESHOLD_BYTES = 512
+
+
+def transfer_size(path, kind):
+    """전송 크기 추정 (텍스트는 gzip 압축 크기, 나머지는 파일 크기)"""
+    data = Path(path).read_bytes()
+    if kind in TEXT_KINDS or Path(path).suffix.lower() in ('.svg', '.json'):
+        return len(gzip.compress(data, compresslevel=6, mtime=0))
+    return len(data)
+
+
+def measure_page(graph, page, original_names):
+    """
+    페이지 하나의 예산 항목과 자산 목록
+
+    Returns:
+        {'metrics': {항목: 값}, 'assets': {원래 경로: {'kind', 'critical', 'lazy', 'bytes'}}, 'missing': [...]}
+    """
+    assets = {}
+    missing = []
+    totals = {'total': 0, 'initial': 0, 'critical': 0, 'requests': 0, 'critical_requests': 0}
+    for path, asset in page_assets(graph, page).items():
+        totals['requests'] += 1
+        if asset['critical']:
+            totals['critical_requests'] += 1
+        if asset['external']:
+            size = None
+        elif not asset['exists']:
+            missing.append(path)
+            continue
+        else:
+            size = transfer_size(graph['files'][path], asset['kind'])
+            totals['total'] += size
+            if not asset['lazy']:
+                totals['initial'] += size
+            if asset['critical']:
+                totals['critical'] += size
+        assets[original_names.get(path, path)] = {
+            'kind': asset['kind'], 'critical': asset['critical'], 'lazy': asset['lazy'], 'bytes': size,
+        }
+
+    metrics = {
+        'total_kb': round(totals['total'] / 1024, 1),
+        'initial_kb': round(totals['initial'] / 1024, 1),
+        'critical_kb': round(totals['critical'] / 1024, 1),
+        'requests': totals['requests'],
+        'critical_requests': totals['critical_requests'],
+    }
+    return {'metrics': metrics, 'assets': assets, 'missing': missing}
+
+
+def measure_site(site_root, pages):
+    """빌드된 사이트의 페이지별 측정 결과"""
+    site_root = Path(site_root)
+    # 해시된 이름을 원래 경로로 되돌려 보고서를 빌드 간에 비교할 수 있게 함
+    original_names = {}
+    manifest_path = site_root / MANIFEST_NAME
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            original_names = {hashed.lstrip('/'): original.lstrip('/') for original, hashed in json.load(f).items()}
+
+    graph = build_graph(collect_site_files(site_root))
+    return {page: measure_page(graph, page, original_names) for page in pages}
+
+
+def check_metrics(metrics, budget):
+    """예산을 넘은 항목 목록 [(키, 설명, 단위, 값, 예산)]"""
+    return [
+        (key, label, unit, metrics[key], budget[key])
+        for key, label, unit in METRICS
+        if key in budget and metrics[key] > budget[key]
+    ]
+
+
+def asset_diff(previous, current):
+    """이전 보고서 대비 자산 변화 [(표시, 경로, 이전 바이트, 현재 바이트)]"""
+    changes = []
+    for path in sorted(set(previous) | set(current)):
+        before = previous.get(path, {}).get('bytes')
+        after = current.get(path, {}).get('bytes')
+        if path not in previous:
+            changes.append(('+', path, None, after))
+        elif path not in current:
+            changes.append(('-', path, before, None))
+        elif before is not None and after is not None and abs(after - before) >= DIFF_THRESHOLD_BYTES:
+            changes.append(('~', path, before, after))
+    return changes
+
+
+def format_bytes(size):
+    return "external" if size is None else f"{size / 1024:.1f} KB"
+
+
+def print_page_report(page, result, budget, previous):
+    """페이지 하나의 예산 비교와 자산 변화 출력"""
+    print(f"\n{page}")
+    failures = check_metrics(result['metrics'], budget)
+    failed_keys = {failure[0] for failure in failures}
+    for key, label, unit in METRICS:
+        value = result['metrics'][key]
+        limit = budget.get(key)
+        tag = "[FAIL]" if key in failed_keys else "[OK]"
+        if limit is None:
+            tag = "[INFO]"
+        limit_text = f" / budget {limit}{' ' + unit if unit else ''}" if limit is not None else ""
+        over = f" (+{value - limit:g}{' ' + unit if unit else ''} over)" if key in failed_keys else ""
+        print(f"  {tag} {label}: {value:g}{' ' + unit if unit else ''}{limit_text}{over}")
+
+    for path in result['missing']:
+        print(f"  [WARN] Missing asset: {path}")
+
+    if previous is not None:
+        changes = asset_diff(previous.get('assets', {}), result['assets'])
+        if changes:
+            print("  Changes since last check:")
+            for mark, path, before, after in changes:
+                if mark == '~':
+                    print(f"    ~ {path}: {format_bytes(before)} -> {format_bytes(after)}")
+                else:
+                    print(f"    {mark} {path} ({format_bytes(after if mark == '+' else before)})")
+
+    if failures:
+        # 예산 초과 시 가장 큰 자산 목록 (지연 로딩 여부 포함)
+        print("  Largest assets:")
+        largest = sorted(
+            ((path, asset) for path, asset in result['assets'].items() if asset['bytes'] is not None),
+            key=lambda item: item[1]['bytes'], reverse=True,
+        )[:5]
+        for path, asset in largest:
+            flags = ", ".join(flag for flag in ('critical', 'lazy') if asset[flag])
+            print(f"    {format_bytes(asset['bytes']):>10}  {path}{f' ({flags})' if flags else ''}")
+    return failures
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="페이지 용량/요청 수 예산 검사")
+    parser.add_argument('--dist', type=Path, default=None,
+                        help="이미 빌드한 결과 디렉토리 (기본값: 임시 디렉토리에 새로 빌드)")
+    parser.add_argument('--budget', type=Path, default=project_root / BUDGET_FILE,
+                        help=f"예산 파일 (기본값: {BUDGET_FILE})")
+    args = parser.parse_args()
+
+    with open(args.budget, 'r', encoding='utf-8') as f:
+        budgets = json.load(f)['pages']
+
+    print("Checking page budgets...")
+    print("=" * 60)
+    if args.dist is not None:
+        results = measure_site(args.dist, budgets)
+    else:
+        with tempfile.TemporaryDirectory() as build_dir:
+            try:
+                build_assets(project_root, build_dir)
+            except ValueError as e:
+                print(f"[ERROR] {e}")
+                sys.exit(1)
+            results = measure_site(build_dir, budgets)
+
+    report_path = project_root / REPORT_CACHE
+    previous = {}
+    if report_path.exists():
+        with open(report_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+    failures = 0
+    for page, result in results.items():
+        failures += len(print_page_report(page, result, budgets[page], previous.get(page)))
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"[FAIL] {failures} budget(s) exceeded")
+        sys.exit(1)
+
+    # 통과한 결과만 다음 비교 기준으로 저장 (초과한 동안에는 마지막 통과 상태와 비교)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+    print(f"[DONE] {len(results)} page(s) within budget")
+
+
+if __name__ == "__main__":
+    main()
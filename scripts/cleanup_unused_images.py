@@ -4,54 +4,19 @@
 """
 
 import shutil
-import re
 from pathlib import Path
 
+from asset_graph import build_graph, referenced_paths
+from build_assets import collect_files
+
 # 프로젝트 루트 경로
 project_root = Path(__file__).parent.parent
 images_root = project_root / "assets" / "images"
 other_dir = images_root / "other"
 
 # HTML, CSS, JS 파일에서 참조하는 이미지 경로 추출
-required_images = set()
-
-# HTML 파일 스캔
-html_file = project_root / "src" / "html" / "index.html"
-if html_file.exists():
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # src="..." 또는 src='...' 패턴 추출
-        for match in re.finditer(r'src=["\']([^"\']+)["\']', content):
-            path = match.group(1)
-            if path.startswith('/assets/images/'):
-                required_images.add(path[1:])  # 앞의 '/' 제거
-
-# JavaScript 파일 스캔
-js_file = project_root / "src" / "js" / "main.js"
-if js_file.exists():
-    with open(js_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # url(...) 패턴 추출
-        for match in re.finditer(r'url\(([^)]+)\)', content):
-            path = match.group(1).strip('\'"')
-            if path.startswith('/assets/images/'):
-                required_images.add(path[1:])
-
-# CSS 파일 스캔
-css_dir = project_root / "src" / "css"
-for css_file in css_dir.glob("*.css"):
-    with open(css_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # url(...) 패턴 추출
-        for match in re.finditer(r'url\(([^)]+)\)', content):
-            path = match.group(1).strip('\'"')
-            if path.startswith('/assets/images/') or path.startswith('../assets/images/'):
-                # 상대 경로 처리
-                if path.startswith('../'):
-                    path = 'assets/images/' + path[3:]
-                elif path.startswith('/'):
-                    path = path[1:]
-                required_images.add(path)
+# (src/srcset, CSS url(), JS에서 넣는 배경 이미지 등 - asset_graph.py 참조)
+required_images = referenced_paths(build_graph(collect_files(project_root)), kind='image')
 
 print(f"Found {len(required_images)} required image paths in code:")
 for img in sorted(required_images):
@@ -0,0 +1,173 @@
+"""
+사전 압축 파일 생성 스크립트
+build_assets.py가 만든 dist/의 텍스트 자산(HTML, CSS, JS, SVG)마다 최대 압축 단계의
+.br(Brotli 11)과 .gz(gzip 9) 파일을 옆에 만들고, 파일별 크기와 압축률을 출력
+
+dist/는 빌드마다 새로 만들어지므로 압축 결과는 원본 내용 해시를 이름으로
+.build-cache/compressed/에 보관하고, 내용이 같은 파일은 다시 압축하지 않고 복사함
+(Brotli 11단계는 느리므로 수정하지 않은 CSS/JS를 매번 압축하지 않기 위함)
+
+압축해도 원본보다 작아지지 않는 파일은 압축본을 만들지 않음.
+로컬 테스트 서버는 Accept-Encoding에 맞춰 이 파일들을 그대로 전송함
+
+사용법:
+    python scripts/build_assets.py && python scripts/compress_assets.py
+    python scripts/compress_assets.py dist --workers 4
+"""
+
+import argparse
+import gzip
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install brotli")
+    sys.exit(1)
+
+from image_manifest import content_hash
+
+# 사전 압축 대상 (이미지/폰트는 이미 압축된 형식)
+COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.js', '.svg', '.json', '.txt', '.xml')
+# 인코딩별 확장자와 압축 함수 (gzip mtime=0: 같은 입력이면 같은 출력)
+ENCODINGS = {
+    'br': lambda data: brotli.compress(data, quality=11, mode=brotli.MODE_TEXT),
+    'gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+}
+CACHE_DIR = ".build-cache/compressed"
+
+
+def find_compressible(output_dir):
+    """압축할 파일 목록 (이미 만든 압축본 제외)"""
+    return [
+        path for path in sorted(Path(output_dir).rglob('*'))
+        if path.is_file() and path.suffix.lower() in COMPRESSIBLE_SUFFIXES
+    ]
+
+
+def compress_file(path, cache_dir):
+    """
+    파일 하나의 .br/.gz 생성 (스레드 풀 워커)
+    캐시에 같은 해시의 압축본이 있으면 복사만 함
+
+    Returns:
+        {'size': 원본 크기, 'encodings': {인코딩: 압축 크기 또는 None}, 'cached': 캐시 사용 여부}
+    """
+    data = path.read_bytes()
+    digest = content_hash(data)
+    result = {'size': len(data), 'encodings': {}, 'cached': True}
+    for encoding, compress in ENCODINGS.items():
+        target = path.with_name(f"{path.name}.{encoding}")
+        cached = Path(cache_dir) / f"{digest}.{encoding}"
+        if cached.exists():
+            compressed = cached.read_bytes()
+        else:
+            compressed = compress(data)
+            result['cached'] = False
+            # 같은 내용의 파일이 여러 스레드에서 동시에 압축될 수 있으므로 임시 파일 이름을 스레드별로 구분
+            tmp = cached.with_name(f"{cached.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(compressed)
+            os.replace(tmp, cached)
+
+        # 원본보다 작지 않으면 압축본을 두지 않음 (서버가 원본을 보내도록)
+        if len(compressed) >= len(data):
+            if target.exists():
+                target.unlink()
+            result['encodings'][encoding] = None
+            continue
+        shutil.copyfile(cached, target)
+        result['encodings'][encoding] = len(compressed)
+    return result
+
+
+def compress_assets(output_dir, cache_dir, workers=None):
+    """
+    output_dir의 텍스트 자산을 스레드 풀로 사전 압축
+    (zlib/brotli는 압축 중 GIL을 놓으므로 스레드로도 병렬 처리됨)
+
+    Returns:
+        [(파일 경로, compress_file 결과 또는 예외), ...]
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    files = find_compressible(output_dir)
+    if not files:
+        return []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(path, executor.submit(compress_file, path, cache_dir)) for path in files]
+        for path, future in futures:
+            try:
+                results.append((path, future.result()))
+            except Exception as e:
+                results.append((path, e))
+    return results
+
+
+def format_ratio(size, compressed):
+    """압축 크기와 원본 대비 비율 ("1.2 KB 23.4%")"""
+    if compressed is None:
+        return "-"
+    return f"{compressed / 1024:.1f} KB {compressed / size * 100:.1f}%"
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="텍스트 자산의 .br/.gz 사전 압축 파일 생성")
+    parser.add_argument('directory', nargs='?', default=project_root / "dist", type=Path,
+                        help="빌드 결과 디렉토리 (기본값: dist)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="사용할 스레드 수 (기본값: CPU 수)")
+    args = parser.parse_args()
+
+    if not args.directory.exists():
+        print(f"[ERROR] {args.directory} not found (run scripts/build_assets.py first)")
+        sys.exit(1)
+
+    print(f"Precompressing text assets in {args.directory}")
+    print("=" * 60)
+    start = time.perf_counter()
+    results = compress_assets(args.directory, project_root / CACHE_DIR, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    totals = {'size': 0, **{encoding: 0 for encoding in ENCODINGS}}
+    failed = 0
+    for path, result in results:
+        name = path.relative_to(args.directory).as_posix()
+        if isinstance(result, Exception):
+            print(f"  [FAIL] {name}: {result}")
+            failed += 1
+            continue
+        tag = "[SKIP]" if result['cached'] else "[OK]"
+        columns = " | ".join(
+            f"{encoding} {format_ratio(result['size'], compressed)}"
+            for encoding, compressed in result['encodings'].items()
+        )
+        print(f"  {tag} {name} ({result['size'] / 1024:.1f} KB) -> {columns}")
+        totals['size'] += result['size']
+        for encoding, compressed in result['encodings'].items():
+            totals[encoding] += compressed if compressed is not None else result['size']
+
+    print("\n" + "=" * 60)
+    if totals['size']:
+        summary = ", ".join(
+            f"{encoding} {totals[encoding] / 1024:.1f} KB ({totals[encoding] / totals['size'] * 100:.1f}%)"
+            for encoding in ENCODINGS
+        )
+        print(f"[SUMMARY] {len(results) - failed} files, {totals['size'] / 1024:.1f} KB -> {summary}")
+    print(f"[DONE] Precompressed in {elapsed:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
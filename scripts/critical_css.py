@@ -0,0 +1,581 @@
+"""
+Critical CSS 추출 및 CSS 번들
+HTML이 <link rel="stylesheet">로 불러오는 로컬 CSS(variables.css, reset.css, style.css 등)를 하나의
+압축된 번들로 합치고, 첫 화면(<header>, .hero-section)에 실제로 쓰이는 규칙만 골라 <head>에 인라인함.
+번들은 preload + onload로 비동기 로드하므로 CSS 때문에 렌더링이 막히지 않음
+
+- 첫 화면 판단: index.html을 DOM으로 만들어 각 선택자를 header/.hero-section 요소와 대조
+  (:hover 같은 상태 선택자와 ::before 등은 요소만 맞으면 포함 - 빠뜨리는 것보다 조금 더 넣는 쪽을 택함)
+- CSS 변수: :root에 한 번만 정의된 변수는 critical CSS 안에서 값으로 바꾸고 정의는 뺌
+  (다크 모드처럼 @media에서 다시 정의하는 변수는 var()와 정의를 그대로 둠)
+- url()은 사이트 절대 경로로 바꿔 HTML에 인라인해도, 번들 위치가 달라도 깨지지 않게 함
+
+build_assets.py가 dist/로 빌드할 때 적용하며(번들 이름도 해시됨), 원본 HTML/CSS는 바꾸지 않음.
+외부 CSS(CDN)는 그대로 둠 - Pretendard는 build_fonts.py로 직접 호스팅하면 fonts.css가 번들에 포함됨
+
+사용법 (크기 확인):
+    python scripts/critical_css.py
+    python scripts/critical_css.py src/html/index.html
+"""
+
+import argparse
+import re
+from html.parser import HTMLParser
+from pathlib import Path, PurePosixPath
+
+from asset_graph import EXTERNAL_PATTERN, resolve_reference
+
+# 첫 화면으로 보는 영역 (이 요소와 하위 요소, 상위 요소에 맞는 규칙을 인라인)
+CRITICAL_ROOTS = ('header', '.hero-section')
+# 하위 규칙을 가진 @규칙 (나머지 @규칙은 본문을 그대로 유지)
+GROUPING_AT_RULES = ('@media', '@supports', '@layer', '@container')
+# 변수 값 치환 반복 횟수 (var() 안의 var() 대비)
+MAX_VAR_DEPTH = 8
+
+STRING_PATTERN = re.compile(r'''"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*\'''')
+COMMENT_PATTERN = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/''', re.DOTALL)
+CSS_URL_PATTERN = re.compile(r'''url\(\s*(['"]?)([^'")]+?)\1\s*\)''')
+VAR_PATTERN = re.compile(r'var\(\s*(--[\w-]+)\s*(?:,\s*([^()]*(?:\([^()]*\)[^()]*)*))?\)')
+LINK_PATTERN = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r'''([\w:-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+VOID_ELEMENTS = ('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                 'param', 'source', 'track', 'wbr')
+
+
+# ---------------------------------------------------------------------------
+# CSS 파싱/출력
+# ---------------------------------------------------------------------------
+
+def strip_comments(css):
+    """주석 제거 (문자열 안의 /* */는 유지)"""
+    return COMMENT_PATTERN.sub(lambda match: match.group(1) or '', css)
+
+
+def split_top_level(text, separator):
+    """괄호/문자열 밖의 separator로 분리"""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for pos, char in enumerate(text):
+        if quote:
+            if char == quote and text[pos - 1] != '\\':
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:pos])
+            start = pos + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _block_end(css, start):
+    """start 위치의 '{'와 짝이 맞는 '}' 위치"""
+    depth = 0
+    quote = None
+    for pos in range(start, len(css)):
+        char = css[pos]
+        if quote:
+            if char == quote and css[pos - 1] != '\\':
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return pos
+    return len(css)
+
+
+def parse_css(css):
+    """
+    CSS를 규칙 목록으로 파싱
+
+    Returns:
+        [{'type': 'rule', 'selector', 'declarations': [(이름, 값), ...]},
+         {'type': 'group', 'prelude': '@media ...', 'rules': [...]},
+         {'type': 'at', 'prelude': '@font-face', 'body': 본문},
+         {'type': 'statement', 'text': '@import ...'}]
+    """
+    rules = []
+    pos = 0
+    while pos < len(css):
+        brace = css.find('{', pos)
+        semicolon = css.find(';', pos)
+        if brace < 0:
+            break
+        prelude = css[pos:brace].strip()
+        # @import/@charset처럼 블록 없이 끝나는 문장
+        if prelude.startswith('@') and 0 <= semicolon < brace:
+            rules.append({'type': 'statement', 'text': css[pos:semicolon].strip()})
+            pos = semicolon + 1
+            continue
+        end = _block_end(css, brace)
+        body = css[brace + 1:end]
+        pos = end + 1
+        if prelude.lower().startswith(GROUPING_AT_RULES):
+            rules.append({'type': 'group', 'prelude': prelude, 'rules': parse_css(body)})
+        elif prelude.startswith('@'):
+            rules.append({'type': 'at', 'prelude': prelude, 'body': body})
+        elif prelude:
+            rules.append({'type': 'rule', 'selector': prelude, 'declarations': parse_declarations(body)})
+    return rules
+
+
+def parse_declarations(body):
+    """선언 블록을 [(이름, 값)] 목록으로 변환"""
+    declarations = []
+    for part in split_top_level(body, ';'):
+        name, colon, value = part.partition(':')
+        if colon and name.strip():
+            declarations.append((name.strip(), value.strip()))
+    return declarations
+
+
+def minify_value(text):
+    """공백 정리 (문자열은 그대로 두고, calc()의 +/- 주변 공백은 유지)"""
+    pieces = []
+    pos = 0
+    for match in STRING_PATTERN.finditer(text):
+        pieces.append(_minify_plain(text[pos:match.start()]))
+        pieces.append(match.group(0))
+        pos = match.end()
+    pieces.append(_minify_plain(text[pos:]))
+    return ''.join(pieces).strip()
+
+
+def _minify_plain(text):
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{}:;,>~])\s*', r'\1', text)
+    text = re.sub(r'\s*!\s*important', '!important', text)
+    return text.replace('( ', '(').replace(' )', ')')
+
+
+def minify_selector(selector):
+    """선택자 공백 정리 (자손 결합자 공백은 유지)"""
+    selector = re.sub(r'\s+', ' ', selector.strip())
+    return re.sub(r'\s*([>+~,])\s*', r'\1', selector)
+
+
+def serialize(rules):
+    """규칙 목록을 압축된 CSS 문자열로 출력"""
+    output = []
+    for rule in rules:
+        if rule['type'] == 'rule':
+            if rule['declarations']:
+                body = ';'.join(f"{name}:{minify_value(value)}" for name, value in rule['declarations'])
+                output.append(f"{minify_selector(rule['selector'])}{{{body}}}")
+        elif rule['type'] == 'group':
+            inner = serialize(rule['rules'])
+            if inner:
+                output.append(f"{minify_value(rule['prelude'])}{{{inner}}}")
+        elif rule['type'] == 'at':
+            output.append(f"{minify_value(rule['prelude'])}{{{minify_value(rule['body']).rstrip(';')}}}")
+        else:
+            output.append(minify_value(rule['text']) + ';')
+    return ''.join(output)
+
+
+def absolutize_urls(css, site_path):
+    """url()의 상대 경로를 사이트 절대 경로로 변환"""
+    def replace(match):
+        url = match.group(2).strip()
+        if url.startswith(('/', 'data:', '#')) or EXTERNAL_PATTERN.match(url):
+            return match.group(0)
+        resolved, suffix = resolve_reference(url, site_path)
+        if resolved is None:
+            return match.group(0)
+        return f"url({match.group(1)}/{resolved}{suffix}{match.group(1)})"
+    return CSS_URL_PATTERN.sub(replace, css)
+
+
+# ---------------------------------------------------------------------------
+# HTML DOM과 선택자 대조
+# ---------------------------------------------------------------------------
+
+class Element:
+    """선택자 대조용 최소 DOM 요소"""
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+        self.classes = set(attrs.get('class', '').split())
+
+    def previous_siblings(self):
+        """앞쪽 형제 요소 (가까운 순)"""
+        if self.parent is None:
+            return []
+        siblings = self.parent.children
+        return list(reversed(siblings[:siblings.index(self)]))
+
+    def iter(self):
+        yield self
+        for child in self.children:
+            yield from child.iter()
+
+
+class _DOMBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element('#document', {}, None)
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        element = Element(tag, {name: (value or '') for name, value in attrs}, self.current)
+        self.current.children.append(element)
+        if tag not in VOID_ELEMENTS:
+            self.current = element
+
+    def handle_startendtag(self, tag, attrs):
+        element = Element(tag, {name: (value or '') for name, value in attrs}, self.current)
+        self.current.children.append(element)
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+
+def parse_html(html):
+    """HTML 문자열을 Element 트리로 변환"""
+    builder = _DOMBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+COMPOUND_PATTERN = re.compile(
+    r'''(?P<tag>\*|[\w-]+)|\#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+)'''
+    r'''|\[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?P<val>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?(?:[is]\s*)?\]'''
+    r'''|::?(?P<pseudo>[\w-]+)(?P<args>\((?:[^()]|\([^()]*\))*\))?'''
+)
+
+
+def _parse_complex(selector):
+    """복합 선택자를 [(결합자, 단순 선택자 목록)]으로 분해 (왼쪽부터)"""
+    parts = []
+    combinator = None
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        whitespace = re.match(r'\s*([>+~])\s*|\s+', selector[pos:])
+        if whitespace and parts:
+            combinator = whitespace.group(1) or ' '
+            pos += whitespace.end()
+            continue
+        compound = []
+        while pos < len(selector):
+            match = COMPOUND_PATTERN.match(selector, pos)
+            if not match or match.end() == pos:
+                break
+            compound.append(match)
+            pos = match.end()
+        if not compound:
+            return None  # 해석할 수 없는 선택자
+        parts.append((combinator, compound))
+        combinator = None
+    return parts
+
+
+def _match_compound(element, compound):
+    for match in compound:
+        if match.group('tag'):
+            if match.group('tag') != '*' and match.group('tag').lower() != element.tag:
+                return False
+        elif match.group('id'):
+            if element.attrs.get('id') != match.group('id'):
+                return False
+        elif match.group('cls'):
+            if match.group('cls') not in element.classes:
+                return False
+        elif match.group('attr'):
+            name = match.group('attr').lower()
+            if name not in element.attrs:
+                return False
+            if match.group('op'):
+                actual = element.attrs[name]
+                expected = match.group('val').strip('"\'')
+                op = match.group('op')
+                if op == '=' and actual != expected:
+                    return False
+                if op == '~=' and expected not in actual.split():
+                    return False
+                if op == '^=' and not actual.startswith(expected):
+                    return False
+                if op == '$=' and not actual.endswith(expected):
+                    return False
+                if op == '*=' and expected not in actual:
+                    return False
+                if op == '|=' and not (actual == expected or actual.startswith(expected + '-')):
+                    return False
+        elif match.group('pseudo'):
+            # :root만 구조적으로 확인하고, 상태/구조 가상 클래스와 가상 요소는 맞는 것으로 간주
+            if match.group('pseudo').lower() == 'root' and element.tag != 'html':
+                return False
+    return True
+
+
+def _match_parts(element, parts):
+    """오른쪽 끝 단순 선택자부터 결합자를 따라 대조"""
+    combinator, compound = parts[-1]
+    if not _match_compound(element, compound):
+        return False
+    if len(parts) == 1:
+        return True
+    rest = parts[:-1]
+    if combinator == '>':
+        return element.parent is not None and _match_parts(element.parent, rest)
+    if combinator == ' ':
+        node = element.parent
+        while node is not None and node.tag != '#document':
+            if _match_parts(node, rest):
+                return True
+            node = node.parent
+        return False
+    siblings = element.previous_siblings()
+    if combinator == '+':
+        return bool(siblings) and _match_parts(siblings[0], rest)
+    return any(_match_parts(sibling, rest) for sibling in siblings)
+
+
+def matches(element, selector):
+    """요소가 복합 선택자 하나에 맞는지 확인 (해석할 수 없으면 맞는 것으로 간주)"""
+    parts = _parse_complex(selector)
+    if parts is None:
+        return True
+    return _match_parts(element, parts)
+
+
+def critical_elements(document, roots=CRITICAL_ROOTS):
+    """첫 화면 영역 요소 (영역 안의 모든 요소와 그 상위 요소)"""
+    elements = []
+    seen = set()
+    for element in document.iter():
+        if element.tag == '#document' or not any(matches(element, root) for root in roots):
+            continue
+        for node in element.iter():
+            if id(node) not in seen:
+                seen.add(id(node))
+                elements.append(node)
+        node = element.parent
+        while node is not None and node.tag != '#document':
+            if id(node) not in seen:
+                seen.add(id(node))
+                elements.append(node)
+            node = node.parent
+    return elements
+
+
+# ---------------------------------------------------------------------------
+# Critical CSS
+# ---------------------------------------------------------------------------
+
+def _collect_custom_properties(rules, context=(), found=None):
+    """사용자 정의 속성 정의 {이름: [(규칙 위치, 선택자, 값), ...]}"""
+    if found is None:
+        found = {}
+    for rule in rules:
+        if rule['type'] == 'rule':
+            for name, value in rule['declarations']:
+                if name.startswith('--'):
+                    found.setdefault(name, []).append((context, rule['selector'].strip(), value))
+        elif rule['type'] == 'group':
+            _collect_custom_properties(rule['rules'], context + (rule['prelude'],), found)
+    return found
+
+
+def static_variables(rules):
+    """@media 등에서 다시 정의하지 않고 :root에 한 번만 정의된 변수 {이름: 값}"""
+    static = {}
+    for name, definitions in _collect_custom_properties(rules).items():
+        if len(definitions) == 1:
+            context, selector, value = definitions[0]
+            if not context and selector in (':root', 'html'):
+                static[name] = value
+    return static
+
+
+def resolve_variables(value, variables):
+    """값의 var(--x)를 정적 변수 값으로 치환 (정적 변수가 아니면 var()를 그대로 유지)"""
+    for _ in range(MAX_VAR_DEPTH):
+        def replace(match):
+            if match.group(1) in variables:
+                return variables[match.group(1)]
+            return match.group(0)
+        resolved = VAR_PATTERN.sub(replace, value)
+        if resolved == value:
+            break
+        value = resolved
+    return value
+
+
+def _filter_rules(rules, elements, variables, keep_font_faces=True):
+    """첫 화면 요소에 맞는 규칙만 남긴 새 규칙 목록"""
+    kept = []
+    for rule in rules:
+        if rule['type'] == 'rule':
+            selectors = [
+                selector for selector in split_top_level(rule['selector'], ',')
+                if any(matches(element, selector) for element in elements)
+            ]
+            if not selectors:
+                continue
+            declarations = [
+                (name, resolve_variables(value, variables))
+                for name, value in rule['declarations']
+                if name not in variables
+            ]
+            if declarations:
+                kept.append({'type': 'rule', 'selector': ','.join(selectors), 'declarations': declarations})
+        elif rule['type'] == 'group':
+            inner = _filter_rules(rule['rules'], elements, variables, keep_font_faces)
+            if inner:
+                kept.append({'type': 'group', 'prelude': rule['prelude'], 'rules': inner})
+        elif rule['type'] == 'at' and rule['prelude'].lower().startswith('@font-face') and keep_font_faces:
+            kept.append(rule)
+    return kept
+
+
+def _referenced_keyframes(rules, css_text):
+    """critical CSS의 animation에서 쓰는 @keyframes 규칙"""
+    return [
+        rule for rule in rules
+        if rule['type'] == 'at' and re.match(r'@(-\w+-)?keyframes\s', rule['prelude'])
+        and re.search(r'(?<![\w-])' + re.escape(rule['prelude'].split()[-1]) + r'(?![\w-])', css_text)
+    ]
+
+
+def extract_critical(rules, document, roots=CRITICAL_ROOTS):
+    """첫 화면 영역에 쓰이는 규칙만 추려 압축된 CSS로 반환"""
+    elements = critical_elements(document, roots)
+    variables = static_variables(rules)
+    critical = _filter_rules(rules, elements, variables)
+    css = serialize(critical)
+    keyframes = _referenced_keyframes(rules, css)
+    return css + serialize(keyframes)
+
+
+# ---------------------------------------------------------------------------
+# HTML 변환
+# ---------------------------------------------------------------------------
+
+def local_stylesheets(html, site_path, files):
+    """
+    HTML의 로컬 <link rel="stylesheet"> 목록 [(태그 문자열, 사이트 경로)]
+    (외부 CSS, media가 화면용이 아닌 CSS는 제외)
+    """
+    stylesheets = []
+    for match in LINK_PATTERN.finditer(html):
+        attrs = {}
+        for attr in ATTRIBUTE_PATTERN.finditer(match.group(0)[5:-1]):
+            name, *values = attr.groups()
+            attrs[name.lower()] = next((value for value in values if value is not None), '')
+        if 'stylesheet' not in attrs.get('rel', '').lower().split() or not attrs.get('href'):
+            continue
+        if EXTERNAL_PATTERN.match(attrs['href']) or attrs.get('media', 'all').lower() not in ('all', 'screen'):
+            continue
+        resolved, _ = resolve_reference(attrs['href'], site_path)
+        if resolved in files:
+            stylesheets.append((match.group(0), resolved))
+    return stylesheets
+
+
+def bundle_path(site_path, stylesheets):
+    """번들 사이트 경로 (첫 CSS와 같은 폴더의 <페이지>.bundle.css)"""
+    folder = PurePosixPath(stylesheets[0][1]).parent
+    return str(folder / f"{PurePosixPath(site_path).stem}.bundle.css")
+
+
+def inline_critical_css(html, site_path, files, read_text, roots=CRITICAL_ROOTS, purge=None):
+    """
+    HTML의 로컬 CSS를 critical CSS 인라인 + 비동기 번들로 교체
+
+    Args:
+        html: HTML 문자열
+        site_path: HTML 사이트 경로
+        files: {사이트 경로: 파일 경로}
+        read_text: 사이트 경로 -> 텍스트 (빌드 중 변환된 내용 사용)
+        purge: 규칙 목록 -> 사용하지 않는 규칙을 뺀 규칙 목록 (purge_css.py, 선택)
+
+    Returns:
+        (새 HTML, 번들 사이트 경로, 번들 CSS, 통계) 또는 로컬 CSS가 없으면 None
+    """
+    stylesheets = local_stylesheets(html, site_path, files)
+    if not stylesheets:
+        return None
+
+    sources = [absolutize_urls(strip_comments(read_text(path)), path) for _, path in stylesheets]
+    rules = parse_css('\n'.join(sources))
+    unpurged_bytes = len(serialize(rules).encode('utf-8'))
+    if purge is not None:
+        rules = purge(rules)
+    bundle = serialize(rules)
+    critical = extract_critical(rules, parse_html(html), roots)
+    target = bundle_path(site_path, stylesheets)
+
+    href = '/' + target
+    replacement = (
+        f"<style>{critical}</style>\n"
+        f"    <link rel=\"preload\" href=\"{href}\" as=\"style\" onload=\"this.onload=null;this.rel='stylesheet'\">\n"
+        f"    <noscript><link rel=\"stylesheet\" href=\"{href}\"></noscript>"
+    )
+    # 첫 번째 <link> 자리에 넣고 나머지 <link>는 (줄과 함께) 제거
+    first_tag = stylesheets[0][0]
+    for tag, _ in stylesheets[1:]:
+        html = re.sub(r'[ \t]*' + re.escape(tag) + r'[ \t]*\r?\n?', '', html, count=1)
+    html = html.replace(first_tag, replacement, 1)
+
+    stats = {
+        'stylesheets': [path for _, path in stylesheets],
+        'source_bytes': sum(len(source.encode('utf-8')) for source in sources),
+        'unpurged_bytes': unpurged_bytes,
+        'bundle_bytes': len(bundle.encode('utf-8')),
+        'critical_bytes': len(critical.encode('utf-8')),
+    }
+    return html, target, bundle, stats
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    from build_assets import collect_files
+
+    parser = argparse.ArgumentParser(description="Critical CSS와 CSS 번들 크기 확인")
+    parser.add_argument('page', nargs='?', default='src/html/index.html', help="HTML 사이트 경로")
+    args = parser.parse_args()
+
+    files = collect_files(project_root)
+    page = args.page.lstrip('/')
+    if page not in files:
+        print(f"[ERROR] {page} not found")
+        return
+
+    def read_text(site_path):
+        return files[site_path].read_text(encoding='utf-8')
+
+    result = inline_critical_css(read_text(page), page, files, read_text)
+    if result is None:
+        print(f"[SKIP] {page} has no local stylesheets")
+        return
+    _, target, _, stats = result
+    print(f"{page}")
+    print("=" * 60)
+    for path in stats['stylesheets']:
+        print(f"  [INFO] {path}")
+    print(f"  [OK] Bundle {target}: {stats['source_bytes'] / 1024:.1f} KB -> {stats['bundle_bytes'] / 1024:.1f} KB")
+    print(f"  [OK] Critical CSS (inline): {stats['critical_bytes'] / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+통합 이미지 추출 스크립트
+PDF를 한 번만 순회하여 카탈로그를 만든 뒤 여러 추출 전략을 그 위에서 실행
+
+사용법:
+    python scripts/extract_images.py                       # 목업 전략만 실행
+    python scripts/extract_images.py -s size -s priority -s mockup
+    python scripts/extract_images.py -s all
+    python scripts/extract_images.py -s all --workers 4  # 페이지 구간을 4개 프로세스로 분할
+    python scripts/extract_images.py --no-cache           # 페이지 지문 캐시 없이 전체 재추출
+
+카탈로그는 이미지 메타데이터만으로 만들고, 각 전략의 필터를 통과한 이미지만 디코딩.
+기본적으로 assets/images/extraction-cache.json에 페이지 지문과 저장한 이미지 스트림을 기록하고,
+다음 실행에서는 바뀐 페이지만 다시 조회
+
+전략:
+    raw      - extract_pdf_images.py (모든 이미지)
+    size     - extract_mockup_images.py (최소 300x200)
+    priority - improved_extract_images.py (최소 면적 + 페이지 우선순위)
+    mockup   - smart_extract_mockups.py (is_web_mockup 판별 + 이미지 특징 점수)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from extraction_cache import CACHE_NAME
+from pdf_catalog import build_catalog, close_documents, save_catalog_cache
+from extract_pdf_images import extract_images_from_pdf
+from extract_mockup_images import extract_mockup_images
+from improved_extract_images import extract_priority_images
+from smart_extract_mockups import extract_smart_mockups
+
+STRATEGIES = {
+    'raw': lambda pdf, out, catalog: extract_images_from_pdf(pdf, out, catalog=catalog),
+    'size': lambda pdf, out, catalog: extract_mockup_images(pdf, out, min_width=300, min_height=200, catalog=catalog),
+    'priority': lambda pdf, out, catalog: extract_priority_images(pdf, out, min_area=50000, catalog=catalog),
+    'mockup': lambda pdf, out, catalog: extract_smart_mockups(pdf, out, catalog=catalog),
+}
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="PDF 이미지 통합 추출")
+    parser.add_argument('pdf', nargs='?', default=project_root / "SF리마스터 웹기획서_260115.pdf",
+                        type=Path, help="기획서 PDF 경로")
+    parser.add_argument('-o', '--output', default=project_root / "assets" / "images",
+                        type=Path, help="이미지 저장 디렉토리")
+    parser.add_argument('-s', '--strategy', action='append',
+                        choices=sorted(STRATEGIES) + ['all'],
+                        help="실행할 추출 전략 (여러 번 지정 가능, 기본값: mockup)")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="카탈로그 생성에 사용할 프로세스 수 (기본값: 1, 순차 처리)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="페이지 지문 캐시를 사용하지 않고 모든 페이지를 다시 디코딩")
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"[ERROR] PDF file not found: {args.pdf}")
+        sys.exit(1)
+
+    strategies = args.strategy or ['mockup']
+    if 'all' in strategies:
+        strategies = list(STRATEGIES)
+
+    if args.no_cache:
+        catalog = build_catalog(args.pdf, workers=args.workers)
+    else:
+        catalog = build_catalog(
+            args.pdf,
+            workers=args.workers,
+            cache_path=args.output / CACHE_NAME,
+            image_dir=args.output / "other",
+        )
+    stats = catalog['stats']
+    print(f"[INFO] Catalog built: {len(catalog['images'])} images from "
+          f"{catalog['page_count']} pages in {stats['elapsed']:.2f}s ({stats['workers']} workers)")
+    if not args.no_cache:
+        print(f"[INFO] Cache: {stats['reused_pages']}/{catalog['page_count']} pages unchanged, "
+              f"{stats['skipped_streams']} image streams already on disk")
+
+    for name in dict.fromkeys(strategies):
+        print("\n" + "#" * 60)
+        print(f"# Strategy: {name}")
+        print("#" * 60)
+        STRATEGIES[name](args.pdf, args.output, catalog)
+
+    save_catalog_cache(catalog)
+    close_documents()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,9 @@ import os
 import sys
 from pathlib import Path
 
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    print("필요한 라이브러리를 설치해주세요:")
-    print("pip install PyMuPDF")
-    sys.exit(1)
+from pdf_catalog import ImageWriter, min_size_filter, page_stream
 
-def extract_mockup_images(pdf_path, output_dir, min_width=300, min_height=200):
+def extract_mockup_images(pdf_path, output_dir, min_width=300, min_height=200, catalog=None, workers=1):
     """
     PDF에서 웹 브라우저 목업 이미지만 추출합니다.
     
@@ -23,106 +18,77 @@ def extract_mockup_images(pdf_path, output_dir, min_width=300, min_height=200):
         output_dir: 이미지를 저장할 디렉토리
         min_width: 최소 이미지 너비 (픽셀) - 작은 아이콘 필터링
         min_height: 최소 이미지 높이 (픽셀) - 작은 아이콘 필터링
+        catalog: 미리 생성한 이미지 카탈로그 (없으면 새로 생성)
+        workers: 카탈로그 생성 시 사용할 프로세스 수
     """
     # 출력 디렉토리 생성
     output_path = Path(output_dir) / "other"
     output_path.mkdir(parents=True, exist_ok=True)
     
     try:
-        pdf_document = fitz.open(pdf_path)
+        page_count, pages = page_stream(pdf_path, catalog=catalog, workers=workers)
         image_count = 0
         skipped_count = 0
+        writer = ImageWriter()
         
         print(f"Opening PDF: {pdf_path}")
-        print(f"Total pages: {len(pdf_document)}")
+        print(f"Total pages: {page_count}")
         print(f"Filter condition: minimum size {min_width}x{min_height}px")
         print("=" * 60)
         
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            image_list = page.get_images(full=True)
+        # 페이지 단위로 최소 크기 필터 적용
+        accept = min_size_filter(min_width, min_height)
+        
+        for page_info, records, errors in pages:
+            page_num = page_info['page']
+            print(f"\nAnalyzing page {page_num}...")
+            
+            for _, img_num, error in errors:
+                print(f"  [FAIL] Page {page_num} img {img_num}: {error}")
             
-            print(f"\nAnalyzing page {page_num + 1}...")
+            selected = [record for record in records if accept(record)]
+            skipped_count += len(records) - len(selected)
             
             page_image_count = 0
-            for img_index, img in enumerate(image_list):
+            for record in selected:
                 try:
-                    xref = img[0]
-                    base_image = pdf_document.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
-                    # 이미지 크기 및 위치 정보 확인
-                    img_rects = page.get_image_rects(xref)
-                    
-                    # 이미지 크기 추정 (PDF 좌표에서 픽셀 크기 계산)
-                    width = height = 0
-                    if img_rects:
-                        rect = img_rects[0]
-                        # PDF 좌표를 픽셀 크기로 변환 (일반적으로 72 DPI 기준)
-                        # 실제 해상도를 추정하기 위해 rect 크기 사용
-                        width_pdf = rect.x1 - rect.x0
-                        height_pdf = rect.y1 - rect.y0
-                        
-                        # 페이지 크기로 정규화하여 실제 크기 추정
-                        page_rect = page.rect
-                        # 이미지가 페이지의 어느 비율을 차지하는지 계산
-                        width_ratio = width_pdf / (page_rect.width or 1)
-                        height_ratio = height_pdf / (page_rect.height or 1)
-                        
-                        # 추정 크기 (PDF 해상도 96 DPI 가정)
-                        width = int(width_pdf * (96 / 72))
-                        height = int(height_pdf * (96 / 72))
-                    
-                    # 이미지 메타데이터에서 실제 크기 확인 시도
-                    if "width" in base_image and "height" in base_image:
-                        width = base_image.get("width", width)
-                        height = base_image.get("height", height)
+                    width = record['width']
+                    height = record['height']
                     
-                    # 크기 필터링 (크기 정보가 있는 경우만)
                     if width > 0 and height > 0:
-                        if width < min_width or height < min_height:
-                            skipped_count += 1
-                            continue
-                        
-                        # 저장
-                        image_filename = f"page{page_num + 1}_img{img_index + 1}_{width}x{height}.{image_ext}"
-                        image_path = output_path / image_filename
-                        
-                        with open(image_path, "wb") as image_file:
-                            image_file.write(image_bytes)
+                        image_filename, alias_of = writer.write(record, output_path)
                         
                         # 위치 정보 출력
                         location_info = ""
-                        if img_rects:
-                            rect = img_rects[0]
-                            location_info = f"Location: ({rect.x0:.0f}, {rect.y0:.0f}) ~ ({rect.x1:.0f}, {rect.y1:.0f})"
+                        if record['rect']:
+                            x0, y0, x1, y1 = record['rect']
+                            location_info = f"Location: ({x0:.0f}, {y0:.0f}) ~ ({x1:.0f}, {y1:.0f})"
                         
-                        print(f"  [OK] Extracted: {image_filename}")
+                        if alias_of:
+                            print(f"  [ALIAS] {image_filename} -> {alias_of}")
+                        else:
+                            print(f"  [OK] Extracted: {image_filename}")
                         print(f"    Size: {width}x{height}px | {location_info}")
-                        
-                        image_count += 1
-                        page_image_count += 1
                     else:
                         # 크기 정보가 없어도 저장 (하지만 파일명에 크기 정보 없음)
-                        image_filename = f"page{page_num + 1}_img{img_index + 1}.{image_ext}"
-                        image_path = output_path / image_filename
-                        
-                        with open(image_path, "wb") as image_file:
-                            image_file.write(image_bytes)
-                        
-                        print(f"  [OK] Extracted: {image_filename} (no size info)")
-                        image_count += 1
-                        page_image_count += 1
+                        image_filename, alias_of = writer.write(record, output_path, with_size=False)
+                        if alias_of:
+                            print(f"  [ALIAS] {image_filename} -> {alias_of} (no size info)")
+                        else:
+                            print(f"  [OK] Extracted: {image_filename} (no size info)")
+                    
+                    image_count += 1
+                    page_image_count += 1
                     
                 except Exception as e:
                     print(f"  [FAIL] Image extraction failed: {e}")
                     continue
             
             if page_image_count > 0:
-                print(f"  -> Page {page_num + 1}: {page_image_count} images extracted")
+                print(f"  -> Page {page_num}: {page_image_count} images extracted")
         
-        pdf_document.close()
+        writer.close()
+        image_count -= len(writer.failures)
         
         print("\n" + "=" * 60)
         print(f"[DONE] Complete!")
@@ -7,21 +7,17 @@ import os
 import sys
 from pathlib import Path
 
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    print("필요한 라이브러리를 설치해주세요:")
-    print("pip install PyMuPDF")
-    print("또는 이미지 추출 도구를 사용하세요.")
-    sys.exit(1)
+from pdf_catalog import ImageWriter, page_stream
 
-def extract_images_from_pdf(pdf_path, output_dir):
+def extract_images_from_pdf(pdf_path, output_dir, catalog=None, workers=1):
     """
     PDF에서 이미지를 추출합니다.
     
     Args:
         pdf_path: PDF 파일 경로
         output_dir: 이미지를 저장할 디렉토리
+        catalog: 미리 생성한 이미지 카탈로그 (없으면 새로 생성)
+        workers: 카탈로그 생성 시 사용할 프로세스 수
     """
     # 출력 디렉토리 생성
     output_path = Path(output_dir)
@@ -33,42 +29,40 @@ def extract_images_from_pdf(pdf_path, output_dir):
         (output_path / subdir).mkdir(exist_ok=True)
     
     try:
-        # PyMuPDF를 사용하여 이미지 추출
-        pdf_document = fitz.open(pdf_path)
+        # 공용 카탈로그 엔진으로 PDF를 한 번만 순회 (카탈로그가 없으면 페이지 단위 스트리밍)
+        page_count, pages = page_stream(pdf_path, catalog=catalog, workers=workers)
         image_count = 0
+        writer = ImageWriter()
         
         print(f"PDF 열기: {pdf_path}")
-        print(f"총 페이지 수: {len(pdf_document)}")
+        print(f"총 페이지 수: {page_count}")
         
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            image_list = page.get_images(full=True)
+        for page_info, records, errors in pages:
+            page_num = page_info['page']
             
-            print(f"\n페이지 {page_num + 1} 처리 중...")
-            print(f"  - 발견된 이미지: {len(image_list)}개")
+            print(f"\n페이지 {page_num} 처리 중...")
+            print(f"  - 발견된 이미지: {page_info['image_count']}개")
             
-            for img_index, img in enumerate(image_list):
+            for _, img_num, error in errors:
+                print(f"  - 이미지 추출 실패 (페이지 {page_num}, 이미지 {img_num}): {error}")
+            
+            for record in records:
                 try:
-                    xref = img[0]
-                    base_image = pdf_document.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
                     # 이미지 저장
-                    image_filename = f"page{page_num + 1}_img{img_index + 1}.{image_ext}"
-                    image_path = output_path / "other" / image_filename
-                    
-                    with open(image_path, "wb") as image_file:
-                        image_file.write(image_bytes)
-                    
+                    image_filename, alias_of = writer.write(record, output_path / "other", with_size=False)
                     image_count += 1
-                    print(f"  - 저장: {image_filename}")
+                    if alias_of:
+                        print(f"  - 별칭: {image_filename} -> {alias_of}")
+                    else:
+                        print(f"  - 저장: {image_filename}")
                     
                 except Exception as e:
                     print(f"  - 이미지 추출 실패: {e}")
                     continue
         
-        pdf_document.close()
+        writer.close()
+        image_count -= len(writer.failures)
+        
         print(f"\n✅ 완료: 총 {image_count}개의 이미지를 추출했습니다.")
         print(f"📁 저장 위치: {output_dir}")
         
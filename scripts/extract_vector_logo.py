@@ -0,0 +1,357 @@
+"""
+벡터 로고 SVG 추출 스크립트
+기획서의 로고는 벡터 도형/텍스트로 그려진 경우가 많은데, organize_images.py는 래스터 이미지
+(page1_img1.png, page1_img2.png)를 logo/*.png로 복사함. 이 스크립트는 지정한 영역(bbox) 안의
+페이지 그리기 명령(get_drawings)과 텍스트 span을 SVG로 옮겨 크기와 해상도에 무관한 로고를 만듦
+
+- 영역은 LOGO_REGIONS에 페이지 번호와 함께 bbox(PDF 좌표, pt) 또는 기존 래스터 이미지 번호
+  (page1_img1이면 image=1, 그 이미지가 놓인 위치 + LOGO_MARGIN)로 지정
+- 영역에 절반 이상 들어오는 도형만 포함하고, 영역 전체를 덮는 흰 배경은 제외
+- 같은 스타일의 연속된 도형은 하나의 <path>로 합치고, 좌표는 영역 기준 소수점 COORD_PRECISION자리로 저장
+- 텍스트는 <text>로 저장 (SVG를 <img>로 쓰면 웹폰트 대신 시스템 폰트로 그려지므로 결과를 확인할 것)
+- 영역에 래스터 이미지가 겹치면 경고하고, 벡터 내용이 없으면 저장하지 않음 (PNG 유지)
+
+출력:
+    assets/images/logo/<이름>.svg
+
+사용법:
+    python scripts/extract_vector_logo.py
+    python scripts/extract_vector_logo.py --name shield-logo --page 1 --bbox 40 30 160 150
+"""
+
+import argparse
+import math
+import re
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install PyMuPDF")
+    sys.exit(1)
+
+from pdf_catalog import image_placements, placement_index
+
+# 로고 영역: 이름 -> {'page': 페이지 번호(1부터), 'bbox': (x0, y0, x1, y1)} 또는 {'page', 'image': 이미지 번호}
+# image-mapping.json의 organize 세트(page1_img1 -> shield-logo, page1_img2 -> dragonfly-logo)와 같은 위치
+LOGO_REGIONS = {
+    'shield-logo': {'page': 1, 'image': 1},
+    'dragonfly-logo': {'page': 1, 'image': 2},
+}
+# 이미지 위치로 영역을 정할 때 사방으로 넓히는 여백 (pt)
+LOGO_MARGIN = 2
+# 도형이 영역 안에 있다고 보는 최소 면적 비율
+INSIDE_RATIO = 0.5
+COORD_PRECISION = 2
+# 영역 전체를 덮는 흰 배경으로 보는 색 (0~1 RGB)
+BACKGROUND_COLORS = ((1.0, 1.0, 1.0),)
+# 폰트 이름의 서브셋 접두사 (ABCDEF+Pretendard-Bold)와 스타일 접미사
+SUBSET_PREFIX_PATTERN = re.compile(r'^[A-Z]{6}\+')
+FONT_STYLE_PATTERN = re.compile(
+    r'[-,]?(?:Regular|Medium|SemiBold|Semibold|Bold|ExtraBold|Black|Light|ExtraLight|Thin|Italic|Oblique|MT|PS)+$'
+)
+# span flags (PyMuPDF): 2 = italic, 16 = bold
+FLAG_ITALIC = 2
+FLAG_BOLD = 16
+
+
+def format_number(value):
+    """좌표/크기 문자열 (불필요한 0과 소수점 제거)"""
+    text = f"{value:.{COORD_PRECISION}f}".rstrip('0').rstrip('.')
+    return '0' if text in ('-0', '') else text
+
+
+def format_color(rgb):
+    """0~1 RGB를 #rgb 또는 #rrggbb로"""
+    values = [max(0, min(255, round(channel * 255))) for channel in rgb[:3]]
+    hex_text = ''.join(f"{value:02x}" for value in values)
+    if all(hex_text[i] == hex_text[i + 1] for i in (0, 2, 4)):
+        return '#' + hex_text[0::2]
+    return '#' + hex_text
+
+
+def span_color(value):
+    """텍스트 span의 sRGB 정수 색을 0~1 RGB로"""
+    return ((value >> 16) & 255) / 255, ((value >> 8) & 255) / 255, (value & 255) / 255
+
+
+def region_rect(page, region):
+    """영역 정의를 페이지 좌표 Rect로 (이미지 번호로 정하면 배치 위치 + 여백)"""
+    if 'bbox' in region:
+        return fitz.Rect(region['bbox'])
+    image_list = page.get_images(full=True)
+    index = region['image']
+    if not 1 <= index <= len(image_list):
+        raise ValueError(f"page {page.number + 1} has no image {index} ({len(image_list)} images)")
+    placements = image_placements(page, image_list[index - 1][0], placement_index(page, image_list))
+    if not placements:
+        raise ValueError(f"image {index} on page {page.number + 1} is not placed on the page")
+    rect = fitz.Rect(placements[0][0])
+    return fitz.Rect(rect.x0 - LOGO_MARGIN, rect.y0 - LOGO_MARGIN, rect.x1 + LOGO_MARGIN, rect.y1 + LOGO_MARGIN)
+
+
+def is_inside(rect, region):
+    """도형 영역이 region 안에 충분히 들어오는지 (선처럼 면적이 없으면 중심점으로 판단)"""
+    rect = fitz.Rect(rect)
+    if rect.is_empty:
+        center = fitz.Point((rect.x0 + rect.x1) / 2, (rect.y0 + rect.y1) / 2)
+        return center in region
+    overlap = fitz.Rect(rect) & region
+    if overlap.is_empty:
+        return False
+    return overlap.get_area() >= rect.get_area() * INSIDE_RATIO
+
+
+def is_background(drawing, region):
+    """영역 전체를 덮는 흰 채우기 (페이지/카드 배경)"""
+    fill = drawing.get('fill')
+    if fill is None or drawing.get('color') is not None:
+        return False
+    if not any(all(abs(a - b) < 0.01 for a, b in zip(fill, color)) for color in BACKGROUND_COLORS):
+        return False
+    return fitz.Rect(drawing['rect']).contains(region)
+
+
+def path_data(items, origin):
+    """get_drawings 항목을 SVG path 데이터로 (origin 기준 좌표)"""
+    commands = []
+    current = None
+    start = None
+
+    def point(p):
+        return f"{format_number(p.x - origin.x)} {format_number(p.y - origin.y)}"
+
+    def same(a, b):
+        return a is not None and abs(a.x - b.x) < 1e-6 and abs(a.y - b.y) < 1e-6
+
+    def move_to(p):
+        nonlocal start
+        if not same(current, p):
+            commands.append('M' + point(p))
+            start = p
+
+    for item in items:
+        kind = item[0]
+        if kind == 'l':
+            move_to(item[1])
+            # PyMuPDF는 닫힌 경로를 시작점으로 돌아가는 직선으로 돌려주므로 Z로 닫음 (모서리 이음 유지)
+            if same(start, item[2]):
+                commands.append('Z')
+                current = None
+                continue
+            commands.append('L' + point(item[2]))
+            current = item[2]
+        elif kind == 'c':
+            move_to(item[1])
+            commands.append('C' + ' '.join(point(p) for p in item[2:5]))
+            current = item[4]
+            if same(start, current):
+                commands.append('Z')
+                current = None
+        elif kind == 're':
+            rect = fitz.Rect(item[1])
+            commands.append('M' + point(rect.tl) + 'H' + format_number(rect.x1 - origin.x)
+                            + 'V' + format_number(rect.y1 - origin.y)
+                            + 'H' + format_number(rect.x0 - origin.x) + 'Z')
+            current = None
+        elif kind == 'qu':
+            quad = item[1]
+            commands.append('M' + point(quad.ul) + 'L' + point(quad.ur) + 'L' + point(quad.lr)
+                            + 'L' + point(quad.ll) + 'Z')
+            current = None
+    return ''.join(commands)
+
+
+def path_style(drawing):
+    """SVG path 속성 (기본값과 같은 속성은 생략)"""
+    style = {}
+    kind = drawing.get('type', '')
+    fill = drawing.get('fill') if 'f' in kind else None
+    stroke = drawing.get('color') if 's' in kind else None
+    style['fill'] = format_color(fill) if fill is not None else 'none'
+    if style['fill'] == '#000':
+        del style['fill']
+    if fill is not None and drawing.get('even_odd'):
+        style['fill-rule'] = 'evenodd'
+    if fill is not None and drawing.get('fill_opacity') not in (None, 1, 1.0):
+        style['fill-opacity'] = format_number(drawing['fill_opacity'])
+    if stroke is not None:
+        style['stroke'] = format_color(stroke)
+        width = drawing.get('width') or 1
+        if abs(width - 1) > 1e-6:
+            style['stroke-width'] = format_number(width)
+        if drawing.get('stroke_opacity') not in (None, 1, 1.0):
+            style['stroke-opacity'] = format_number(drawing['stroke_opacity'])
+        caps = drawing.get('lineCap') or (0,)
+        cap = caps[0] if isinstance(caps, (tuple, list)) else caps
+        if cap:
+            style['stroke-linecap'] = ('butt', 'round', 'square')[int(cap)]
+        join = drawing.get('lineJoin') or 0
+        if join:
+            style['stroke-linejoin'] = ('miter', 'round', 'bevel')[int(join)]
+        dashes = (drawing.get('dashes') or '').strip()
+        match = re.match(r'\[([^\]]*)\]', dashes)
+        if match and match.group(1).strip():
+            style['stroke-dasharray'] = ','.join(format_number(float(v)) for v in match.group(1).split())
+    return tuple(sorted(style.items()))
+
+
+def text_elements(page, region, origin):
+    """영역 안의 텍스트 span을 <text> 요소로"""
+    elements = []
+    for block in page.get_text('dict', clip=region)['blocks']:
+        for line in block.get('lines', []):
+            direction = line.get('dir', (1, 0))
+            for span in line['spans']:
+                text = span['text']
+                if not text.strip() or not is_inside(span['bbox'], region):
+                    continue
+                family = FONT_STYLE_PATTERN.sub('', SUBSET_PREFIX_PATTERN.sub('', span['font'])) or span['font']
+                attrs = {
+                    'x': format_number(span['origin'][0] - origin.x),
+                    'y': format_number(span['origin'][1] - origin.y),
+                    'font-family': f"{family}, sans-serif",
+                    'font-size': format_number(span['size']),
+                }
+                color = format_color(span_color(span['color']))
+                if color != '#000':
+                    attrs['fill'] = color
+                if span['flags'] & FLAG_BOLD or 'Bold' in span['font']:
+                    attrs['font-weight'] = 'bold'
+                if span['flags'] & FLAG_ITALIC:
+                    attrs['font-style'] = 'italic'
+                if abs(direction[0] - 1) > 1e-3:
+                    # 회전된 텍스트 (dir = (cos, sin))
+                    angle = math.degrees(math.atan2(direction[1], direction[0]))
+                    attrs['transform'] = f"rotate({format_number(angle)} {attrs['x']} {attrs['y']})"
+                attr_text = ''.join(f" {key}={quoteattr(value)}" for key, value in attrs.items())
+                elements.append(f"<text{attr_text}>{escape(text)}</text>")
+    return elements
+
+
+def raster_overlaps(page, region):
+    """영역과 겹치는 래스터 이미지 수"""
+    return sum(1 for info in page.get_image_info() if not (fitz.Rect(info['bbox']) & region).is_empty)
+
+
+def extract_vector_logo(page, region):
+    """
+    영역의 벡터 도형/텍스트를 SVG 문자열로
+
+    Returns:
+        (SVG 문자열 또는 None(벡터 내용 없음), {'paths', 'merged', 'texts', 'rasters'} 통계)
+    """
+    origin = region.tl
+    groups = []
+    stats = {'paths': 0, 'merged': 0, 'texts': 0, 'rasters': raster_overlaps(page, region)}
+    for drawing in page.get_drawings():
+        if drawing.get('type') not in ('f', 's', 'fs'):
+            continue
+        if not is_inside(drawing['rect'], region) or is_background(drawing, region):
+            continue
+        data = path_data(drawing['items'], origin)
+        if not data:
+            continue
+        if drawing.get('closePath') and not data.endswith('Z'):
+            data += 'Z'
+        stats['paths'] += 1
+        style = path_style(drawing)
+        # 바로 앞 도형과 스타일이 같으면 하나의 path로 합침 (그리는 순서 유지)
+        if groups and groups[-1][0] == style:
+            groups[-1][1].append(data)
+        else:
+            groups.append((style, [data]))
+    stats['merged'] = len(groups)
+
+    texts = text_elements(page, region, origin)
+    stats['texts'] = len(texts)
+    if not groups and not texts:
+        return None, stats
+
+    width, height = format_number(region.width), format_number(region.height)
+    lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}">']
+    for style, data in groups:
+        attr_text = ''.join(f" {key}={quoteattr(value)}" for key, value in style)
+        lines.append(f'<path{attr_text} d="{"".join(data)}"/>')
+    lines.extend(texts)
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n', stats
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="기획서의 벡터 로고를 SVG로 추출")
+    parser.add_argument('pdf', nargs='?', default=project_root / "SF리마스터 웹기획서_260115.pdf",
+                        type=Path, help="기획서 PDF 경로")
+    parser.add_argument('-o', '--output', default=project_root / "assets" / "images" / "logo",
+                        type=Path, help="SVG 저장 디렉토리")
+    parser.add_argument('--name', help="추출할 로고 이름 (LOGO_REGIONS의 키 또는 새 이름)")
+    parser.add_argument('--page', type=int, help="로고가 있는 페이지 번호 (1부터)")
+    parser.add_argument('--bbox', type=float, nargs=4, metavar=('X0', 'Y0', 'X1', 'Y1'),
+                        help="로고 영역 (PDF 좌표, pt)")
+    parser.add_argument('--image', type=int, help="영역으로 사용할 래스터 이미지 번호 (page1_img1이면 1)")
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"[ERROR] PDF file not found: {args.pdf}")
+        sys.exit(1)
+
+    regions = dict(LOGO_REGIONS)
+    if args.name:
+        region = dict(regions.get(args.name, {}))
+        if args.page is not None:
+            region['page'] = args.page
+        if args.bbox:
+            region.pop('image', None)
+            region['bbox'] = tuple(args.bbox)
+        elif args.image is not None:
+            region.pop('bbox', None)
+            region['image'] = args.image
+        if 'page' not in region or not ('bbox' in region or 'image' in region):
+            print("[ERROR] --page and --bbox/--image are required for a new logo name")
+            sys.exit(1)
+        regions = {args.name: region}
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    print(f"Extracting vector logos from {args.pdf.name}")
+    print("=" * 60)
+
+    saved = 0
+    with fitz.open(args.pdf) as pdf_document:
+        for name, region in regions.items():
+            try:
+                page = pdf_document[region['page'] - 1]
+                rect = region_rect(page, region)
+            except (IndexError, ValueError) as e:
+                print(f"  [FAIL] {name}: {e}")
+                continue
+            svg, stats = extract_vector_logo(page, rect)
+            if stats['rasters']:
+                print(f"  [WARN] {name}: {stats['rasters']} raster image(s) overlap the region "
+                      f"(not included in SVG)")
+            if svg is None:
+                print(f"  [SKIP] {name}: no vector content in page {region['page']} region "
+                      f"({rect.x0:.0f}, {rect.y0:.0f}, {rect.x1:.0f}, {rect.y1:.0f}), keep PNG")
+                continue
+
+            target = args.output / f"{name}.svg"
+            target.write_text(svg, encoding='utf-8')
+            saved += 1
+            raster = args.output / f"{name}.png"
+            compare = f" (PNG {raster.stat().st_size / 1024:.1f} KB)" if raster.exists() else ""
+            print(f"  [OK] {name}.svg: {len(svg.encode('utf-8')) / 1024:.1f} KB{compare} | "
+                  f"{stats['paths']} shapes -> {stats['merged']} paths, {stats['texts']} texts")
+            if stats['texts']:
+                print(f"  [INFO] {name}: text is kept as <text>, check rendering with system fonts")
+
+    print("\n" + "=" * 60)
+    print(f"[DONE] {saved} SVG logo(s) saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
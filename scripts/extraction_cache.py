@@ -0,0 +1,62 @@
+"""
+증분 추출 캐시
+페이지별 지문(콘텐츠 스트림 + 참조 이미지 스트림)과 그 페이지에서 나온 이미지 정보를
+JSON 인덱스(assets/images/extraction-cache.json)로 저장하여,
+기획서가 수정되었을 때 바뀐 페이지만 다시 조회하고, 이미 저장한 이미지 스트림은 디코딩하지 않도록 함
+
+캐시 형식:
+    {
+      "version": 2,
+      "pdf_path": "...",
+      "pages": {"<페이지 지문>": {"images": [이미지 메타데이터 레코드...], "errors": [...]}},
+      "streams": {"<스트림 지문>": {"content_hash", "ext", "size"}}
+    }
+
+페이지 번호가 아닌 지문을 키로 사용하므로 중간에 슬라이드가 추가되어도
+나머지 페이지의 캐시는 그대로 재사용됨
+"""
+
+import json
+from pathlib import Path
+
+from image_manifest import load_manifest
+
+CACHE_VERSION = 2
+CACHE_NAME = "extraction-cache.json"
+
+
+def load_extraction_cache(cache_path):
+    """캐시 파일 읽기 (없거나 버전이 다르면 빈 캐시)"""
+    cache_path = Path(cache_path)
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == CACHE_VERSION:
+                return cache
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable extraction cache {cache_path}: {e}")
+    return {'version': CACHE_VERSION, 'pdf_path': None, 'pages': {}, 'streams': {}}
+
+
+def save_extraction_cache(cache_path, cache):
+    """캐시 파일 저장"""
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+
+def available_images(image_dir):
+    """
+    디스크에 이미 저장된 이미지를 {content_hash: 파일 경로}로 반환
+    매니페스트에 기록된 파일 중 실제로 존재하는 것만 포함
+    """
+    image_dir = Path(image_dir)
+    available = {}
+    for digest, entry in load_manifest(image_dir)['images'].items():
+        path = image_dir / entry['file']
+        if path.exists() and path.stat().st_size == entry['size']:
+            available[digest] = str(path)
+    return available
+
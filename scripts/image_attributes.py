@@ -0,0 +1,358 @@
+"""
+<img> 태그 크기/지연 로딩/플레이스홀더 속성 주입
+HTML의 각 <img>가 참조하는 이미지의 크기를 파일 헤더에서 읽어 width/height를 넣고
+(레이아웃 이동 방지), loading="lazy"/decoding="async"와 배경 플레이스홀더
+(대표 색상 + 16px 흐린 미리보기)를 style로 넣음
+
+크기는 PNG IHDR, JPEG SOF, GIF/WebP/AVIF 헤더, SVG width/height/viewBox만 읽으므로
+이미지를 디코딩하지 않음. 플레이스홀더는 이미지 내용 해시별로
+assets/images/image-placeholders.json에 캐시하고, 캐시에 없는 이미지만 Pillow로 계산
+(Pillow가 없는 배포 환경에서는 캐시된 플레이스홀더만 사용)
+
+build_assets.py가 dist/로 복사하는 HTML에 자동으로 적용하며, 원본 HTML은 바꾸지 않음.
+loading/fetchpriority가 이미 지정된 이미지(첫 화면 이미지)는 지연 로딩하지 않음
+
+사용법 (플레이스홀더 캐시 갱신 및 주입 결과 확인):
+    python scripts/image_attributes.py
+"""
+
+import base64
+import io
+import json
+import re
+import struct
+import sys
+import time
+from pathlib import Path, PurePosixPath
+
+try:
+    from PIL import Image, features
+except ImportError:
+    # 배포 빌드(build_assets.py)는 표준 라이브러리만으로 동작해야 하므로 선택 사항
+    Image = None
+
+from image_manifest import content_hash
+
+PLACEHOLDER_CACHE = "assets/images/image-placeholders.json"
+PLACEHOLDER_VERSION = 1
+# 흐린 미리보기 크기 (긴 변 기준 픽셀) - 브라우저가 확대하면서 자연스럽게 흐려짐
+LQIP_SIZE = 16
+LQIP_QUALITY = 40
+# 이보다 작은 이미지(아이콘, 로고)는 대표 색상만 사용
+LQIP_MIN_SIDE = 128
+# 헤더를 찾기 위해 읽는 최대 바이트 (JPEG는 EXIF/ICC 뒤에 SOF가 오므로 여유 있게)
+HEADER_BYTES = 64 * 1024
+
+IMG_TAG_PATTERN = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r'''([\w:-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+SVG_LENGTH_PATTERN = re.compile(r'^\s*([\d.]+)\s*(px)?\s*$')
+
+# JPEG SOF 마커 (DHT C4, JPG C8, DAC CC 제외)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _png_size(data):
+    if data[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', data[16:24])
+
+
+def _jpeg_size(data):
+    pos = 2
+    while pos + 9 < len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # 채움 바이트
+            pos += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:  # 길이 없는 마커
+            pos += 2
+            continue
+        length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        if marker in JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
+
+
+def _gif_size(data):
+    return struct.unpack('<HH', data[6:10])
+
+
+def _webp_size(data):
+    chunk = data[12:16]
+    if chunk == b'VP8 ':
+        width, height = struct.unpack('<HH', data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L':
+        bits = struct.unpack('<I', data[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X':
+        width = int.from_bytes(data[24:27], 'little') + 1
+        height = int.from_bytes(data[27:30], 'little') + 1
+        return width, height
+    return None
+
+
+def _avif_size(data):
+    # ISOBMFF 'ispe'(image spatial extents) 속성: version/flags 4바이트 + 너비 + 높이
+    pos = data.find(b'ispe')
+    if pos < 0 or pos + 16 > len(data):
+        return None
+    return struct.unpack('>II', data[pos + 8:pos + 16])
+
+
+def _svg_length(value):
+    match = SVG_LENGTH_PATTERN.match(value or '')
+    return round(float(match.group(1))) if match else None
+
+
+def _svg_size(data):
+    text = data.decode('utf-8', errors='ignore')
+    match = re.search(r'<svg\b[^>]*>', text)
+    if not match:
+        return None
+    attributes = parse_attributes(match.group(0))
+    width = _svg_length(attributes.get('width'))
+    height = _svg_length(attributes.get('height'))
+    if width and height:
+        return width, height
+    # 단위 없는 width/height가 없으면 viewBox 비율 사용
+    view_box = (attributes.get('viewBox') or attributes.get('viewbox') or '').replace(',', ' ').split()
+    if len(view_box) == 4:
+        box_width, box_height = float(view_box[2]), float(view_box[3])
+        if box_width > 0 and box_height > 0:
+            if width:
+                return width, round(width * box_height / box_width)
+            if height:
+                return round(height * box_width / box_height), height
+            return round(box_width), round(box_height)
+    return None
+
+
+def read_image_size(path):
+    """
+    이미지 헤더에서 (너비, 높이) 읽기 (디코딩하지 않음)
+
+    Returns:
+        (너비, 높이) 또는 알 수 없는 형식이면 None
+    """
+    with open(path, 'rb') as f:
+        data = f.read(HEADER_BYTES)
+    try:
+        if data.startswith(b'\x89PNG\r\n\x1a\n'):
+            return _png_size(data)
+        if data.startswith(b'\xff\xd8'):
+            return _jpeg_size(data)
+        if data[:6] in (b'GIF87a', b'GIF89a'):
+            return _gif_size(data)
+        if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+            return _webp_size(data)
+        if data[4:8] == b'ftyp' and data[8:12] in (b'avif', b'avis'):
+            return _avif_size(data)
+        if Path(path).suffix.lower() == '.svg':
+            return _svg_size(data)
+    except struct.error:
+        return None
+    return None
+
+
+def compute_placeholder(path):
+    """
+    대표 색상과 흐린 미리보기(data URI) 계산 (Pillow 필요)
+    JPEG는 draft 모드로 1/8 크기까지 줄여 디코딩하므로 원본 전체를 디코딩하지 않음
+
+    Returns:
+        {'color': '#rrggbb', 'lqip': 'data:image/...' 또는 None}
+        투명도가 있는 이미지는 배경이 비치므로 None
+    """
+    with Image.open(path) as image:
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            return None
+        width, height = image.size
+        scale = LQIP_SIZE / max(width, height)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        image.draft('RGB', size)
+        small = image.convert('RGB')
+        small.thumbnail(size, Image.BILINEAR)
+
+    red, green, blue = small.resize((1, 1), Image.BOX).getpixel((0, 0))
+    placeholder = {'color': f"#{red:02x}{green:02x}{blue:02x}", 'lqip': None}
+    if min(width, height) >= LQIP_MIN_SIDE:
+        # 16px WebP는 100바이트 안팎 (JPEG는 양자화 테이블 때문에 300바이트 이상)
+        fmt = 'webp' if features.check('webp') else 'jpeg'
+        buffer = io.BytesIO()
+        small.save(buffer, fmt.upper(), quality=LQIP_QUALITY)
+        placeholder['lqip'] = f"data:image/{fmt};base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+    return placeholder
+
+
+def load_placeholders(cache_path):
+    """플레이스홀더 캐시 읽기 (없거나 버전이 다르면 빈 캐시)"""
+    cache_path = Path(cache_path)
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == PLACEHOLDER_VERSION:
+                return cache
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable placeholder cache {cache_path}: {e}")
+    return {'version': PLACEHOLDER_VERSION, 'images': {}}
+
+
+def save_placeholders(cache_path, cache):
+    """플레이스홀더 캐시 저장"""
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def image_placeholder(path, cache, stats=None):
+    """
+    내용 해시로 캐시된 플레이스홀더 (없으면 Pillow로 계산하여 캐시에 추가)
+    SVG나 Pillow가 없는 환경에서 캐시에 없는 이미지는 None
+    """
+    if Path(path).suffix.lower() == '.svg':
+        return None
+    digest = content_hash(Path(path).read_bytes())
+    if digest in cache['images']:
+        return cache['images'][digest]
+    if Image is None:
+        if stats is not None:
+            stats['uncached'] += 1
+        return None
+    try:
+        placeholder = compute_placeholder(path)
+    except Exception as e:
+        print(f"  [WARN] Placeholder failed for {path}: {e}")
+        return None
+    cache['images'][digest] = placeholder
+    if stats is not None:
+        stats['computed'] += 1
+    return placeholder
+
+
+def parse_attributes(tag):
+    """태그 문자열의 속성 딕셔너리 (이름은 원래 대소문자 유지)"""
+    body = re.sub(r'^<\w+|/?>$', '', tag)
+    attributes = {}
+    for match in ATTRIBUTE_PATTERN.finditer(body):
+        name, *values = match.groups()
+        value = next((v for v in values if v is not None), '')
+        attributes.setdefault(name, value)
+    return attributes
+
+
+def placeholder_style(placeholder):
+    """플레이스홀더 배경 CSS (이미지가 로드되면 이미지에 가려짐)"""
+    if placeholder['lqip']:
+        return f"background:{placeholder['color']} url({placeholder['lqip']}) center/cover no-repeat"
+    return f"background-color:{placeholder['color']}"
+
+
+def new_stats():
+    return {'images': 0, 'sized': 0, 'lazy': 0, 'placeholders': 0, 'computed': 0, 'uncached': 0, 'missing': []}
+
+
+def inject_image_attributes(text, site_path, resolve, cache, stats=None):
+    """
+    HTML의 <img> 태그에 width/height, loading/decoding, 플레이스홀더 style 추가
+    이미 있는 속성은 덮어쓰지 않음
+
+    Args:
+        text: HTML 문자열
+        site_path: HTML의 사이트 경로 (상대 경로 해석용)
+        resolve: (참조 경로, site_path) -> 이미지 파일 경로 또는 None
+        cache: load_placeholders()로 읽은 플레이스홀더 캐시
+        stats: new_stats() 통계 (선택)
+
+    Returns:
+        속성이 추가된 HTML 문자열
+    """
+    if stats is None:
+        stats = new_stats()
+
+    def replace(match):
+        tag = match.group(0)
+        attributes = {name.lower(): value for name, value in parse_attributes(tag).items()}
+        stats['images'] += 1
+        # main.js의 지연 로딩(data-src) 이미지도 원본 크기를 사용
+        url = attributes.get('src') or attributes.get('data-src')
+        path = resolve(url, site_path) if url and not url.startswith('data:') else None
+        if path is None:
+            if url:
+                stats['missing'].append(url)
+            return tag
+
+        added = []
+        size = read_image_size(path)
+        if size and 'width' not in attributes and 'height' not in attributes:
+            added.append(f'width="{size[0]}" height="{size[1]}"')
+            stats['sized'] += 1
+        # 첫 화면 이미지는 loading="eager" 또는 fetchpriority="high"로 표시
+        if 'loading' not in attributes and attributes.get('fetchpriority') != 'high':
+            added.append('loading="lazy"')
+            stats['lazy'] += 1
+        if 'decoding' not in attributes:
+            added.append('decoding="async"')
+        if 'style' not in attributes:
+            placeholder = image_placeholder(path, cache, stats)
+            if placeholder:
+                added.append(f'style="{placeholder_style(placeholder)}"')
+                stats['placeholders'] += 1
+
+        if not added:
+            return tag
+        closing = ' />' if tag.endswith('/>') else '>'
+        head = tag[:-len(closing.strip())].rstrip()
+        return f"{head} {' '.join(added)}{closing}"
+
+    return IMG_TAG_PATTERN.sub(replace, text)
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+    if Image is None:
+        print("필요한 라이브러리를 설치해주세요:")
+        print("pip install Pillow")
+        sys.exit(1)
+
+    from asset_graph import resolve_reference
+    from build_assets import collect_files
+
+    files = collect_files(project_root)
+
+    def resolve(url, site_path):
+        resolved, _ = resolve_reference(url, site_path)
+        return files.get(resolved)
+
+    cache_path = project_root / PLACEHOLDER_CACHE
+    cache = load_placeholders(cache_path)
+    print("Injecting <img> attributes...")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    stats = new_stats()
+    for site_path, path in files.items():
+        if PurePosixPath(site_path).suffix.lower() != '.html':
+            continue
+        before = stats['images']
+        inject_image_attributes(path.read_text(encoding='utf-8'), site_path, resolve, cache, stats)
+        print(f"  [OK] {site_path}: {stats['images'] - before} images")
+    elapsed = time.perf_counter() - start
+
+    for url in stats['missing']:
+        print(f"  [WARN] Image not found: {url}")
+
+    save_placeholders(cache_path, cache)
+    print("\n" + "=" * 60)
+    print(f"[SUMMARY] {stats['images']} images: {stats['sized']} sized, {stats['lazy']} lazy, "
+          f"{stats['placeholders']} placeholders ({stats['computed']} computed) in {elapsed * 1000:.0f} ms")
+    print(f"[INFO] Placeholder cache: {cache_path}")
+
+
+if __name__ == "__main__":
+    main()
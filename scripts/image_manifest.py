@@ -0,0 +1,214 @@
+"""
+추출 이미지 매니페스트 관리
+같은 내용(BLAKE2 해시)의 이미지는 한 번만 저장하고,
+다른 페이지에서 나온 동일 이미지는 매니페스트에 별칭(alias)으로 기록
+
+매니페스트 형식 (assets/images/other/image-manifest.json):
+    {
+      "version": 1,
+      "images": {
+        "<blake2b 해시>": {
+          "file": "page7_img1_1622x912.jpeg",
+          "size": 166249,
+          "aliases": ["page23_img1_1622x912.jpeg"]
+        }
+      }
+    }
+
+사용법 (기존 폴더의 중복 파일 정리):
+    python scripts/image_manifest.py
+"""
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+MANIFEST_NAME = "image-manifest.json"
+IMAGE_PATTERNS = ('*.png', '*.jpg', '*.jpeg')
+
+
+def content_hash(data):
+    """이미지 바이트의 BLAKE2 해시 (128bit hex)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_hash(path):
+    """파일 내용의 BLAKE2 해시"""
+    return content_hash(Path(path).read_bytes())
+
+
+def load_manifest(directory):
+    """디렉토리의 매니페스트를 읽기 (없으면 빈 매니페스트)"""
+    manifest_path = Path(directory) / MANIFEST_NAME
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'version': 1, 'images': {}}
+
+
+def save_manifest(directory, manifest):
+    """매니페스트를 디렉토리에 저장"""
+    manifest_path = Path(directory) / MANIFEST_NAME
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def register_image(manifest, digest, filename, size, directory, pending=()):
+    """
+    이미지를 매니페스트에 등록
+
+    Args:
+        pending: 쓰기가 예약되어 아직 디스크에 없는 파일명 (존재하는 것으로 간주)
+
+    Returns:
+        (대표 파일명, 새로 저장해야 하는지 여부)
+        이미 같은 해시의 파일이 디스크에 있으면 filename을 별칭으로 기록하고 False 반환
+    """
+    entry = manifest['images'].get(digest)
+    if entry is None:
+        _forget_filename(manifest, filename)
+        manifest['images'][digest] = {'file': filename, 'size': size, 'aliases': []}
+        return filename, True
+
+    canonical = entry['file']
+    if canonical == filename:
+        return filename, True
+
+    if canonical not in pending and not (Path(directory) / canonical).exists():
+        # 대표 파일이 지워졌으면 현재 파일을 새 대표로 승격
+        entry['aliases'].append(canonical)
+        entry['file'] = filename
+        if filename in entry['aliases']:
+            entry['aliases'].remove(filename)
+        return filename, True
+
+    if filename not in entry['aliases']:
+        _forget_filename(manifest, filename)
+        entry['aliases'].append(filename)
+        entry['aliases'].sort(key=image_sort_key)
+    return canonical, False
+
+
+def _forget_filename(manifest, filename):
+    """다른 내용으로 덮어쓰게 된 파일명을 기존 항목에서 제거"""
+    for digest, entry in list(manifest['images'].items()):
+        if filename in entry['aliases']:
+            entry['aliases'].remove(filename)
+        if entry['file'] == filename:
+            # 별칭은 디스크에 없으므로 대표 파일과 함께 무효화
+            del manifest['images'][digest]
+
+
+def drop_stale_names(manifest, directory, is_current):
+    """
+    is_current(파일명)이 False인 이름을 매니페스트에서 제거
+    대표 파일명이 제거되면 남은 별칭 중 첫 이름으로 파일을 옮겨 대표로 승격하고,
+    남은 이름이 없으면 항목과 파일을 삭제
+
+    Returns:
+        제거한 이름 수
+    """
+    directory = Path(directory)
+    removed = 0
+    for digest, entry in list(manifest['images'].items()):
+        aliases = [alias for alias in entry['aliases'] if is_current(alias)]
+        removed += len(entry['aliases']) - len(aliases)
+        entry['aliases'] = aliases
+        if is_current(entry['file']):
+            continue
+        removed += 1
+        stale_path = directory / entry['file']
+        if aliases:
+            entry['file'] = aliases.pop(0)
+            if stale_path.exists():
+                stale_path.replace(directory / entry['file'])
+        else:
+            stale_path.unlink(missing_ok=True)
+            del manifest['images'][digest]
+    return removed
+
+
+def alias_map(manifest):
+    """{별칭 파일명: 대표 파일명} 딕셔너리"""
+    aliases = {}
+    for entry in manifest['images'].values():
+        for alias in entry['aliases']:
+            aliases[alias] = entry['file']
+    return aliases
+
+
+def list_extracted_images(directory):
+    """
+    추출 이미지 목록을 별칭까지 포함하여 반환
+
+    Returns:
+        {파일 경로: 실제 파일 경로} 딕셔너리.
+        별칭은 디스크에 없으므로 실제 파일 경로가 대표 파일을 가리킴
+    """
+    directory = Path(directory)
+    files = {}
+    for pattern in IMAGE_PATTERNS:
+        for path in directory.glob(pattern):
+            files[path] = path
+
+    for alias, canonical in alias_map(load_manifest(directory)).items():
+        canonical_path = directory / canonical
+        if canonical_path.exists() and (directory / alias) not in files:
+            files[directory / alias] = canonical_path
+
+    return dict(sorted(files.items(), key=lambda item: image_sort_key(item[0].name)))
+
+
+def image_sort_key(filename):
+    """page3_img39 형태의 파일명을 (페이지, 이미지 번호) 순서로 정렬하는 키"""
+    match = re.match(r'page(\d+)_img(\d+)', filename)
+    if match:
+        return (int(match.group(1)), int(match.group(2)), filename)
+    return (sys.maxsize, sys.maxsize, filename)
+
+
+def dedupe_directory(directory):
+    """
+    이미 추출된 폴더의 중복 파일을 정리
+    페이지 순서상 가장 앞선 파일을 대표로 남기고 나머지는 삭제 후 별칭으로 기록
+
+    Returns:
+        (삭제한 파일 수, 절약한 바이트 수)
+    """
+    directory = Path(directory)
+    manifest = load_manifest(directory)
+    files = [path for path in list_extracted_images(directory).values()]
+    files = sorted(set(files), key=lambda path: image_sort_key(path.name))
+
+    removed = 0
+    saved_bytes = 0
+    for path in files:
+        size = path.stat().st_size
+        canonical, is_new = register_image(manifest, file_hash(path), path.name, size, directory)
+        if not is_new:
+            path.unlink()
+            removed += 1
+            saved_bytes += size
+            print(f"  [ALIAS] {path.name} -> {canonical}")
+
+    save_manifest(directory, manifest)
+    return removed, saved_bytes
+
+
+if __name__ == "__main__":
+    project_root = Path(__file__).parent.parent
+    other_dir = project_root / "assets" / "images" / "other"
+
+    if not other_dir.exists():
+        print(f"[ERROR] Directory not found: {other_dir}")
+        sys.exit(1)
+
+    print(f"Deduplicating images in {other_dir}")
+    print("=" * 60)
+    removed, saved_bytes = dedupe_directory(other_dir)
+    print("\n" + "=" * 60)
+    print(f"[DONE] {removed} duplicate files replaced by aliases ({saved_bytes / 1024:.0f} KB saved)")
+    print(f"[INFO] Manifest: {other_dir / MANIFEST_NAME}")
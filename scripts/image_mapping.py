@@ -0,0 +1,261 @@
+"""
+이미지 매핑 규칙 해석
+매핑 스크립트(organize_images.py, map_mockups_only.py, smart_map_images.py, auto_map_images.py)의 규칙을
+assets/images/image-mapping.json에 모아 두고, 추출 폴더(assets/images/other)의 정확한 색인으로 찾음
+
+색인은 파일명(page3_img39_2080x1234.jpeg)의 (페이지, 이미지 번호)와 이미지 매니페스트의 내용 해시로 만들며,
+규칙마다 딕셔너리 조회 한 번으로 해석함 (page1_img1 규칙이 page1_img12에 잘못 매칭되지 않음)
+
+규칙 형식 (세트별 목록):
+    {
+      "version": 1,
+      "sets": {
+        "mockups": [
+          {"target": "hero/main-hero.jpeg", "page": 3, "image": 39, "hash": "<blake2b 해시>", "note": "..."}
+        ]
+      }
+    }
+
+- hash가 있으면 내용 해시로 먼저 찾으므로, 기획서를 다시 추출해 번호가 바뀌어도 같은 이미지를 찾음
+- hash로 찾지 못하면 (page, image)로 찾고 경고 (내용이 바뀐 이미지)
+- "fallback": "page"인 규칙은 정확한 이미지가 없을 때 같은 페이지의 가장 큰 이미지를 사용
+- 찾은 이미지는 복사하지 않고 내용 주소 저장소(blob_store.py)를 거쳐 하드링크/reflink로 배치
+
+사용법 (현재 해석되는 이미지의 해시를 규칙에 기록):
+    python scripts/image_mapping.py --pin
+    python scripts/image_mapping.py --pin -s mockups
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from blob_store import BlobStore
+from image_manifest import file_hash, list_extracted_images, load_manifest
+
+MAPPING_CONFIG = "assets/images/image-mapping.json"
+MAPPING_VERSION = 1
+# 추출 이미지 파일명 (page3_img39 또는 page3_img39_2080x1234)
+EXTRACTED_NAME_PATTERN = re.compile(r'page(\d+)_img(\d+)(?:_(\d+)x(\d+))?')
+
+
+def load_config(project_root):
+    """매핑 규칙 읽기"""
+    with open(Path(project_root) / MAPPING_CONFIG, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if config.get('version') != MAPPING_VERSION:
+        raise ValueError(f"unsupported mapping config version: {config.get('version')}")
+    return config
+
+
+def save_config(project_root, config):
+    """매핑 규칙 저장"""
+    with open(Path(project_root) / MAPPING_CONFIG, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def parse_extracted_name(path):
+    """파일명에서 (페이지, 이미지 번호, 너비, 높이) (형식이 다르면 None)"""
+    match = EXTRACTED_NAME_PATTERN.fullmatch(Path(path).stem)
+    if match is None:
+        return None
+    page, image, width, height = match.groups()
+    return int(page), int(image), int(width) if width else None, int(height) if height else None
+
+
+def build_index(directory):
+    """
+    추출 폴더의 색인
+
+    Returns:
+        {'files': {경로: 실제 파일 경로},
+         'by_key': {(페이지, 이미지 번호): [경로, ...]},
+         'by_hash': {내용 해시: 경로},
+         'by_page': {페이지: [경로, ...]} (면적 큰 순),
+         'by_stem': {소문자 파일명(확장자 제외): 경로},
+         'hashes': {경로: 내용 해시}}
+    """
+    directory = Path(directory)
+    files = list_extracted_images(directory)
+    # 매니페스트에 기록된 해시를 사용하고, 없는 파일만 직접 계산
+    hash_by_name = {}
+    for digest, entry in load_manifest(directory)['images'].items():
+        for name in [entry['file']] + entry['aliases']:
+            hash_by_name[name] = digest
+
+    index = {'files': files, 'by_key': {}, 'by_hash': {}, 'by_page': {}, 'by_stem': {}, 'hashes': {}}
+    areas = {}
+    for path, real_path in files.items():
+        digest = hash_by_name.get(path.name) or file_hash(real_path)
+        index['hashes'][path] = digest
+        # 같은 내용의 별칭이 여러 개면 페이지 순서상 첫 파일 (files는 페이지 순으로 정렬됨)
+        index['by_hash'].setdefault(digest, path)
+        index['by_stem'].setdefault(path.stem.lower(), path)
+        parsed = parse_extracted_name(path)
+        if parsed is None:
+            continue
+        page, image, width, height = parsed
+        index['by_key'].setdefault((page, image), []).append(path)
+        index['by_page'].setdefault(page, []).append(path)
+        areas[path] = (width or 0) * (height or 0)
+    for paths in index['by_page'].values():
+        paths.sort(key=lambda path: areas[path], reverse=True)
+    return index
+
+
+def rule_label(rule):
+    """출력용 규칙 이름 (page3_img39)"""
+    if 'page' in rule and 'image' in rule:
+        return f"page{rule['page']}_img{rule['image']}"
+    return rule.get('hash', '?')[:12]
+
+
+def resolve_rule(rule, index):
+    """
+    규칙에 해당하는 추출 이미지 찾기
+
+    Returns:
+        (경로 또는 None, 해석 방법, 경고 메시지 또는 None)
+        해석 방법: 'exact' (번호와 해시 일치), 'hash' (번호가 바뀐 같은 이미지), 'position' (번호만 일치),
+        'fallback' (같은 페이지의 가장 큰 이미지), None (찾지 못함)
+    """
+    digest = rule.get('hash')
+    candidates = index['by_key'].get((rule.get('page'), rule.get('image')), [])
+    warning = None
+    if digest:
+        for path in candidates:
+            if index['hashes'][path] == digest:
+                return path, 'exact', None
+        if digest in index['by_hash']:
+            return index['by_hash'][digest], 'hash', None
+        warning = f"content hash {digest[:12]} not found"
+
+    if candidates:
+        path = candidates[0]
+        if digest:
+            warning += f", using {path.name} by position (image changed?)"
+        return path, 'position', warning
+
+    if rule.get('fallback') == 'page' and index['by_page'].get(rule.get('page')):
+        path = index['by_page'][rule['page']][0]
+        message = f"exact match not found for {rule_label(rule)}, using {path.name}"
+        return path, 'fallback', f"{warning}; {message}" if warning else message
+    return None, None, warning
+
+
+def target_path(target_root, target, source):
+    """타겟 경로 (실제 소스 파일 확장자와 다르면 소스 확장자로 변경)"""
+    path = Path(target_root) / target
+    if source.suffix.lower() != path.suffix.lower():
+        return path.with_suffix(source.suffix.lower())
+    return path
+
+
+def apply_rules(rules, index, target_root, store):
+    """
+    규칙에 따라 추출 이미지를 타겟 폴더에 배치 (store: blob_store.BlobStore)
+
+    Returns:
+        (성공 수, 실패 수)
+    """
+    mapped_count = 0
+    failed_count = 0
+    for rule in rules:
+        source, method, warning = resolve_rule(rule, index)
+        if warning:
+            print(f"  [WARN] {rule['target']}: {warning}")
+        if source is None:
+            print(f"  [FAIL] Could not find image for {rule_label(rule)} -> {rule['target']}")
+            failed_count += 1
+            continue
+
+        target = target_path(target_root, rule['target'], source)
+        if target.name != Path(rule['target']).name:
+            print(f"  [INFO] Adjusting extension: {Path(rule['target']).name} -> {target.name}")
+        try:
+            placed = store.place(index['files'][source], target, index['hashes'][source])
+        except OSError as e:
+            print(f"  [FAIL] Could not copy {source.name}: {e}")
+            failed_count += 1
+            continue
+
+        parsed = parse_extracted_name(source)
+        size_info = f" ({parsed[2]}x{parsed[3]}px)" if parsed and parsed[2] else ""
+        # 번호가 바뀐 이미지를 해시로 찾은 경우 표시
+        via = f" [by hash, was {rule_label(rule)}]" if method == 'hash' and 'page' in rule else ""
+        print(f"  [OK] Mapped: {source.name}{size_info} -> {target.relative_to(target_root).as_posix()}{via} "
+              f"({placed})")
+        mapped_count += 1
+    return mapped_count, failed_count
+
+
+def run_mapping_set(project_root, set_name):
+    """
+    설정의 규칙 세트 하나를 적용 (매핑 스크립트 공용 진입점)
+
+    Returns:
+        (성공 수, 실패 수)
+    """
+    project_root = Path(project_root)
+    images_root = project_root / "assets" / "images"
+    rules = load_config(project_root)['sets'][set_name]
+    index = build_index(images_root / "other")
+    print(f"Found {len(index['files'])} extracted images in other/ folder\n")
+    store = BlobStore(project_root)
+    counts = apply_rules(rules, index, images_root, store)
+    print(f"\n[INFO] Placement: {store.summary()}")
+    return counts
+
+
+def pin_hashes(project_root, set_names=None):
+    """
+    현재 (페이지, 이미지 번호)로 해석되는 이미지의 내용 해시를 규칙에 기록
+
+    Returns:
+        기록한 규칙 수
+    """
+    project_root = Path(project_root)
+    config = load_config(project_root)
+    index = build_index(project_root / "assets" / "images" / "other")
+    pinned = 0
+    for set_name, rules in config['sets'].items():
+        if set_names and set_name not in set_names:
+            continue
+        for rule in rules:
+            candidates = index['by_key'].get((rule.get('page'), rule.get('image')), [])
+            if not candidates:
+                print(f"  [SKIP] {set_name}: {rule_label(rule)} -> {rule['target']} (not extracted)")
+                continue
+            digest = index['hashes'][candidates[0]]
+            if rule.get('hash') != digest:
+                rule['hash'] = digest
+                pinned += 1
+                print(f"  [OK] {set_name}: {rule_label(rule)} -> {rule['target']} ({digest[:12]})")
+    save_config(project_root, config)
+    return pinned
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="이미지 매핑 규칙에 내용 해시 기록")
+    parser.add_argument('--pin', action='store_true', help="현재 해석되는 이미지의 해시를 규칙에 기록")
+    parser.add_argument('-s', '--set', action='append', dest='sets', help="대상 규칙 세트 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    if not args.pin:
+        parser.print_help()
+        sys.exit(1)
+
+    print("Pinning mapping rules to content hashes...")
+    print("=" * 60)
+    pinned = pin_hashes(project_root, args.sets)
+    print("\n" + "=" * 60)
+    print(f"[DONE] {pinned} rule(s) updated in {MAPPING_CONFIG}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ PDF에서 웹사이트에 실제로 필요한 이미지만 정확하게 추출
 1. 페이지별 우선순위 기반 추출
 2. 이미지 위치 분석 (페이지 상단/중앙 = 주요 이미지)
 3. 비율 분석 (웹 목업은 보통 가로형)
-4. 중복 이미지 제거
+4. 중복 이미지 제거 (지각 해시 기반 유사 이미지 탐지)
 """
 
 import os
@@ -14,26 +14,11 @@ import sys
 from pathlib import Path
 from collections import defaultdict
 
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    print("필요한 라이브러리를 설치해주세요:")
-    print("pip install PyMuPDF")
-    sys.exit(1)
+from near_duplicates import DEFAULT_THRESHOLD, BKTree, perceptual_hash, print_clusters
+from pdf_catalog import ImageWriter, min_area_filter, page_stream, record_bytes, release_bytes
 
-def get_image_size_from_bytes(image_bytes, base_image_meta):
-    """이미지 메타데이터에서 크기 추출 (Pillow 없이)"""
-    # 먼저 메타데이터에서 크기 확인
-    width = base_image_meta.get("width", 0)
-    height = base_image_meta.get("height", 0)
-    
-    # 메타데이터에 없으면 None 반환 (PDF 좌표에서 추정하도록)
-    if width > 0 and height > 0:
-        return width, height
-    
-    return None, None
-
-def extract_priority_images(pdf_path, output_dir, min_area=50000):
+def extract_priority_images(pdf_path, output_dir, min_area=50000, catalog=None, workers=1,
+                            duplicate_threshold=DEFAULT_THRESHOLD):
     """
     우선순위 기반 이미지 추출
     
@@ -41,6 +26,9 @@ def extract_priority_images(pdf_path, output_dir, min_area=50000):
         pdf_path: PDF 파일 경로
         output_dir: 이미지를 저장할 디렉토리
         min_area: 최소 이미지 면적 (width * height)
+        catalog: 미리 생성한 이미지 카탈로그 (없으면 새로 생성)
+        workers: 카탈로그 생성 시 사용할 프로세스 수
+        duplicate_threshold: 유사 이미지로 볼 지각 해시 최대 해밍 거리
     """
     output_path = Path(output_dir) / "other"
     output_path.mkdir(parents=True, exist_ok=True)
@@ -67,98 +55,43 @@ def extract_priority_images(pdf_path, output_dir, min_area=50000):
         18: 2,
     }
     
-    # 이미지 저장 (중복 체크용)
-    seen_images = {}  # (width, height, page_y) -> filename
+    # 이미지 저장 (중복 체크용) - 지각 해시 -> filename
+    seen_images = BKTree()
+    phash_cache = {}  # content_hash -> 지각 해시 (같은 내용은 한 번만 계산)
+    clusters = defaultdict(list)  # 저장된 파일명 -> 유사 이미지로 제외된 파일명
     
     try:
-        pdf_document = fitz.open(pdf_path)
+        page_count, pages = page_stream(pdf_path, catalog=catalog, workers=workers)
         image_count = 0
         skipped_count = 0
+        writer = ImageWriter()
+        accept = min_area_filter(min_area)
         
         print(f"Opening PDF: {pdf_path}")
-        print(f"Total pages: {len(pdf_document)}")
+        print(f"Total pages: {page_count}")
         print(f"Minimum area: {min_area} pixels")
         print("=" * 60)
         
-        # 페이지별로 이미지 수집 및 정렬
-        page_images = defaultdict(list)
-        
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            image_list = page.get_images(full=True)
+        # 페이지 단위로 면적 필터 적용 후 정렬하고 추출
+        # 우선순위가 높고, 면적이 크고, 상단에 위치한 이미지 우선
+        for page_info, records, errors in pages:
+            page_num = page_info['page'] - 1
             
-            priority = page_priority.get(page_num + 1, 10)  # 기본값 10
+            for _, img_num, error in errors:
+                print(f"  [WARN] Page {page_num + 1} img {img_num}: {error}")
             
-            for img_index, img in enumerate(image_list):
-                try:
-                    xref = img[0]
-                    base_image = pdf_document.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
-                    # 실제 이미지 크기 가져오기
-                    width, height = get_image_size_from_bytes(image_bytes, base_image)
-                    
-                    # 메타데이터에서 크기를 가져올 수 없으면 PDF 좌표에서 추정
-                    if width is None or height is None or width == 0 or height == 0:
-                        img_rects = page.get_image_rects(xref)
-                        if img_rects:
-                            rect = img_rects[0]
-                            width_pdf = rect.x1 - rect.x0
-                            height_pdf = rect.y1 - rect.y0
-                            
-                            # 페이지 크기와 비교하여 실제 픽셀 크기 추정
-                            page_rect = page.rect
-                            # PDF는 보통 72 DPI이지만, 실제 해상도는 더 높을 수 있음
-                            # 이미지가 페이지에서 차지하는 비율을 계산
-                            if page_rect.width > 0 and page_rect.height > 0:
-                                width_ratio = width_pdf / page_rect.width
-                                height_ratio = height_pdf / page_rect.height
-                                # 페이지가 960x540 (PDF 분석 결과)라고 가정하고 실제 픽셀 계산
-                                estimated_page_width = 960
-                                estimated_page_height = 540
-                                width = int(width_ratio * estimated_page_width * 1.5)  # 1.5배로 실제 해상도 추정
-                                height = int(height_ratio * estimated_page_height * 1.5)
-                            else:
-                                # DPI 변환 (PDF는 보통 72 DPI, 실제는 더 높을 수 있음)
-                                width = int(width_pdf * 1.5)
-                                height = int(height_pdf * 1.5)
-                    
-                    # 면적 필터링
-                    area = width * height
-                    if area < min_area:
-                        skipped_count += 1
-                        continue
-                    
-                    # 이미지 위치 정보
-                    img_rects = page.get_image_rects(xref)
-                    page_y = 0
-                    if img_rects:
-                        rect = img_rects[0]
-                        page_y = rect.y0  # 페이지 상단에서의 거리
-                    
-                    # 이미지 정보 저장
-                    page_images[page_num].append({
-                        'xref': xref,
-                        'index': img_index,
-                        'bytes': image_bytes,
-                        'ext': image_ext,
-                        'width': width,
-                        'height': height,
-                        'area': area,
-                        'y_pos': page_y,
-                        'priority': priority,
-                        'ratio': width / height if height > 0 else 0
-                    })
-                    
-                except Exception as e:
-                    print(f"  [WARN] Page {page_num + 1} img {img_index + 1}: {e}")
+            images = []
+            for record in records:
+                if not accept(record):
+                    skipped_count += 1
                     continue
-        
-        # 페이지별로 정렬하고 추출
-        # 우선순위가 높고, 면적이 크고, 상단에 위치한 이미지 우선
-        for page_num in sorted(page_images.keys()):
-            images = page_images[page_num]
+                img_info = dict(record)
+                img_info['priority'] = page_priority.get(record['page'], 10)  # 기본값 10
+                img_info['ratio'] = record['aspect_ratio']
+                images.append(img_info)
+            
+            if not images:
+                continue
             
             # 정렬: 우선순위 -> 면적 -> 위치(상단 우선)
             images.sort(key=lambda x: (-x['priority'], -x['area'], x['y_pos']))
@@ -171,30 +104,43 @@ def extract_priority_images(pdf_path, output_dir, min_area=50000):
                 area = img_info['area']
                 ratio = img_info['ratio']
                 
-                # 중복 체크 (비슷한 크기의 이미지 제외)
-                key = (width, height, int(img_info['y_pos'] / 100) * 100)  # 100px 단위로 그룹화
-                if key in seen_images:
+                # 중복 체크 (재인코딩/리사이즈된 같은 이미지 제외)
+                # 면적 필터를 통과한 이미지만 여기서 처음 스트림을 읽음
+                phash = None
+                try:
+                    data = record_bytes(img_info)
+                    phash = phash_cache.get(img_info['content_hash'])
+                    if phash is None:
+                        phash = phash_cache[img_info['content_hash']] = perceptual_hash(data)
+                except Exception as e:
+                    print(f"  [WARN] img{img_info['index'] + 1}: perceptual hash failed ({e})")
+                
+                matches = seen_images.search(phash, duplicate_threshold) if phash is not None else []
+                if matches:
+                    distance, similar_to = matches[0]
+                    release_bytes(img_info)
                     skipped_count += 1
-                    print(f"  [SKIP] img{img_info['index'] + 1}: Duplicate or similar to {seen_images[key]}")
+                    clusters[similar_to].append(f"page{page_num + 1}_img{img_info['index'] + 1}")
+                    print(f"  [SKIP] img{img_info['index'] + 1}: Duplicate or similar to {similar_to} (distance: {distance})")
                     continue
                 
-                # 파일명 생성
-                image_filename = f"page{page_num + 1}_img{img_info['index'] + 1}_{width}x{height}.{img_info['ext']}"
-                image_path = output_path / image_filename
-                
                 # 저장
-                with open(image_path, "wb") as image_file:
-                    image_file.write(img_info['bytes'])
+                image_filename, alias_of = writer.write(img_info, output_path)
                 
-                seen_images[key] = image_filename
+                if phash is not None:
+                    seen_images.add(phash, image_filename)
                 image_count += 1
                 
-                # 이미지 정보 출력
+                # 이미지 정보 출력 (같은 내용이 이미 저장되어 있으면 매니페스트에 별칭만 기록됨)
                 ratio_str = f"{ratio:.2f}" if ratio > 0 else "N/A"
-                print(f"  [OK] {image_filename}")
+                if alias_of:
+                    print(f"  [ALIAS] {image_filename} -> {alias_of}")
+                else:
+                    print(f"  [OK] {image_filename}")
                 print(f"    Size: {width}x{height}px (area: {area:,}) | Ratio: {ratio_str} | Y: {img_info['y_pos']:.0f}")
         
-        pdf_document.close()
+        writer.close()
+        image_count -= len(writer.failures)
         
         print("\n" + "=" * 60)
         print(f"[DONE] Extraction complete!")
@@ -202,6 +148,10 @@ def extract_priority_images(pdf_path, output_dir, min_area=50000):
         print(f"[INFO] {skipped_count} images filtered out (too small or duplicate).")
         print(f"[INFO] Save location: {output_dir}/other")
         
+        # 유사 이미지 묶음
+        print("\n[SUMMARY] Near-duplicate clusters:")
+        print_clusters([[kept] + skipped for kept, skipped in clusters.items()])
+        
         # 크기별 통계
         if image_count > 0:
             print("\n[SUMMARY] Images by size category:")
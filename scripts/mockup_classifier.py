@@ -0,0 +1,275 @@
+"""
+이미지 특징 기반 목업 판별
+pdf_catalog.is_web_mockup은 크기, 비율, 위치만 보므로 글자가 많은 가로형 기획 슬라이드도 목업으로 분류됨.
+후보 이미지를 같은 크기의 썸네일로 만들어 한 배열로 묶고, 다음 특징을 NumPy로 한 번에 계산하여 점수를 매김
+
+특징:
+    entropy       - 색상 엔트로피 (RGB 각 4bit 양자화, 0~1로 정규화) 게임 화면/사진은 높고 글자 슬라이드는 낮음
+    edge_density  - 밝기 변화가 큰 픽셀 비율
+    stroke_ratio  - 경계 중 양쪽 이웃보다 밝거나 어두운 얇은 선(글자 획)의 비율
+    flat_fraction - 밝기 변화가 거의 없는 픽셀 비율 (단색 배경)
+
+점수는 특징의 가중합을 로지스틱 함수로 0~1로 변환한 값이며, MOCKUP_THRESHOLD 이상이면 목업.
+특징은 내용 해시(BLAKE2)별로 캐시(assets/images/mockup-features.json)에 저장하므로
+기획서를 다시 추출해도 이미 계산한 이미지는 디코딩하지 않음
+
+사용법 (추출 폴더의 이미지 점수 확인):
+    python scripts/mockup_classifier.py
+    python scripts/mockup_classifier.py assets/images/other --threshold 0.6
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+try:
+    import fitz  # PyMuPDF
+    import numpy as np
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install PyMuPDF numpy")
+    sys.exit(1)
+
+from image_manifest import IMAGE_PATTERNS, file_hash, image_sort_key
+
+FEATURE_CACHE_NAME = "mockup-features.json"
+FEATURE_VERSION = 1
+FEATURE_NAMES = ('entropy', 'edge_density', 'stroke_ratio', 'flat_fraction')
+# 특징 계산용 썸네일 크기 (너비, 높이) - 모든 후보를 같은 크기로 만들어 한 배열로 계산
+THUMBNAIL_SIZE = (320, 192)
+# 한 번에 계산할 후보 수 (메모리 사용량 제한)
+BATCH_SIZE = 32
+# 엔트로피 계산용 색상 양자화 (채널당 bit 수)
+COLOR_BITS = 4
+# 밝기 차이 기준 (0~255)
+EDGE_THRESHOLD = 24
+FLAT_THRESHOLD = 3
+STROKE_THRESHOLD = 24
+# 점수 = sigmoid(SCORE_BIAS + sum(SCORE_WEIGHTS[특징] * 특징))
+# (추출 폴더의 목업/게임 이미지와 글자 위주 기획 슬라이드로 맞춘 값 - 글자 획 비율이 가장 큰 기준이고,
+#  단색 배경은 검은 배경 캐릭터 이미지에도 많으므로 약하게만 반영)
+SCORE_WEIGHTS = {'entropy': 2.0, 'edge_density': 2.0, 'stroke_ratio': -14.0, 'flat_fraction': -2.0}
+SCORE_BIAS = 5.0
+MOCKUP_THRESHOLD = 0.4
+
+
+def render_thumbnail(image_bytes, size=THUMBNAIL_SIZE):
+    """이미지 바이트를 size 크기의 RGB 배열 (높이, 너비, 3)로 변환"""
+    pix = fitz.Pixmap(image_bytes)
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.n != 3:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+
+    # 썸네일보다 작아지지 않는 범위에서 2의 거듭제곱 단위로 미리 축소
+    width, height = size
+    factor = 0
+    while pix.width >> (factor + 1) >= width and pix.height >> (factor + 1) >= height:
+        factor += 1
+    if factor:
+        pix.shrink(factor)
+
+    pixels = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+    pixels = pixels[:, :pix.width * 3].reshape(pix.height, pix.width, 3).astype(np.float32)
+    return _resize_mean(pixels, width, height)
+
+
+def _resize_mean(pixels, width, height):
+    """구간 평균으로 width x height 크기로 변환 (원본이 더 작은 축은 픽셀 반복)"""
+    rows = np.minimum(np.linspace(0, pixels.shape[0], height + 1).astype(int)[:-1], pixels.shape[0] - 1)
+    cols = np.minimum(np.linspace(0, pixels.shape[1], width + 1).astype(int)[:-1], pixels.shape[1] - 1)
+    summed = np.add.reduceat(np.add.reduceat(pixels, rows, axis=0), cols, axis=1)
+    # 원본이 작아 같은 시작점이 반복되는 구간은 reduceat이 시작 픽셀 하나를 돌려주므로 1픽셀로 계산
+    row_counts = np.diff(np.append(rows, pixels.shape[0])).clip(min=1)
+    col_counts = np.diff(np.append(cols, pixels.shape[1])).clip(min=1)
+    return summed / (row_counts[:, None, None] * col_counts[None, :, None])
+
+
+def batch_features(thumbnails):
+    """
+    썸네일 배열 묶음의 특징 계산
+
+    Args:
+        thumbnails: (N, 높이, 너비, 3) 배열
+
+    Returns:
+        (N, len(FEATURE_NAMES)) 배열 (FEATURE_NAMES 순서)
+    """
+    batch = np.asarray(thumbnails, dtype=np.float32)
+    count = batch.shape[0]
+    pixel_count = batch.shape[1] * batch.shape[2]
+
+    # 색상 엔트로피 - 이미지별 히스토그램을 오프셋을 더한 한 번의 bincount로 계산
+    levels = 1 << COLOR_BITS
+    quantized = (batch.clip(0, 255).astype(np.uint8) >> (8 - COLOR_BITS)).astype(np.int64)
+    bins = (quantized[..., 0] * levels + quantized[..., 1]) * levels + quantized[..., 2]
+    bins += (np.arange(count) * levels ** 3)[:, None, None]
+    histogram = np.bincount(bins.ravel(), minlength=count * levels ** 3).reshape(count, -1) / pixel_count
+    logs = np.log2(histogram, where=histogram > 0, out=np.zeros_like(histogram))
+    entropy = -(histogram * logs).sum(axis=1) / (3 * COLOR_BITS)
+
+    # 밝기 기울기 (가로/세로 이웃 차이 중 큰 값)
+    gray = batch @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    dx = gray[:, 1:-1, 2:] - gray[:, 1:-1, 1:-1]
+    dy = gray[:, 2:, 1:-1] - gray[:, 1:-1, 1:-1]
+    magnitude = np.maximum(np.abs(dx), np.abs(dy))
+    edges = magnitude > EDGE_THRESHOLD
+    edge_density = edges.mean(axis=(1, 2))
+    flat_fraction = (magnitude < FLAT_THRESHOLD).mean(axis=(1, 2))
+
+    # 얇은 선 - 양쪽 이웃보다 모두 밝거나 모두 어두운 픽셀 (경계의 한쪽 면인 계단과 구분)
+    center = gray[:, 1:-1, 1:-1]
+    strokes = np.zeros_like(edges)
+    for before, after in ((gray[:, 1:-1, :-2], gray[:, 1:-1, 2:]), (gray[:, :-2, 1:-1], gray[:, 2:, 1:-1])):
+        low, high = np.minimum(before, after), np.maximum(before, after)
+        strokes |= (center - high > STROKE_THRESHOLD) | (low - center > STROKE_THRESHOLD)
+    stroke_ratio = strokes.sum(axis=(1, 2)) / np.maximum((edges | strokes).sum(axis=(1, 2)), 1)
+
+    return np.stack([entropy, edge_density, stroke_ratio, flat_fraction], axis=1)
+
+
+def mockup_scores(features):
+    """특징 배열 (N, len(FEATURE_NAMES))의 목업 점수 (0~1)"""
+    weights = np.array([SCORE_WEIGHTS[name] for name in FEATURE_NAMES])
+    return 1.0 / (1.0 + np.exp(-(np.asarray(features) @ weights + SCORE_BIAS)))
+
+
+def load_feature_cache(cache_path):
+    """특징 캐시 읽기 (경로가 None이거나 파일이 없거나 버전/썸네일 크기가 다르면 빈 캐시)"""
+    if cache_path is not None and Path(cache_path).exists():
+        cache_path = Path(cache_path)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == FEATURE_VERSION and cache.get('thumbnail') == list(THUMBNAIL_SIZE):
+                return cache
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable feature cache {cache_path}: {e}")
+    return {'version': FEATURE_VERSION, 'thumbnail': list(THUMBNAIL_SIZE), 'features': {}}
+
+
+def save_feature_cache(cache_path, cache):
+    """특징 캐시 저장"""
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+
+def score_images(images, cache_path=None):
+    """
+    이미지 묶음의 목업 점수 계산 (캐시에 없는 이미지만 BATCH_SIZE개씩 썸네일로 만들어 계산)
+
+    Args:
+        images: [(내용 해시, 바이트를 반환하는 함수), ...]
+        cache_path: 특징 캐시 경로 (None이면 캐시 사용 안 함)
+
+    Returns:
+        {내용 해시: {'features': {특징: 값}, 'score': 점수}} (읽지 못한 이미지는 제외)
+    """
+    cache = load_feature_cache(cache_path)
+    known = cache['features']
+    missing = {}
+    for digest, load in images:
+        if digest not in known:
+            missing.setdefault(digest, load)
+
+    pending = list(missing.items())
+    for start in range(0, len(pending), BATCH_SIZE):
+        digests = []
+        thumbnails = []
+        for digest, load in pending[start:start + BATCH_SIZE]:
+            try:
+                thumbnails.append(render_thumbnail(load()))
+                digests.append(digest)
+            except Exception as e:
+                print(f"  [WARN] Could not render {digest[:12]}: {e}")
+        if not thumbnails:
+            continue
+        for digest, values in zip(digests, batch_features(np.stack(thumbnails))):
+            known[digest] = [round(float(value), 4) for value in values]
+
+    if cache_path and missing:
+        save_feature_cache(cache_path, cache)
+
+    wanted = [digest for digest, _ in images if digest in known]
+    if not wanted:
+        return {}
+    features = np.array([known[digest] for digest in wanted])
+    return {
+        digest: {'features': dict(zip(FEATURE_NAMES, known[digest])), 'score': float(score)}
+        for digest, score in zip(wanted, mockup_scores(features))
+    }
+
+
+def score_records(records, cache_path=None):
+    """
+    pdf_catalog 이미지 레코드의 목업 점수 (레코드 순서, 읽지 못한 이미지는 None)
+    점수를 계산한 뒤 레코드의 이미지 바이트는 해제함 (저장할 때 다시 읽음)
+    """
+    from pdf_catalog import record_bytes, release_bytes, resolve_content_hash
+
+    images = []
+    digests = []
+    for record in records:
+        try:
+            digest = resolve_content_hash(record)
+        except Exception as e:
+            print(f"  [WARN] Page {record['page']} img {record['index'] + 1}: {e}")
+            digests.append(None)
+            continue
+        digests.append(digest)
+        images.append((digest, lambda record=record: record_bytes(record)))
+
+    try:
+        scores = score_images(images, cache_path)
+    finally:
+        for record in records:
+            release_bytes(record)
+    return [scores[digest]['score'] if digest in scores else None for digest in digests]
+
+
+def format_features(features):
+    """출력용 특징 요약"""
+    return ", ".join(f"{name} {features[name]:.2f}" for name in FEATURE_NAMES)
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="이미지 특징 기반 목업 판별 점수 확인")
+    parser.add_argument('directory', nargs='?', default=project_root / "assets" / "images" / "other",
+                        type=Path, help="검사할 이미지 폴더")
+    parser.add_argument('-t', '--threshold', type=float, default=MOCKUP_THRESHOLD,
+                        help=f"목업으로 판별할 최소 점수 (기본값: {MOCKUP_THRESHOLD})")
+    parser.add_argument('--no-cache', action='store_true', help="특징 캐시를 사용하지 않음")
+    args = parser.parse_args()
+
+    files = sorted(
+        (path for pattern in IMAGE_PATTERNS for path in args.directory.glob(pattern)),
+        key=lambda path: image_sort_key(path.name),
+    )
+    print(f"Scoring {len(files)} images in {args.directory}")
+    print("=" * 60)
+
+    cache_path = None if args.no_cache else project_root / "assets" / "images" / FEATURE_CACHE_NAME
+    digests = {path: file_hash(path) for path in files}
+    scores = score_images([(digests[path], path.read_bytes) for path in files], cache_path)
+
+    mockup_count = 0
+    for path in files:
+        result = scores.get(digests[path])
+        if result is None:
+            continue
+        is_mockup = result['score'] >= args.threshold
+        mockup_count += is_mockup
+        category = "MOCKUP" if is_mockup else "PLANNING"
+        print(f"  [{category}] {path.name}: score {result['score']:.2f} ({format_features(result['features'])})")
+
+    print("\n" + "=" * 60)
+    print(f"[SUMMARY] {mockup_count} mockup(s), {len(scores) - mockup_count} planning graphic(s)")
+
+
+if __name__ == "__main__":
+    main()
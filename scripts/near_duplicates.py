@@ -0,0 +1,237 @@
+"""
+지각 해시(perceptual hash) 기반 유사 이미지 탐지
+재인코딩/리사이즈된 같은 이미지를 찾기 위해 축소한 그레이스케일 픽스맵에서
+aHash(평균 해시)와 dHash(차분 해시)를 NumPy로 계산하고,
+해밍 거리 검색은 BK-tree로 처리하여 이미지 수가 늘어나도 전수 비교를 피함
+
+사용법 (추출 폴더의 유사 이미지 묶음 출력):
+    python scripts/near_duplicates.py
+    python scripts/near_duplicates.py assets/images/other --threshold 10
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    import fitz  # PyMuPDF
+    import numpy as np
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install PyMuPDF numpy")
+    sys.exit(1)
+
+from image_manifest import IMAGE_PATTERNS, image_sort_key
+
+HASH_SIZE = 8  # 8x8 -> aHash 64bit, dHash 64bit
+# aHash + dHash 128bit 기준 허용 해밍 거리
+# (기존 추출 이미지로 측정: 재인코딩/축소본은 대부분 20 이하, 서로 다른 이미지는 30 이상)
+DEFAULT_THRESHOLD = 20
+# 여백 제거 기준 - 배경색과 이 값 이상 차이 나는 픽셀이 행/열의 1%를 넘어야 내용으로 간주
+TRIM_TOLERANCE = 24
+TRIM_FRACTION = 0.01
+
+
+def _grayscale_pixels(image_bytes, min_side=HASH_SIZE * 4):
+    """이미지 바이트를 축소된 그레이스케일 NumPy 배열로 변환"""
+    pix = fitz.Pixmap(image_bytes)
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.n != 1:
+        pix = fitz.Pixmap(fitz.csGRAY, pix)
+
+    # 해시에 필요한 크기까지 2의 거듭제곱 단위로 미리 축소 (평균 계산 비용 감소)
+    factor = 0
+    while min(pix.width, pix.height) >> (factor + 1) >= min_side:
+        factor += 1
+    if factor:
+        pix.shrink(factor)
+
+    pixels = np.frombuffer(pix.samples, dtype=np.uint8)
+    return pixels.reshape(pix.height, pix.stride)[:, :pix.width].astype(np.float32)
+
+
+def _trim_background(pixels):
+    """
+    단색 여백 제거
+    검은 배경 위 캐릭터처럼 여백이 넓은 이미지는 여백 때문에 해시가 서로 비슷해지므로
+    내용이 있는 영역만 남겨서 해시 계산
+    """
+    border = np.concatenate([pixels[0], pixels[-1], pixels[:, 0], pixels[:, -1]])
+    mask = np.abs(pixels - np.median(border)) > TRIM_TOLERANCE
+    rows = np.flatnonzero(mask.mean(axis=1) > TRIM_FRACTION)
+    cols = np.flatnonzero(mask.mean(axis=0) > TRIM_FRACTION)
+    if len(rows) < 2 or len(cols) < 2:
+        return pixels
+    return pixels[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+
+
+def _resize_mean(pixels, width, height):
+    """구간 평균으로 width x height 크기로 축소"""
+    rows = np.linspace(0, pixels.shape[0], height + 1).astype(int)
+    cols = np.linspace(0, pixels.shape[1], width + 1).astype(int)
+    # 각 구간이 최소 1픽셀이 되도록 보정 (아주 작은 이미지 대응)
+    rows = np.minimum(rows[:-1], pixels.shape[0] - 1)
+    cols = np.minimum(cols[:-1], pixels.shape[1] - 1)
+
+    summed = np.add.reduceat(np.add.reduceat(pixels, rows, axis=0), cols, axis=1)
+    row_counts = np.diff(np.append(rows, pixels.shape[0])).clip(min=1)
+    col_counts = np.diff(np.append(cols, pixels.shape[1])).clip(min=1)
+    return summed / np.outer(row_counts, col_counts)
+
+
+def _bits_to_int(bits):
+    """불리언 배열을 정수 해시로 변환"""
+    value = 0
+    for byte in np.packbits(bits.ravel()):
+        value = (value << 8) | int(byte)
+    return value
+
+
+def hash_from_pixels(pixels):
+    """그레이스케일 배열에서 (aHash << 64) | dHash 형태의 128bit 해시 계산"""
+    pixels = _trim_background(pixels)
+    small = _resize_mean(pixels, HASH_SIZE, HASH_SIZE)
+    ahash = _bits_to_int(small > small.mean())
+
+    wide = _resize_mean(pixels, HASH_SIZE + 1, HASH_SIZE)
+    dhash = _bits_to_int(wide[:, 1:] > wide[:, :-1])
+
+    return (ahash << (HASH_SIZE * HASH_SIZE)) | dhash
+
+
+def perceptual_hash(image_bytes):
+    """이미지 바이트의 지각 해시"""
+    return hash_from_pixels(_grayscale_pixels(image_bytes))
+
+
+def hamming_distance(a, b):
+    """두 해시의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+class BKTree:
+    """
+    해밍 거리용 BK-tree
+    삼각 부등식으로 탐색 범위를 줄여 반경 검색을 전수 비교보다 빠르게 처리
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, key, item):
+        """해시와 항목 추가"""
+        self.size += 1
+        if self.root is None:
+            self.root = (key, item, {})
+            return
+
+        node = self.root
+        while True:
+            distance = hamming_distance(key, node[0])
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (key, item, {})
+                return
+            node = child
+
+    def search(self, key, radius):
+        """key와의 거리가 radius 이하인 (거리, 항목) 목록 (가까운 순)"""
+        if self.root is None:
+            return []
+
+        matches = []
+        candidates = [self.root]
+        while candidates:
+            node_key, item, children = candidates.pop()
+            distance = hamming_distance(key, node_key)
+            if distance <= radius:
+                matches.append((distance, item))
+            for child_distance, child in children.items():
+                if distance - radius <= child_distance <= distance + radius:
+                    candidates.append(child)
+
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+    def __len__(self):
+        return self.size
+
+
+def find_clusters(hashes, threshold=DEFAULT_THRESHOLD):
+    """
+    유사 이미지 묶음 찾기
+
+    Args:
+        hashes: [(이름, 지각 해시), ...]
+        threshold: 같은 묶음으로 볼 최대 해밍 거리
+
+    Returns:
+        2개 이상으로 이루어진 묶음 목록 [[이름, ...], ...]
+    """
+    tree = BKTree()
+    parent = {}
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for name, phash in hashes:
+        parent[name] = name
+        for _, other in tree.search(phash, threshold):
+            root_a, root_b = find(name), find(other)
+            if root_a != root_b:
+                parent[root_b] = root_a
+        tree.add(phash, name)
+
+    clusters = {}
+    for name, _ in hashes:
+        clusters.setdefault(find(name), []).append(name)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def print_clusters(clusters):
+    """유사 이미지 묶음 출력"""
+    if not clusters:
+        print("[INFO] No near-duplicate clusters found.")
+        return
+
+    print(f"[INFO] {len(clusters)} near-duplicate cluster(s):")
+    for number, members in enumerate(clusters, 1):
+        print(f"  Cluster {number} ({len(members)} images):")
+        for name in members:
+            print(f"     - {name}")
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="지각 해시 기반 유사 이미지 탐지")
+    parser.add_argument('directory', nargs='?', default=project_root / "assets" / "images" / "other",
+                        type=Path, help="검사할 이미지 폴더")
+    parser.add_argument('-t', '--threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help=f"같은 묶음으로 볼 최대 해밍 거리 (기본값: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    files = sorted(
+        (path for pattern in IMAGE_PATTERNS for path in args.directory.glob(pattern)),
+        key=lambda path: image_sort_key(path.name),
+    )
+    print(f"Hashing {len(files)} images in {args.directory}")
+    print("=" * 60)
+
+    hashes = []
+    for path in files:
+        try:
+            hashes.append((path.name, perceptual_hash(path.read_bytes())))
+        except Exception as e:
+            print(f"  [WARN] {path.name}: {e}")
+
+    print_clusters(find_clusters(hashes, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
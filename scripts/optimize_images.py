@@ -0,0 +1,349 @@
+"""
+SSIM 기준 이미지 재압축 스크립트
+PDF에서 추출한 JPEG은 원본 작성자가 넣은 품질 그대로라 크기가 큼 (예: page4_img18_1616x730.jpeg 204 KB).
+이미지마다 인코더 품질을 이진 탐색하여 원본과의 SSIM(휘도, 11x11 가우시안 창, NumPy 벡터 연산)이
+TARGET_SSIM 이상인 가장 낮은 품질로 다시 저장함 (눈으로 구분되지 않는 가장 작은 파일)
+
+- 대상: 배포되는 이미지 폴더(hero, features, news)의 JPEG/WebP (경로를 지정하면 그 파일/폴더)
+- 원본과 같은 형식으로 다시 인코딩하고, JPEG은 원본의 크로마 서브샘플링과 ICC 프로필을 유지
+- MIN_SAVINGS 이상 줄지 않으면 원본을 그대로 둠
+- 결과는 원본 내용(BLAKE2 해시)별로 assets/images/image-optimization.json에 기록하여
+  이미 처리한 파일과 같은 원본은 다시 탐색하지 않음 (매핑 스크립트가 원본을 다시 복사해도 기록된 품질로 바로 저장)
+
+원본 파일을 덮어쓰므로, 이미지를 바꾼 뒤 실행하고 image_attributes.py로 플레이스홀더 캐시를 갱신하세요
+
+사용법:
+    python scripts/optimize_images.py
+    python scripts/optimize_images.py --dry-run
+    python scripts/optimize_images.py assets/images/other --target 0.995 --workers 4
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image, JpegImagePlugin
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install Pillow numpy")
+    sys.exit(1)
+
+from image_manifest import content_hash, file_hash
+
+# 기본 대상 폴더 (build_responsive_images.py와 같은 배포 이미지 폴더)
+SOURCE_FOLDERS = ('hero', 'features', 'news')
+FORMATS_BY_SUFFIX = {'.jpeg': 'JPEG', '.jpg': 'JPEG', '.webp': 'WEBP'}
+
+TARGET_SSIM = 0.99
+QUALITY_MIN = 40
+QUALITY_MAX = 95
+# 이만큼 이상 줄어야 다시 저장 (재압축으로 인한 손실 대비 이득이 작은 경우 제외)
+MIN_SAVINGS = 0.05
+
+# SSIM 계산 상수 (Wang et al. 2004)
+SSIM_WINDOW = 11
+SSIM_SIGMA = 1.5
+SSIM_K1 = 0.01
+SSIM_K2 = 0.03
+
+RECORD_FILE = "assets/images/image-optimization.json"
+RECORD_VERSION = 1
+
+
+def gaussian_kernel(size=SSIM_WINDOW, sigma=SSIM_SIGMA):
+    """정규화된 1차원 가우시안 커널"""
+    offsets = np.arange(size, dtype=np.float64) - (size - 1) / 2
+    kernel = np.exp(-(offsets ** 2) / (2 * sigma ** 2))
+    return kernel / kernel.sum()
+
+
+def gaussian_filter(values, kernel):
+    """분리 가능한 가우시안 필터 ('valid' 영역만, 커널 길이만큼 이동한 배열의 가중 합)"""
+    size = len(kernel)
+    height, width = values.shape
+    rows = np.zeros((height - size + 1, width), dtype=np.float64)
+    for i, weight in enumerate(kernel):
+        rows += weight * values[i:i + height - size + 1, :]
+    result = np.zeros((height - size + 1, width - size + 1), dtype=np.float64)
+    for i, weight in enumerate(kernel):
+        result += weight * rows[:, i:i + width - size + 1]
+    return result
+
+
+def ssim(reference, candidate, kernel=None):
+    """
+    두 휘도 배열(0~255)의 평균 SSIM
+
+    Args:
+        reference: 원본 휘도 (2차원 배열)
+        candidate: 비교할 휘도 (같은 크기)
+        kernel: gaussian_kernel() 결과 (반복 호출 시 재사용)
+    """
+    if kernel is None:
+        kernel = gaussian_kernel()
+    if min(reference.shape) < len(kernel):
+        # 창보다 작은 이미지는 전체를 한 창으로 계산
+        kernel = np.ones(min(reference.shape)) / min(reference.shape)
+    x = reference.astype(np.float64)
+    y = candidate.astype(np.float64)
+    c1 = (SSIM_K1 * 255) ** 2
+    c2 = (SSIM_K2 * 255) ** 2
+
+    mu_x = gaussian_filter(x, kernel)
+    mu_y = gaussian_filter(y, kernel)
+    mu_xx, mu_yy, mu_xy = mu_x * mu_x, mu_y * mu_y, mu_x * mu_y
+    sigma_xx = gaussian_filter(x * x, kernel) - mu_xx
+    sigma_yy = gaussian_filter(y * y, kernel) - mu_yy
+    sigma_xy = gaussian_filter(x * y, kernel) - mu_xy
+
+    ssim_map = ((2 * mu_xy + c1) * (2 * sigma_xy + c2)) / ((mu_xx + mu_yy + c1) * (sigma_xx + sigma_yy + c2))
+    return float(ssim_map.mean())
+
+
+def luminance(image):
+    """휘도 배열 (ITU-R 601, Pillow 'L' 변환)"""
+    return np.asarray(image.convert('L'), dtype=np.float64)
+
+
+def encode(image, fmt, quality, options):
+    """메모리에 인코딩한 바이트"""
+    buffer = io.BytesIO()
+    if fmt == 'JPEG':
+        image.save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True, **options)
+    else:
+        image.save(buffer, 'WEBP', quality=quality, method=6, **options)
+    return buffer.getvalue()
+
+
+def encoder_options(image, fmt):
+    """원본에서 유지할 인코더 설정 (JPEG 크로마 서브샘플링, ICC 프로필)"""
+    options = {}
+    if image.info.get('icc_profile'):
+        options['icc_profile'] = image.info['icc_profile']
+    if fmt == 'JPEG' and image.format == 'JPEG':
+        sampling = JpegImagePlugin.get_sampling(image)
+        if sampling != -1:
+            options['subsampling'] = sampling
+    return options
+
+
+def search_quality(path, target=TARGET_SSIM, quality=None):
+    """
+    SSIM이 target 이상인 가장 낮은 품질을 이진 탐색하여 다시 인코딩 (프로세스 풀 워커)
+    quality를 주면 탐색 없이 그 품질로 인코딩 (기록된 결과 재사용)
+
+    Returns:
+        {'quality', 'ssim', 'data', 'steps'} (target을 만족하는 품질이 없으면 quality/data가 None)
+    """
+    fmt = FORMATS_BY_SUFFIX[Path(path).suffix.lower()]
+    with Image.open(path) as image:
+        image.load()
+        options = encoder_options(image, fmt)
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        if fmt == 'JPEG' or not has_alpha:
+            source = image.convert('L' if image.mode == 'L' else 'RGB')
+        else:
+            source = image.convert('RGBA')
+    reference = luminance(source)
+    kernel = gaussian_kernel()
+
+    def measure(value):
+        data = encode(source, fmt, value, options)
+        with Image.open(io.BytesIO(data)) as decoded:
+            return data, ssim(reference, luminance(decoded), kernel)
+
+    steps = 0
+    best = {'quality': None, 'ssim': None, 'data': None}
+    if quality is not None:
+        data, score = measure(quality)
+        steps = 1
+        best = {'quality': quality, 'ssim': score, 'data': data}
+    else:
+        low, high = QUALITY_MIN, QUALITY_MAX
+        while low <= high:
+            middle = (low + high) // 2
+            data, score = measure(middle)
+            steps += 1
+            if score >= target:
+                best = {'quality': middle, 'ssim': score, 'data': data}
+                high = middle - 1
+            else:
+                low = middle + 1
+    best['steps'] = steps
+    return best
+
+
+def find_images(paths):
+    """대상 이미지 목록 (폴더는 하위 파일 전체)"""
+    images = []
+    for path in paths:
+        path = Path(path)
+        candidates = sorted(path.rglob('*')) if path.is_dir() else [path]
+        images.extend(
+            candidate for candidate in candidates
+            if candidate.is_file() and candidate.suffix.lower() in FORMATS_BY_SUFFIX
+        )
+    return images
+
+
+def search_settings(target):
+    """기록된 탐색 결과를 재사용할 수 있는지 판단하는 설정"""
+    return {'target': target, 'quality_range': [QUALITY_MIN, QUALITY_MAX], 'min_savings': MIN_SAVINGS}
+
+
+def load_record(record_path):
+    """최적화 기록 읽기 (없거나 버전이 다르면 빈 기록)"""
+    record_path = Path(record_path)
+    if record_path.exists():
+        try:
+            with open(record_path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            if record.get('version') == RECORD_VERSION:
+                return record
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable record {record_path}: {e}")
+    return {'version': RECORD_VERSION, 'images': {}}
+
+
+def save_record(record_path, record):
+    """최적화 기록 저장"""
+    with open(record_path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def display_name(path, project_root):
+    """출력용 경로 (프로젝트 루트 기준)"""
+    return Path(os.path.relpath(path, project_root)).as_posix()
+
+
+def write_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (중간에 중단되어도 원본이 깨지지 않음)"""
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+def optimize_images(project_root, paths=None, target=TARGET_SSIM, workers=None, dry_run=False):
+    """
+    이미지를 SSIM 기준 최저 품질로 다시 저장
+    최적화 결과 파일은 설정이 바뀌어도 다시 압축하지 않음 (반복 재압축으로 인한 손실 방지)
+
+    Returns:
+        {'images', 'optimized', 'kept', 'skipped', 'before', 'after'} 통계
+    """
+    project_root = Path(project_root)
+    if paths is None:
+        paths = [project_root / "assets" / "images" / folder for folder in SOURCE_FOLDERS]
+    record_path = project_root / RECORD_FILE
+    record = load_record(record_path)
+    entries = record['images']
+    settings = search_settings(target)
+    # 이미 최적화된 결과 파일의 해시 (다시 처리하지 않음)
+    outputs = {entry['output'] for entry in entries.values() if entry.get('output')}
+
+    stats = {'images': 0, 'optimized': 0, 'kept': 0, 'skipped': 0, 'before': 0, 'after': 0}
+    jobs = []
+    for path in find_images(paths):
+        stats['images'] += 1
+        digest = file_hash(path)
+        size = path.stat().st_size
+        entry = entries.get(digest)
+        if entry is not None and entry['settings'] != settings:
+            entry = None
+        if digest in outputs or (entry is not None and entry['quality'] is None):
+            stats['skipped'] += 1
+            stats['before'] += size
+            stats['after'] += size
+            print(f"  [SKIP] {display_name(path, project_root)} (already optimized)")
+            continue
+        jobs.append((path, digest, size, entry['quality'] if entry else None))
+
+    start = time.perf_counter()
+    if jobs:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (path, digest, size, executor.submit(search_quality, path, target, quality))
+                for path, digest, size, quality in jobs
+            ]
+            for path, digest, size, future in futures:
+                name = display_name(path, project_root)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"  [FAIL] {name}: {e}")
+                    continue
+                stats['before'] += size
+
+                data = result['data']
+                if data is None or len(data) > size * (1 - MIN_SAVINGS):
+                    # target을 만족하면서 충분히 줄지 않으면 원본 유지
+                    entries[digest] = {'quality': None, 'size': size, 'output': None, 'settings': settings}
+                    stats['kept'] += 1
+                    stats['after'] += size
+                    reason = "no quality meets target" if data is None else f"q{result['quality']} saves too little"
+                    print(f"  [INFO] {name}: kept original ({reason})")
+                    continue
+
+                entries[digest] = {
+                    'quality': result['quality'],
+                    'ssim': round(result['ssim'], 5),
+                    'size': size,
+                    'optimized_size': len(data),
+                    'output': content_hash(data),
+                    'settings': settings,
+                }
+                stats['optimized'] += 1
+                stats['after'] += len(data)
+                if not dry_run:
+                    write_atomic(path, data)
+                print(f"  [OK] {name}: {size / 1024:.0f} KB -> {len(data) / 1024:.0f} KB "
+                      f"(q{result['quality']}, SSIM {result['ssim']:.4f}, {result['steps']} encodes)")
+
+    if not dry_run:
+        save_record(record_path, record)
+
+    elapsed = time.perf_counter() - start
+    if jobs:
+        print(f"\n[INFO] Searched {len(jobs)} image(s) in {elapsed:.2f}s ({workers} workers)")
+    return stats
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="SSIM 기준 품질 탐색으로 JPEG/WebP 재압축")
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help=f"대상 파일/폴더 (기본값: assets/images/{{{','.join(SOURCE_FOLDERS)}}})")
+    parser.add_argument('--target', type=float, default=TARGET_SSIM,
+                        help=f"목표 SSIM (기본값: {TARGET_SSIM})")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="사용할 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="파일을 바꾸지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    print(f"Optimizing images (target SSIM {args.target})...")
+    print("=" * 60)
+    paths = [path.resolve() for path in args.paths] or None
+    stats = optimize_images(project_root, paths, target=args.target, workers=args.workers, dry_run=args.dry_run)
+
+    print("\n" + "=" * 60)
+    saved = stats['before'] - stats['after']
+    print(f"[SUMMARY] {stats['images']} images: {stats['optimized']} optimized, {stats['kept']} kept, "
+          f"{stats['skipped']} skipped")
+    print(f"[SUMMARY] {stats['before'] / 1024:.0f} KB -> {stats['after'] / 1024:.0f} KB "
+          f"(saved {saved / 1024:.0f} KB, {saved / stats['before'] * 100 if stats['before'] else 0:.1f}%)"
+          f"{' (dry run)' if args.dry_run else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+기획서 페이지 목록(contact sheet) 생성
+기획서의 모든 페이지를 page.get_pixmap으로 렌더링하고, 각 페이지 위에 추출 이미지의 배치 영역과
+출력 파일명(page11_img3_946x548.jpeg)을 겹쳐 표시한 정적 HTML을 만듦.
+매핑 규칙(image-mapping.json)에 쓰인 이미지는 매핑 대상 경로도 함께 표시하므로,
+PDF를 직접 열어 파일명을 대조하지 않고 매핑할 이미지를 고를 수 있음
+
+- 렌더링은 페이지를 나눠 프로세스 풀에서 병렬로 처리
+- 렌더링 결과는 페이지 지문(pdf_catalog.page_fingerprint)과 DPI로 이름을 붙여 저장하므로,
+  기획서가 수정되면 바뀐 페이지만 다시 렌더링함
+- 영역 표시: 실선 - 추출된 이미지 (클릭하면 파일 열기), 점선 - 추출되지 않은 이미지, 강조 - 매핑에 사용
+
+결과: .build-cache/contact-sheet/index.html (렌더링은 같은 폴더의 renders/)
+
+사용법:
+    python scripts/page_contact_sheet.py
+    python scripts/page_contact_sheet.py --dpi 96 --workers 4
+"""
+
+import argparse
+import html
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install PyMuPDF")
+    sys.exit(1)
+
+from image_manifest import list_extracted_images
+from image_mapping import build_index, load_config, resolve_rule
+from pdf_catalog import (
+    SHARDS_PER_WORKER, image_filename, image_placements, page_fingerprint, placement_index, split_page_ranges,
+)
+
+CONTACT_SHEET_DIR = ".build-cache/contact-sheet"
+RENDER_DIR = "renders"
+DEFAULT_DPI = 72
+RENDER_QUALITY = 80
+
+SHEET_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>기획서 페이지 목록 - __TITLE__</title>
+<style>
+body { margin: 0; padding: 24px; background: #1b1b1b; color: #eee; font-family: sans-serif; }
+h1 { font-size: 20px; margin: 0 0 4px; }
+.summary { color: #aaa; margin: 0 0 24px; font-size: 13px; }
+.pages { display: grid; grid-template-columns: repeat(auto-fill, minmax(480px, 1fr)); gap: 24px; }
+.page h2 { font-size: 14px; margin: 0 0 6px; }
+.page h2 a { color: inherit; text-decoration: none; }
+.canvas { position: relative; line-height: 0; }
+.canvas img { width: 100%; height: auto; background: #fff; }
+.box { position: absolute; box-sizing: border-box; border: 2px solid #2d9cff; color: #fff; text-decoration: none; }
+.box.missing { border-style: dashed; border-color: #999; }
+.box.mapped { border-color: #ffcc00; }
+.box span { position: absolute; left: 0; top: 0; max-width: 100%; overflow: hidden; padding: 1px 4px;
+            background: rgba(0, 0, 0, 0.75); font-size: 11px; line-height: 1.4; white-space: nowrap; }
+.box.mapped span { background: rgba(120, 90, 0, 0.9); }
+.box:hover { z-index: 1; background: rgba(45, 156, 255, 0.15); }
+.box:hover span { max-width: none; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<p class="summary">__SUMMARY__</p>
+<div class="pages">
+__PAGES__
+</div>
+</body>
+</html>
+"""
+
+
+def render_name(fingerprint, dpi):
+    """렌더링 파일명 (페이지 지문과 DPI가 같으면 같은 이름)"""
+    return f"{fingerprint}-{dpi}.jpg"
+
+
+def _render_pages(pdf_path, jobs, dpi, render_dir):
+    """
+    [(페이지 번호, 파일명), ...]의 페이지를 렌더링하여 저장 (프로세스 풀 워커)
+
+    Returns:
+        [(페이지 번호, 오류 메시지 또는 None), ...]
+    """
+    results = []
+    with fitz.open(pdf_path) as pdf_document:
+        for page_num, filename in jobs:
+            target = Path(render_dir) / filename
+            temp = target.with_name(target.name + f".{os.getpid()}.tmp")
+            try:
+                pix = pdf_document[page_num - 1].get_pixmap(dpi=dpi)
+                pix.save(str(temp), output="jpg", jpg_quality=RENDER_QUALITY)
+                os.replace(temp, target)
+                results.append((page_num, None))
+            except Exception as e:
+                results.append((page_num, str(e)))
+    return results
+
+
+def render_pages(pdf_path, jobs, dpi, render_dir, workers=1):
+    """
+    렌더링 작업을 프로세스 풀에 나눠 실행
+
+    Returns:
+        [(페이지 번호, 오류 메시지 또는 None), ...]
+    """
+    if not jobs:
+        return []
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        return _render_pages(pdf_path, jobs, dpi, render_dir)
+    ranges = split_page_ranges(len(jobs), workers * SHARDS_PER_WORKER)
+    shards = [jobs[first:last] for first, last in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _render_pages,
+            [pdf_path] * len(shards), shards, [dpi] * len(shards), [render_dir] * len(shards),
+        )
+        return [result for shard in results for result in shard]
+
+
+def page_images(page, page_num, image_list):
+    """
+    페이지의 이미지 배치 영역
+
+    Returns:
+        [{'stems': ('page3_img39_2080x1234', 'page3_img39'), 'page', 'image', 'bbox': fitz.Rect}, ...]
+        stems는 추출 파일명 후보 (확장자 제외, 크기 포함 - 기본 전략, 크기 제외 - -s raw 전략)
+    """
+    placements = placement_index(page, image_list) if image_list else {}
+    images = []
+    for img_index, img in enumerate(image_list):
+        record = {'page': page_num, 'index': img_index, 'width': img[2], 'height': img[3], 'ext': ''}
+        stems = tuple(dict.fromkeys(
+            image_filename(record, with_size=with_size).rstrip('.') for with_size in (True, False)
+        ))
+        for rect, _ in image_placements(page, img[0], placements):
+            if not rect.is_empty:
+                images.append({'stems': stems, 'page': page_num, 'image': img_index + 1, 'bbox': fitz.Rect(rect)})
+    return images
+
+
+def find_extracted(image, extracted):
+    """
+    배치 영역의 추출 파일 (없으면 None)
+
+    Returns:
+        (추출 파일명 경로, 실제 파일 경로) - 별칭이면 실제 파일 경로가 대표 파일을 가리킴
+    """
+    for stem in image['stems']:
+        if stem in extracted:
+            return extracted[stem]
+    return None
+
+
+def mapping_targets(project_root, other_dir):
+    """
+    매핑 규칙이 사용하는 추출 이미지별 대상 경로
+
+    Returns:
+        {추출 파일명: ['세트: 대상 경로', ...]}
+    """
+    try:
+        config = load_config(project_root)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Mapping rules not loaded: {e}")
+        return {}
+    index = build_index(other_dir)
+    targets = {}
+    for set_name, rules in config['sets'].items():
+        for rule in rules:
+            source, _, _ = resolve_rule(rule, index)
+            if source is not None:
+                targets.setdefault(source.name, []).append(f"{set_name}: {rule['target']}")
+    return targets
+
+
+def _percent(value, total):
+    return f"{max(0.0, min(100.0, value / total * 100)):.2f}%"
+
+
+def page_section(page, render_path, output_dir, extracted, targets):
+    """페이지 하나의 HTML (렌더링 + 이미지 영역, 별칭은 이름을 표시하고 대표 파일로 연결)"""
+    width, height = page['size']
+    boxes = []
+    for image in page['images']:
+        bbox = image['bbox']
+        found = find_extracted(image, extracted)
+        path, real_path = found if found is not None else (None, None)
+        classes = ["box"]
+        if path is None:
+            classes.append("missing")
+            label = image['stems'][0]
+            title = f"{image['stems'][0]} (not extracted)"
+        else:
+            label = path.name
+            title = path.name
+            if path.name in targets:
+                classes.append("mapped")
+                title += "\n" + "\n".join(targets[path.name])
+                paths = dict.fromkeys(target.split(": ", 1)[1] for target in targets[path.name])
+                label += " → " + ", ".join(paths)
+        style = (f"left:{_percent(bbox.x0, width)};top:{_percent(bbox.y0, height)};"
+                 f"width:{_percent(bbox.width, width)};height:{_percent(bbox.height, height)}")
+        tag = "span" if path is None else "a"
+        href = "" if path is None else f' href="{html.escape(os.path.relpath(real_path, output_dir).replace(os.sep, "/"))}"'
+        boxes.append(
+            f'<{tag} class="{" ".join(classes)}" style="{style}"{href} title="{html.escape(title)}">'
+            f'<span>{html.escape(label)}</span></{tag}>'
+        )
+
+    image_tag = ""
+    if render_path is not None:
+        src = html.escape(os.path.relpath(render_path, output_dir).replace(os.sep, "/"))
+        image_tag = (f'<img src="{src}" loading="lazy" width="{page["pixels"][0]}" height="{page["pixels"][1]}" '
+                     f'alt="page {page["page"]}">')
+    return (
+        f'<section class="page" id="page{page["page"]}">\n'
+        f'<h2><a href="#page{page["page"]}">Page {page["page"]}</a> · {len(page["images"])} image(s)</h2>\n'
+        f'<div class="canvas">{image_tag}\n' + "\n".join(boxes) + '\n</div>\n</section>'
+    )
+
+
+def build_contact_sheet(pdf_path, output_dir, other_dir, project_root, dpi=DEFAULT_DPI, workers=1):
+    """
+    기획서 페이지 목록 HTML 생성
+
+    Args:
+        pdf_path: 기획서 PDF 경로
+        output_dir: index.html과 렌더링(renders/)을 저장할 디렉토리
+        other_dir: 추출 이미지 폴더 (영역에 표시할 파일명)
+        project_root: 프로젝트 루트 (매핑 규칙 위치)
+        dpi: 렌더링 해상도
+        workers: 렌더링 프로세스 수
+
+    Returns:
+        {'path': index.html 경로, 'pages', 'rendered', 'cached', 'failures': [(페이지, 오류), ...]}
+    """
+    output_dir = Path(output_dir)
+    render_dir = output_dir / RENDER_DIR
+    render_dir.mkdir(parents=True, exist_ok=True)
+
+    pages = []
+    jobs = []
+    stream_hashes = {}
+    zoom = dpi / 72
+    with fitz.open(pdf_path) as pdf_document:
+        for page_index, page in enumerate(pdf_document):
+            page_num = page_index + 1
+            image_list = page.get_images(full=True)
+            filename = render_name(page_fingerprint(pdf_document, page, image_list, stream_hashes), dpi)
+            rect = page.rect
+            pages.append({
+                'page': page_num,
+                'size': (rect.width, rect.height),
+                'pixels': (round(rect.width * zoom), round(rect.height * zoom)),
+                'images': page_images(page, page_num, image_list),
+                'render': filename,
+            })
+            if not (render_dir / filename).exists():
+                jobs.append((page_num, filename))
+
+    failures = [
+        (page_num, error)
+        for page_num, error in render_pages(str(pdf_path), jobs, dpi, render_dir, workers)
+        if error is not None
+    ]
+    failed_pages = {page_num for page_num, _ in failures}
+
+    # 기획서에서 사라진 페이지나 다른 DPI의 렌더링 정리
+    current = {page['render'] for page in pages}
+    for path in render_dir.iterdir():
+        if path.name not in current:
+            path.unlink()
+
+    extracted = {path.stem: (path, real_path) for path, real_path in list_extracted_images(other_dir).items()}
+    targets = mapping_targets(project_root, other_dir)
+    sections = [
+        page_section(
+            page, None if page['page'] in failed_pages else render_dir / page['render'],
+            output_dir, extracted, targets,
+        )
+        for page in pages
+    ]
+    image_count = sum(len(page['images']) for page in pages)
+    extracted_count = sum(
+        1 for page in pages for image in page['images'] if find_extracted(image, extracted) is not None
+    )
+    summary = (f"{len(pages)} pages · {image_count} image placements · {extracted_count} extracted · "
+               f"{dpi} DPI · 실선: 추출된 이미지, 점선: 추출되지 않은 이미지, 노란색: 매핑에 사용")
+
+    sheet = SHEET_TEMPLATE
+    for key, value in (
+        ('__TITLE__', html.escape(Path(pdf_path).name)),
+        ('__SUMMARY__', html.escape(summary)),
+        ('__PAGES__', "\n".join(sections)),
+    ):
+        sheet = sheet.replace(key, value)
+    path = output_dir / "index.html"
+    path.write_text(sheet, encoding='utf-8')
+    return {
+        'path': path,
+        'pages': len(pages),
+        'rendered': len(jobs) - len(failures),
+        'cached': len(pages) - len(jobs),
+        'failures': failures,
+    }
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="기획서 페이지 렌더링과 추출 이미지 영역을 표시한 HTML 목록 생성")
+    parser.add_argument('--pdf', type=Path, default=project_root / "SF리마스터 웹기획서_260115.pdf",
+                        help="기획서 PDF 경로")
+    parser.add_argument('-o', '--output', type=Path, default=project_root / CONTACT_SHEET_DIR,
+                        help=f"결과 디렉토리 (기본값: {CONTACT_SHEET_DIR})")
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI, help=f"렌더링 해상도 (기본값: {DEFAULT_DPI})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="렌더링 프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"[ERROR] PDF file not found: {args.pdf}")
+        sys.exit(1)
+
+    print(f"Building contact sheet: {args.pdf.name} ({args.dpi} DPI, {args.workers} worker(s))")
+    print("=" * 60)
+    start = time.perf_counter()
+    result = build_contact_sheet(
+        args.pdf, args.output, project_root / "assets" / "images" / "other", project_root,
+        dpi=args.dpi, workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+
+    for page_num, error in result['failures']:
+        print(f"  [FAIL] page{page_num}: {error}")
+    print(f"[INFO] {result['rendered']} page(s) rendered, {result['cached']} from cache")
+    print(f"[DONE] {result['pages']} page(s) in {elapsed:.2f}s -> {result['path']}")
+
+
+if __name__ == "__main__":
+    main()
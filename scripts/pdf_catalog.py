@@ -0,0 +1,880 @@
+"""
+PDF 이미지 카탈로그 엔진
+PDF를 한 번만 순회하여 모든 이미지 정보를 메모리 카탈로그로 만들고,
+추출 스크립트들이 사용하던 선별 기준(최소 크기, 최소 면적, 웹 목업 판별)을
+카탈로그 위에서 동작하는 필터로 제공
+
+사용 예:
+    from pdf_catalog import build_catalog, select_images, min_size_filter
+
+    catalog = build_catalog(pdf_file)
+    large = select_images(catalog, min_size_filter(300, 200))
+
+    # 대용량 기획서는 페이지 구간을 프로세스 풀에 나눠서 처리
+    catalog = build_catalog(pdf_file, workers=4)
+
+    # 카탈로그 없이 페이지 단위로 스트리밍 (메모리 사용량이 페이지 수와 무관)
+    writer = ImageWriter(window=8)
+    records = iter_records(iter_pages(pdf_file), web_mockup_filter())
+    for record, filename, alias_of in write_records(records, other_dir, writer):
+        ...
+    writer.close()
+
+    # 페이지 지문 캐시를 사용하면 바뀐 페이지만 다시 조회하고, 저장된 이미지는 디코딩 생략
+    catalog = build_catalog(pdf_file, cache_path=cache_file, image_dir=other_dir)
+    ...
+    save_catalog_cache(catalog)
+
+카탈로그는 이미지 메타데이터만 담고 있으며, 필터를 통과한 이미지의 바이트만
+record_bytes(record)에서 PDF 스트림을 읽어 가져옴
+"""
+
+import hashlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from extraction_cache import available_images, load_extraction_cache, save_extraction_cache
+from image_manifest import content_hash, drop_stale_names, load_manifest, register_image, save_manifest
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    print("필요한 라이브러리를 설치해주세요:")
+    print("pip install PyMuPDF")
+    sys.exit(1)
+
+# 메타데이터에 크기 정보가 없을 때 사용하는 추정 기준
+# 페이지가 960x540 (PDF 분석 결과)라고 가정하고 1.5배로 실제 해상도 추정
+ESTIMATED_PAGE_WIDTH = 960
+ESTIMATED_PAGE_HEIGHT = 540
+ESTIMATED_SCALE = 1.5
+
+# 워커당 할당할 페이지 구간 수 (구간을 잘게 나눠 페이지별 편차를 분산)
+SHARDS_PER_WORKER = 4
+
+# ImageWriter가 동시에 예약해 두는 쓰기 작업 수 (메모리에 남는 이미지 바이트 상한)
+WRITE_WINDOW = 16
+# ImageWriter가 덮어쓰기 전에 기존 파일을 옮겨 두는 출력 폴더 안의 임시 디렉토리
+DISPLACED_DIR = ".displaced"
+
+# 스트림 필터별 extract_image 확장자 (그 외 필터는 PNG로 변환되어 나옴)
+FILTER_EXTENSIONS = {
+    'DCTDecode': 'jpeg',
+    'JPXDecode': 'jpx',
+}
+# image_filename 규칙의 파일명 (페이지, 이미지 번호, 너비, 높이, 확장자)
+EXTRACTED_FILENAME_PATTERN = re.compile(r'page(\d+)_img(\d+)(?:_(\d+)x(\d+))?\.(\w+)')
+
+# 지연 로딩 상태 (프로세스별)
+# {pdf 경로: 문서 핸들}, {(pdf 경로, xref): {'content_hash', 'ext', 'size', 'stream_key'}}
+_documents = {}
+_fetched_streams = {}
+
+
+def estimate_size_from_rect(rect, page_width, page_height):
+    """PDF 좌표의 배치 영역에서 실제 픽셀 크기 추정"""
+    width_pdf = rect.x1 - rect.x0
+    height_pdf = rect.y1 - rect.y0
+
+    if page_width > 0 and page_height > 0:
+        width = int(width_pdf / page_width * ESTIMATED_PAGE_WIDTH * ESTIMATED_SCALE)
+        height = int(height_pdf / page_height * ESTIMATED_PAGE_HEIGHT * ESTIMATED_SCALE)
+    else:
+        width = int(width_pdf * ESTIMATED_SCALE)
+        height = int(height_pdf * ESTIMATED_SCALE)
+
+    return width, height
+
+
+def build_catalog(pdf_path, workers=1, cache_path=None, image_dir=None):
+    """
+    PDF를 한 번 순회하여 이미지 카탈로그 생성
+    픽셀 데이터는 디코딩하지 않고 get_images(full=True)의 메타데이터(크기, bpc, 필터)와
+    배치 영역만으로 레코드를 만들며, 이미지 바이트는 record_bytes()에서 필요할 때 읽음
+
+    Args:
+        pdf_path: PDF 파일 경로
+        workers: 페이지 구간을 나눠 처리할 프로세스 수 (1이면 순차 처리)
+        cache_path: 페이지 지문 캐시 파일 경로 (지정하면 바뀐 페이지의 레코드만 새로 구성)
+        image_dir: 이전에 추출한 이미지 폴더 (캐시된 이미지의 바이트를 읽어올 위치)
+
+    Returns:
+        {'pdf_path', 'page_count', 'pages', 'images', 'errors', 'stats'} 형태의 딕셔너리.
+        images는 페이지 순서, 페이지 내 이미지 순서대로 정렬된 이미지 레코드 목록.
+        stats는 프로세스 수, 처리 시간(실제 경과 시간), 캐시 재사용 통계.
+        캐시를 사용하면 추출이 끝난 뒤 save_catalog_cache(catalog)로 저장
+    """
+    start = time.perf_counter()
+    pdf_document = fitz.open(pdf_path)
+    page_count = len(pdf_document)
+    pdf_document.close()
+
+    cache = load_extraction_cache(cache_path) if cache_path else None
+    if cache is not None and image_dir is not None:
+        available = available_images(image_dir)
+    else:
+        available = {}
+
+    workers = max(1, min(workers, page_count))
+    if workers == 1:
+        shards = [_catalog_page_range(pdf_path, 0, page_count, cache, available)]
+    else:
+        ranges = split_page_ranges(page_count, workers * SHARDS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map은 입력 순서대로 결과를 돌려주므로 병합 후에도 페이지 순서가 유지됨
+            shards = list(executor.map(
+                _catalog_page_range,
+                [pdf_path] * len(ranges),
+                [first for first, _ in ranges],
+                [last for _, last in ranges],
+                [cache] * len(ranges),
+                [available] * len(ranges),
+            ))
+
+    catalog = {
+        'pdf_path': str(pdf_path),
+        'page_count': page_count,
+        'pages': [],
+        'images': [],
+        'errors': [],
+    }
+    reused_pages = 0
+    skipped_streams = 0
+    cache_pages = {}
+    for shard in shards:
+        catalog['pages'].extend(shard['pages'])
+        catalog['images'].extend(shard['images'])
+        catalog['errors'].extend(shard['errors'])
+        reused_pages += shard['reused_pages']
+        skipped_streams += shard['skipped_streams']
+        cache_pages.update(shard['cache_pages'])
+
+    if cache is not None:
+        # 현재 PDF에 존재하는 페이지만 남겨서 캐시가 무한히 커지지 않도록 함
+        cache['pdf_path'] = str(pdf_path)
+        cache['pages'] = cache_pages
+        catalog['cache'] = cache
+        catalog['cache_path'] = str(cache_path)
+
+    elapsed = time.perf_counter() - start
+    catalog['stats'] = {
+        'workers': workers,
+        'elapsed': elapsed,
+        'reused_pages': reused_pages,
+        'skipped_streams': skipped_streams,
+    }
+    return catalog
+
+
+def save_catalog_cache(catalog):
+    """
+    카탈로그의 페이지 지문과, 추출 중 디코딩한 이미지 스트림 정보를 캐시 파일에 저장
+    (스트림 정보는 실제로 바이트를 읽은 뒤에야 알 수 있으므로 추출이 끝난 뒤 호출)
+    """
+    cache = catalog.get('cache')
+    if cache is None:
+        return
+    for (pdf_path, _), info in _fetched_streams.items():
+        if pdf_path == catalog['pdf_path'] and info['stream_key'] is not None:
+            cache['streams'][info['stream_key']] = {
+                'content_hash': info['content_hash'],
+                'ext': info['ext'],
+                'size': info['size'],
+            }
+    save_extraction_cache(catalog['cache_path'], cache)
+
+
+def split_page_ranges(page_count, shard_count):
+    """[0, page_count) 페이지를 shard_count개 이하의 연속 구간으로 분할"""
+    shard_count = max(1, min(shard_count, page_count))
+    size, extra = divmod(page_count, shard_count)
+    ranges = []
+    first = 0
+    for shard in range(shard_count):
+        last = first + size + (1 if shard < extra else 0)
+        ranges.append((first, last))
+        first = last
+    return ranges
+
+
+def stream_fingerprint(pdf_document, img, stream_hashes):
+    """이미지 스트림을 디코딩하지 않고 원본(압축) 바이트와 속성으로 지문 생성"""
+    xref = img[0]
+    digest = stream_hashes.get(xref)
+    if digest is None:
+        # 크기, bpc, 색공간, 필터가 같아야 같은 이미지로 간주
+        attributes = repr((img[2], img[3], img[4], img[5], img[8])).encode()
+        digest = content_hash(attributes + pdf_document.xref_stream_raw(xref))
+        stream_hashes[xref] = digest
+    return digest
+
+
+def page_fingerprint(pdf_document, page, image_list, stream_hashes):
+    """페이지 크기, 콘텐츠 스트림, 참조 이미지 스트림으로 페이지 지문 생성"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(tuple(page.rect)).encode())
+    digest.update(page.read_contents())
+    for img in image_list:
+        digest.update(stream_fingerprint(pdf_document, img, stream_hashes).encode())
+    return digest.hexdigest()
+
+
+def _catalog_page_range(pdf_path, first, last, cache=None, available=None):
+    """
+    [first, last) 페이지 구간의 이미지 카탈로그 조각 생성
+    프로세스 풀 워커에서도 호출되므로 문서 핸들을 직접 열고 닫음
+    """
+    shard = _new_page_stats()
+    shard.update({'pages': [], 'images': [], 'errors': []})
+    pdf_document = fitz.open(pdf_path)
+
+    try:
+        for page_info, records, errors in _iter_page_range(
+            pdf_document, pdf_path, first, last, cache, available, shard,
+        ):
+            shard['pages'].append(page_info)
+            shard['images'].extend(records)
+            shard['errors'].extend(errors)
+    finally:
+        pdf_document.close()
+    return shard
+
+
+def _new_page_stats():
+    """페이지 순회 중 누적하는 캐시 통계"""
+    return {'reused_pages': 0, 'skipped_streams': 0, 'cache_pages': {}}
+
+
+def _iter_page_range(pdf_document, pdf_path, first, last, cache, available, stats):
+    """
+    [first, last) 페이지를 하나씩 처리하여 (페이지 정보, 이미지 레코드 목록, 오류 목록) 생성
+    오류는 (페이지 번호, 이미지 번호, 메시지) 튜플
+    """
+    available = available or {}
+    stream_hashes = {}
+
+    for page_num in range(first, last):
+        page = pdf_document[page_num]
+        page_rect = page.rect
+        page_info = {
+            'page': page_num + 1,
+            'width': page_rect.width,
+            'height': page_rect.height,
+            'image_count': 0,
+        }
+        image_list = page.get_images(full=True)
+
+        fingerprint = None
+        if cache is not None:
+            fingerprint = page_fingerprint(pdf_document, page, image_list, stream_hashes)
+            cached_page = cache['pages'].get(fingerprint)
+            if cached_page is not None:
+                # 바뀌지 않은 페이지: 배치 영역 조회 없이 캐시된 레코드 재사용
+                # (xref는 수정본에서 바뀔 수 있으므로 현재 이미지 목록에서 다시 가져옴)
+                page_records = []
+                for image in cached_page['images']:
+                    record = dict(
+                        image,
+                        page=page_num + 1,
+                        xref=image_list[image['index']][0],
+                        pdf_path=str(pdf_path),
+                        bytes=None,
+                        source_file=None,
+                        content_hash=None,
+                        size=None,
+                    )
+                    _attach_known_stream(record, cache, available, stats)
+                    page_records.append(record)
+                page_info['image_count'] = len(page_records)
+                stats['cache_pages'][fingerprint] = cached_page
+                stats['reused_pages'] += 1
+                yield page_info, page_records, [
+                    (page_num + 1, img_num, error) for img_num, error in cached_page['errors']
+                ]
+                continue
+
+        page_records = []
+        page_errors = []
+        placements = placement_index(page, image_list) if image_list else {}
+        for img_index, img in enumerate(image_list):
+            try:
+                record = _read_image_record(pdf_path, page, page_num, img_index, img, placements)
+            except Exception as e:
+                page_errors.append((img_index + 1, str(e)))
+                continue
+
+            if cache is not None:
+                record['stream_key'] = stream_fingerprint(pdf_document, img, stream_hashes)
+                _attach_known_stream(record, cache, available, stats)
+            page_records.append(record)
+
+        page_info['image_count'] = len(page_records)
+        if fingerprint is not None:
+            stats['cache_pages'][fingerprint] = {
+                'images': [_cacheable_record(record) for record in page_records],
+                'errors': page_errors,
+            }
+        yield page_info, page_records, [
+            (page_num + 1, img_num, error) for img_num, error in page_errors
+        ]
+
+
+def iter_pages(pdf_path):
+    """
+    PDF를 페이지 단위로 순회하며 (페이지 정보, 이미지 레코드 목록, 오류 목록) 생성
+    카탈로그 전체를 메모리에 만들지 않으며, 레코드는 메타데이터만 담고 있음
+    """
+    pdf_document = fitz.open(pdf_path)
+    try:
+        yield from _iter_page_range(
+            pdf_document, pdf_path, 0, len(pdf_document), None, None, _new_page_stats(),
+        )
+    finally:
+        pdf_document.close()
+
+
+def catalog_pages(catalog):
+    """이미 만든 카탈로그를 iter_pages와 같은 (페이지 정보, 레코드 목록, 오류 목록) 형태로 순회"""
+    records = images_by_page(catalog['images'])
+    errors = {}
+    for error in catalog['errors']:
+        errors.setdefault(error[0], []).append(error)
+    for page_info in catalog['pages']:
+        page_num = page_info['page']
+        yield page_info, records.get(page_num, []), errors.get(page_num, [])
+
+
+def page_stream(pdf_path, catalog=None, workers=1):
+    """
+    추출 스크립트용 페이지 스트림
+
+    Returns:
+        (전체 페이지 수, (페이지 정보, 레코드 목록, 오류 목록) 이터레이터).
+        카탈로그가 주어졌거나 여러 프로세스를 쓰면 카탈로그를 순회하고,
+        그 외에는 PDF를 페이지 단위로 스트리밍
+    """
+    if catalog is None and workers > 1:
+        catalog = build_catalog(pdf_path, workers=workers)
+    if catalog is not None:
+        return catalog['page_count'], catalog_pages(catalog)
+
+    pdf_document = fitz.open(pdf_path)
+    page_count = len(pdf_document)
+    pdf_document.close()
+    return page_count, iter_pages(pdf_path)
+
+
+def iter_records(pages, *filters):
+    """페이지 스트림(또는 카탈로그)에서 모든 필터를 통과한 레코드를 차례로 생성"""
+    if isinstance(pages, dict):
+        records = pages['images']
+    else:
+        records = (record for _, page_records, _ in pages for record in page_records)
+    for record in records:
+        if all(accept(record) for accept in filters):
+            yield record
+
+
+def write_records(records, output_path, writer, with_size=True):
+    """
+    레코드를 차례로 저장하며 (레코드, 파일명, 별칭이면 대표 파일명 아니면 None) 생성
+    바이트는 쓰기가 예약되면 레코드에서 해제되고, writer의 window로 동시에 메모리에 남는 양이 제한됨
+    """
+    for record in records:
+        yield (record,) + writer.write(record, output_path, with_size=with_size)
+
+
+def placement_index(page, image_list):
+    """
+    페이지의 이미지 배치 인덱스 {xref: [(bbox, transform), ...]}
+    get_image_info로 페이지 콘텐츠를 한 번만 해석하여 모든 이미지의 위치를 모음.
+    get_image_info(xrefs=True)는 xref를 찾으려고 모든 이미지를 디코딩하므로 사용하지 않고,
+    (너비, 높이, bpc)가 페이지 안에서 유일한 이미지만 메타데이터로 xref를 연결
+    (같은 크기의 이미지가 여러 개면 image_placements에서 개별 조회)
+    """
+    xrefs_by_key = {}
+    for img in image_list:
+        xrefs_by_key.setdefault((img[2], img[3], img[4]), set()).add(img[0])
+
+    index = {}
+    for info in page.get_image_info():
+        xrefs = xrefs_by_key.get((info['width'], info['height'], info['bpc']))
+        if xrefs is not None and len(xrefs) == 1:
+            index.setdefault(next(iter(xrefs)), []).append(
+                (fitz.Rect(info['bbox']), fitz.Matrix(info['transform']))
+            )
+    return index
+
+
+def image_placements(page, xref, placements):
+    """배치 인덱스에서 xref의 (bbox, transform) 목록 조회"""
+    found = placements.get(xref)
+    if found is None:
+        # 인덱스로 구분할 수 없는 이미지만 개별 조회
+        # get_image_rects는 이미지를 디코딩해 비교하므로 꼭 필요할 때만 사용
+        found = placements[xref] = page.get_image_rects(xref, transform=True)
+    return found
+
+
+def _read_image_record(pdf_path, page, page_num, img_index, img, placements):
+    """
+    이미지 하나의 크기, 위치 정보를 레코드로 구성
+    get_images(full=True) 튜플 (xref, smask, width, height, bpc, colorspace, alt, name, filter, ...)과
+    페이지 배치 인덱스만 사용하며 스트림은 디코딩하지 않음
+    """
+    xref = img[0]
+    page_rect = page.rect
+
+    found = image_placements(page, xref, placements)
+    rect, transform = found[0] if found else (None, None)
+
+    # 메타데이터에서 크기를 가져올 수 없으면 PDF 좌표에서 추정
+    width = img[2]
+    height = img[3]
+    size_estimated = False
+    if not (width > 0 and height > 0):
+        width = height = 0
+        if rect is not None:
+            width, height = estimate_size_from_rect(rect, page_rect.width, page_rect.height)
+            size_estimated = True
+
+    return {
+        'page': page_num + 1,
+        'index': img_index,
+        'xref': xref,
+        'pdf_path': str(pdf_path),
+        'bytes': None,
+        'source_file': None,
+        'size': None,
+        # 실제 확장자는 스트림을 읽을 때 확정 (JPEG/JPEG2000 외에는 PNG로 변환됨)
+        'ext': FILTER_EXTENSIONS.get(img[8], 'png'),
+        'content_hash': None,
+        'stream_key': None,
+        'bpc': img[4],
+        'colorspace': img[5],
+        'filter': img[8],
+        'width': width,
+        'height': height,
+        'size_estimated': size_estimated,
+        'area': width * height,
+        'aspect_ratio': width / height if height > 0 else 0,
+        'rect': tuple(rect) if rect is not None else None,
+        'transform': tuple(transform) if transform is not None else None,
+        'placement_count': len(found),
+        'x_pos': rect.x0 if rect is not None else 0,
+        'y_pos': rect.y0 if rect is not None else 0,
+        'page_width': page_rect.width,
+        'page_height': page_rect.height,
+    }
+
+
+def _attach_known_stream(record, cache, available, stats):
+    """이전 실행에서 디스크에 저장한 스트림이면 해시, 확장자, 원본 파일을 레코드에 기록"""
+    known = cache['streams'].get(record['stream_key'])
+    if known is not None and known['content_hash'] in available:
+        record['content_hash'] = known['content_hash']
+        record['ext'] = known['ext']
+        record['size'] = known['size']
+        record['source_file'] = available[known['content_hash']]
+        stats['skipped_streams'] += 1
+
+
+def _cacheable_record(record):
+    """캐시에 저장할 레코드 (바이트, 페이지 번호 등 실행마다 달라지는 값 제외)"""
+    return {
+        key: value for key, value in record.items()
+        if key not in ('bytes', 'source_file', 'page', 'xref', 'pdf_path', 'content_hash', 'size')
+    }
+
+
+def _open_document(pdf_path):
+    """지연 로딩용 문서 핸들 (프로세스당 PDF별로 한 번만 열기)"""
+    pdf_document = _documents.get(pdf_path)
+    if pdf_document is None:
+        pdf_document = _documents[pdf_path] = fitz.open(pdf_path)
+    return pdf_document
+
+
+def close_documents():
+    """지연 로딩용으로 열어 둔 문서 핸들 닫기"""
+    for pdf_document in _documents.values():
+        pdf_document.close()
+    _documents.clear()
+
+
+def _apply_stream_info(record, info):
+    """읽어 둔 스트림 정보를 레코드에 반영"""
+    record['content_hash'] = info['content_hash']
+    record['ext'] = info['ext']
+    record['size'] = info['size']
+
+
+def _fetch_stream(record):
+    """PDF에서 이미지 스트림을 읽고 레코드에 해시, 확장자, 크기 기록"""
+    base_image = _open_document(record['pdf_path']).extract_image(record['xref'])
+    data = base_image["image"]
+    info = {
+        'content_hash': content_hash(data),
+        'ext': base_image["ext"],
+        'size': len(data),
+        'stream_key': record.get('stream_key'),
+    }
+    _fetched_streams[(record['pdf_path'], record['xref'])] = info
+    _apply_stream_info(record, info)
+    return data
+
+
+def record_bytes(record):
+    """
+    레코드의 이미지 바이트 (필요할 때 한 번만 읽어 레코드에 보관)
+    캐시에서 온 레코드는 디스크의 기존 파일에서, 나머지는 PDF 스트림에서 읽음.
+    기존 파일이 없거나 내용이 바뀌었으면 (다른 writer가 같은 이름으로 덮어쓴 경우 등) PDF 스트림에서 읽음
+    """
+    if record['bytes'] is None:
+        data = None
+        if record['source_file']:
+            try:
+                data = Path(record['source_file']).read_bytes()
+            except OSError:
+                data = None
+            if data is not None and content_hash(data) != record['content_hash']:
+                data = None
+            if data is None:
+                record['source_file'] = None
+        if data is None:
+            data = _fetch_stream(record)
+        record['bytes'] = data
+    return record['bytes']
+
+
+def resolve_content_hash(record):
+    """레코드의 내용 해시 (같은 xref를 이미 읽었다면 다시 디코딩하지 않음)"""
+    if record['content_hash'] is None:
+        info = _fetched_streams.get((record['pdf_path'], record['xref']))
+        if info is not None:
+            _apply_stream_info(record, info)
+        else:
+            record_bytes(record)
+    return record['content_hash']
+
+
+def image_filename(record, with_size=True):
+    """추출 스크립트들이 사용하는 파일명 규칙"""
+    base = f"page{record['page']}_img{record['index'] + 1}"
+    if with_size and record['width'] > 0 and record['height'] > 0:
+        base += f"_{record['width']}x{record['height']}"
+    return f"{base}.{record['ext']}"
+
+
+def current_image_names(pdf_path):
+    """
+    PDF의 현재 이미지 목록 (get_images 메타데이터만 사용, 스트림은 읽지 않음)
+
+    Returns:
+        {(페이지, 이미지 번호): (너비, 높이, 확장자)}
+        확장자는 필터로 알 수 없으면 None, 크기 정보가 없으면 너비/높이 0
+    """
+    images = {}
+    with fitz.open(pdf_path) as pdf_document:
+        for page_index, page in enumerate(pdf_document):
+            for img_index, img in enumerate(page.get_images(full=True)):
+                images[(page_index + 1, img_index + 1)] = (img[2], img[3], FILTER_EXTENSIONS.get(img[8]))
+    return images
+
+
+def is_current_name(filename, images):
+    """
+    추출 파일명이 current_image_names의 이미지 목록에서 나올 수 있는 이름인지
+    (추출 규칙과 다른 형식의 이름은 판단하지 않고 True)
+    """
+    match = EXTRACTED_FILENAME_PATTERN.fullmatch(filename)
+    if match is None:
+        return True
+    page, image, width, height, ext = match.groups()
+    info = images.get((int(page), int(image)))
+    if info is None:
+        return False
+    known_width, known_height, known_ext = info
+    # 크기 정보가 없는 이미지는 배치 영역으로 추정한 크기가 붙으므로 크기는 비교하지 않음
+    if width and known_width > 0 and known_height > 0 and (int(width), int(height)) != (known_width, known_height):
+        return False
+    return known_ext is None or ext == known_ext
+
+
+def is_web_mockup(width, height, area, y_pos, page_height, page_width):
+    """
+    이미지가 웹 목업인지 판별
+
+    기준:
+    1. 크기: 너무 작지 않음 (최소 800x400 정도)
+    2. 비율: 가로형 (너비가 높이보다 크거나 비슷)
+    3. 위치: 페이지 중앙/상단 (상단 60% 이내)
+    4. 면적: 페이지의 상당 부분 차지
+    """
+    # 1. 최소 크기 체크
+    if width < 600 or height < 300:
+        return False
+
+    # 2. 면적 체크 (최소 180,000 픽셀, 약 600x300)
+    if area < 180000:
+        return False
+
+    # 3. 비율 체크 - 가로형 (너비 >= 높이 * 1.2)
+    aspect_ratio = width / height if height > 0 else 0
+    if aspect_ratio < 1.0:  # 세로형은 목업이 아님
+        return False
+
+    # 4. 위치 체크 - 페이지 상단 70% 이내에 위치
+    page_center_y = page_height * 0.5
+    if y_pos > page_center_y * 1.4:  # 페이지 하단은 제외
+        return False
+
+    # 5. 페이지 대비 크기 - 페이지 너비의 50% 이상 차지
+    width_ratio = width / page_width if page_width > 0 else 0
+    if width_ratio < 0.4:  # 페이지 너비의 40% 미만이면 너무 작음
+        return False
+
+    # 6. 종횡비 범위 체크 (1.0 ~ 3.5 사이, 즉 가로형이지만 너무 길지 않음)
+    if aspect_ratio > 3.5:
+        return False
+
+    return True
+
+
+# ============================================
+# 카탈로그 필터
+# 각 필터는 이미지 레코드를 받아 True/False를 반환하는 함수
+# ============================================
+
+def min_size_filter(min_width, min_height):
+    """최소 너비/높이 필터 (크기 정보가 없는 이미지는 통과)"""
+    def accept(record):
+        if record['width'] <= 0 or record['height'] <= 0:
+            return True
+        return record['width'] >= min_width and record['height'] >= min_height
+    return accept
+
+
+def min_area_filter(min_area):
+    """최소 면적 필터"""
+    def accept(record):
+        return record['area'] >= min_area
+    return accept
+
+
+def web_mockup_filter():
+    """is_web_mockup 기준 필터"""
+    def accept(record):
+        return is_web_mockup(
+            record['width'], record['height'], record['area'],
+            record['y_pos'], record['page_height'], record['page_width'],
+        )
+    return accept
+
+
+def select_images(catalog, *filters):
+    """모든 필터를 통과한 이미지 레코드 목록 반환 (카탈로그 순서 유지)"""
+    return list(iter_records(catalog, *filters))
+
+
+def release_bytes(record):
+    """
+    레코드가 들고 있는 이미지 바이트 해제
+    (PDF나 디스크에서 다시 읽을 수 있으므로 필요하면 record_bytes로 다시 가져옴)
+    """
+    record['bytes'] = None
+
+
+def images_by_page(records):
+    """이미지 레코드를 페이지 번호별로 묶기"""
+    pages = {}
+    for record in records:
+        pages.setdefault(record['page'], []).append(record)
+    return pages
+
+
+def write_image(record, output_path, with_size=True):
+    """이미지 레코드를 output_path 아래에 저장하고 파일명 반환"""
+    data = record_bytes(record)
+    filename = image_filename(record, with_size=with_size)
+    with open(Path(output_path) / filename, "wb") as image_file:
+        image_file.write(data)
+    return filename
+
+
+class ImageWriter:
+    """
+    이미지 파일 쓰기를 스레드 풀로 처리하는 writer
+    파일명은 즉시 결정되어 반환되고, 실제 쓰기는 백그라운드에서 진행됨.
+    같은 내용(content_hash)의 이미지는 한 번만 저장하고 나머지는
+    출력 디렉토리의 image-manifest.json에 별칭으로 기록.
+    출력 디렉토리에 처음 쓸 때 현재 기획서가 더 이상 만들지 않는 이름(페이지가 밀리거나 이미지가 빠진 경우)은
+    매니페스트에서 제거 (대표 파일이면 남은 별칭 이름으로 옮기고, 남은 이름이 없으면 파일 삭제)
+
+    예약된 쓰기가 window개를 넘으면 가장 오래된 쓰기가 끝날 때까지 기다리므로
+    PDF 크기와 관계없이 메모리에 남는 이미지 바이트는 window개 이하로 유지됨
+
+    사용 예:
+        writer = ImageWriter()
+        filename, alias_of = writer.write(record, output_path)  # 중복이면 alias_of가 대표 파일명
+        writer.close()  # 모든 쓰기가 끝날 때까지 대기
+    """
+
+    def __init__(self, max_workers=None, window=WRITE_WINDOW):
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 2)
+        self.window = max(1, window)
+        self.executor = None
+        self.pending = []
+        self.failures = []
+        self.manifests = {}
+        self.alias_count = 0
+        self.unchanged_count = 0
+        self.displaced = {}
+        self.scheduled = {}
+        self.stale_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def write(self, record, output_path, with_size=True):
+        """
+        쓰기 작업을 예약하고 (파일명, 별칭이면 대표 파일명 아니면 None) 반환
+        중복 이미지는 파일을 쓰지 않고 매니페스트에 별칭만 기록
+        """
+        try:
+            return self._write(record, Path(output_path), with_size)
+        finally:
+            # 쓰기 작업이 데이터를 들고 있으므로 레코드는 바이트를 놓아 메모리 사용을 줄임
+            release_bytes(record)
+
+    def _write(self, record, output_path, with_size):
+        try:
+            # 해시를 알아야 중복 여부를 판단할 수 있으므로 여기서 처음 스트림을 읽음
+            resolve_content_hash(record)
+        except Exception as e:
+            filename = image_filename(record, with_size=with_size)
+            self.failures.append((filename, str(e)))
+            print(f"  [FAIL] Could not write {filename}: {e}")
+            return filename, None
+        filename = image_filename(record, with_size=with_size)
+
+        manifest = self.manifests.get(output_path)
+        if manifest is None:
+            manifest = self.manifests[output_path] = load_manifest(output_path)
+            # 새 별칭이 오래된 이름을 가리키지 않도록 쓰기 전에 정리
+            self.stale_count += self._drop_stale_names(output_path, manifest, record['pdf_path'])
+        known = manifest['images'].get(record['content_hash'])
+        canonical, is_new = register_image(
+            manifest, record['content_hash'], filename, record['size'], output_path,
+            pending=self.scheduled.get(output_path, ()),
+        )
+        target = output_path / filename
+        if not is_new:
+            if target.exists():
+                # 이전 실행에서 다른 내용으로 저장된 같은 이름의 파일은 별칭과 충돌하므로 치워 둠
+                self._displace(target, output_path)
+            self.alias_count += 1
+            return filename, canonical
+
+        if target.exists():
+            if known is not None and known['file'] == filename:
+                # 이전 실행에서 같은 내용으로 저장된 파일은 다시 쓰지 않음
+                self.unchanged_count += 1
+                return filename, None
+            # 다른 내용으로 덮어쓰기 전에 기존 파일을 치워 둠
+            # (페이지가 밀린 경우 캐시된 레코드가 이 파일을 원본으로 참조할 수 있음.
+            #  이름만 옮기므로 사이트 폴더에 하드링크로 배치된 파일(blob_store.py)도 바뀌지 않음)
+            self._displace(target, output_path)
+
+        # 캐시에서 온 레코드의 바이트는 덮어쓰기 순서와 무관하도록 예약 시점에 확보
+        # (같은 내용은 이후 별칭으로만 기록되므로 치워 둔 파일은 한 번 쓰면 삭제)
+        displaced = self.displaced.pop(record['content_hash'], None)
+        try:
+            if displaced is not None:
+                data = displaced.read_bytes()
+                displaced.unlink()
+            else:
+                data = record_bytes(record)
+        except Exception as e:
+            self.failures.append((filename, str(e)))
+            print(f"  [FAIL] Could not write {filename}: {e}")
+            return filename, None
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        if len(self.pending) >= self.window:
+            self._wait(len(self.pending) - self.window + 1)
+        future = self.executor.submit(target.write_bytes, data)
+        self.pending.append((filename, future))
+        self.scheduled.setdefault(output_path, set()).add(filename)
+        return filename, None
+
+    def _wait(self, count):
+        """가장 오래된 쓰기 count개가 끝날 때까지 대기"""
+        for filename, future in self.pending[:count]:
+            try:
+                future.result()
+            except Exception as e:
+                self.failures.append((filename, str(e)))
+                print(f"  [FAIL] Could not write {filename}: {e}")
+        del self.pending[:count]
+
+    def _displace(self, target, output_path):
+        """
+        덮어쓰거나 지울 파일을 출력 폴더의 DISPLACED_DIR로 옮기고 해시별로 기록
+        (바이트를 메모리에 들고 있지 않으므로 바뀐 페이지가 많아도 메모리 사용량이 늘지 않음)
+        """
+        digest = content_hash(target.read_bytes())
+        spill = output_path / DISPLACED_DIR / f"{digest}{target.suffix}"
+        if digest in self.displaced:
+            target.unlink()
+            return
+        spill.parent.mkdir(exist_ok=True)
+        os.replace(target, spill)
+        self.displaced[digest] = spill
+
+    def close(self):
+        """예약된 쓰기가 모두 끝날 때까지 대기하고 실패 목록 출력, 매니페스트 저장"""
+        self._wait(len(self.pending))
+        self.scheduled = {}
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        for output_path, manifest in self.manifests.items():
+            save_manifest(output_path, manifest)
+        # 끝까지 쓰이지 않은 치워 둔 파일 정리
+        for spill in self.displaced.values():
+            spill.unlink(missing_ok=True)
+        for output_path in self.manifests:
+            spill_dir = output_path / DISPLACED_DIR
+            if spill_dir.exists() and not any(spill_dir.iterdir()):
+                spill_dir.rmdir()
+        self.displaced = {}
+        if self.alias_count:
+            print(f"[INFO] {self.alias_count} duplicate images recorded as aliases in manifest")
+            self.alias_count = 0
+        if self.unchanged_count:
+            print(f"[INFO] {self.unchanged_count} images already up to date on disk")
+            self.unchanged_count = 0
+        if self.stale_count:
+            print(f"[INFO] {self.stale_count} stale image names no longer in the PDF removed from manifest")
+            self.stale_count = 0
+
+    def _drop_stale_names(self, output_path, manifest, pdf_path):
+        """현재 기획서가 만들지 않는 이름을 매니페스트에서 제거하고 제거한 수 반환"""
+        try:
+            images = current_image_names(pdf_path)
+        except Exception as e:
+            print(f"[WARN] Could not check stale names in {output_path}: {e}")
+            return 0
+        return drop_stale_names(manifest, output_path, lambda filename: is_current_name(filename, images))
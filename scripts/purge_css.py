@@ -0,0 +1,190 @@
+"""
+사용하지 않는 CSS 규칙 제거
+모든 HTML 페이지의 태그/class/id와 JS 문자열(classList.add('img-error'), className = 'img-placeholder',
+querySelector('.news-card') 등)에서 쓰는 이름을 모아, 선택자에 나오는 class/id/태그 중 하나라도
+어디에서도 쓰지 않는 선택자를 CSS에서 뺌
+
+- 페이지는 src/html/*.html 전체를 읽으므로 하위 페이지(news, game-info, media, support)가 추가되면 자동 반영
+- JS에서 문자열을 조합해 만드는 class처럼 정적으로 찾을 수 없는 이름은 SAFELIST/SAFELIST_PATTERNS에 추가
+- :hover 같은 가상 클래스와 :not()/:is() 안의 이름은 판단에 쓰지 않음 (남기는 쪽으로 판단)
+- 남은 규칙이 쓰지 않는 @keyframes도 제거
+
+build_assets.py가 CSS 번들(critical_css.py)을 만들 때 적용하며, 원본 CSS는 바꾸지 않음
+
+사용법 (제거 결과 확인):
+    python scripts/purge_css.py
+    python scripts/purge_css.py -v
+"""
+
+import argparse
+import re
+from pathlib import Path, PurePosixPath
+
+from critical_css import COMPOUND_PATTERN, parse_css, parse_html, serialize, split_top_level, strip_comments
+
+# JS에서 동적으로 붙이는 class (main.js: 메뉴/모달 active, 이미지 로드 실패 처리)
+SAFELIST = ('active', 'img-error', 'img-placeholder')
+# 이름 규칙으로 허용하는 class/id (상태 class 등)
+SAFELIST_PATTERNS = (r'^is-', r'^has-')
+
+JS_STRING_PATTERN = re.compile(r'''"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`''')
+SCRIPT_PATTERN = re.compile(r'<script\b[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+NAME_PATTERN = re.compile(r'[A-Za-z_][\w-]*')
+# 인자 안의 이름은 판단에서 빼는 가상 클래스 (:not(.a), :is(.a, .b) 등)
+PSEUDO_ARGS_PATTERN = re.compile(r'(::?[\w-]+)\((?:[^()]|\([^()]*\))*\)')
+KEYFRAMES_PATTERN = re.compile(r'@(?:-\w+-)?keyframes\s+([\w-]+)', re.IGNORECASE)
+
+
+def _script_names(text):
+    """JS 문자열 리터럴 안의 이름 (class/id/태그 후보)"""
+    names = set()
+    for match in JS_STRING_PATTERN.finditer(text):
+        names.update(NAME_PATTERN.findall(match.group(0)[1:-1]))
+    return names
+
+
+def collect_usage(files, read_text=None):
+    """
+    HTML/JS에서 쓰는 이름 수집
+
+    Args:
+        files: {사이트 경로: 파일 경로}
+        read_text: 사이트 경로 -> 텍스트 (기본값: 파일 읽기)
+
+    Returns:
+        {'tags': set, 'classes': set, 'ids': set}
+    """
+    if read_text is None:
+        def read_text(site_path):
+            return files[site_path].read_text(encoding='utf-8')
+
+    usage = {'tags': {'html', 'body'}, 'classes': set(SAFELIST), 'ids': set()}
+    for site_path in sorted(files):
+        suffix = PurePosixPath(site_path).suffix.lower()
+        if suffix == '.html':
+            text = read_text(site_path)
+            for element in parse_html(text).iter():
+                usage['tags'].add(element.tag)
+                usage['classes'].update(element.classes)
+                if element.attrs.get('id'):
+                    usage['ids'].add(element.attrs['id'])
+            for script in SCRIPT_PATTERN.finditer(text):
+                names = _script_names(script.group(1))
+                for key in usage:
+                    usage[key].update(names)
+        elif suffix == '.js':
+            # 문자열에 나오는 이름은 class/id/태그(createElement) 어느 쪽으로도 쓰일 수 있음
+            names = _script_names(read_text(site_path))
+            for key in usage:
+                usage[key].update(names)
+    return usage
+
+
+def _is_allowed(name):
+    return any(re.search(pattern, name) for pattern in SAFELIST_PATTERNS)
+
+
+def selector_used(selector, usage):
+    """선택자의 태그/class/id가 모두 쓰이는지 확인"""
+    stripped = PSEUDO_ARGS_PATTERN.sub(r'\1', selector)
+    for match in COMPOUND_PATTERN.finditer(stripped):
+        tag, element_id, class_name = match.group('tag'), match.group('id'), match.group('cls')
+        if tag and tag != '*' and tag.lower() not in usage['tags'] and not _is_allowed(tag):
+            return False
+        if element_id and element_id not in usage['ids'] and not _is_allowed(element_id):
+            return False
+        if class_name and class_name not in usage['classes'] and not _is_allowed(class_name):
+            return False
+    return True
+
+
+def purge_rules(rules, usage, removed=None):
+    """
+    쓰지 않는 선택자와 규칙을 뺀 새 규칙 목록
+
+    Args:
+        rules: critical_css.parse_css() 결과
+        usage: collect_usage() 결과
+        removed: 제거한 선택자를 모을 리스트 (선택)
+    """
+    kept = _purge(rules, usage, removed)
+    # 남은 규칙에서 쓰지 않는 @keyframes 제거
+    css = serialize(kept)
+    animations = set(re.findall(r'animation(?:-name)?:([^;}]+)', css))
+    used_names = {name for value in animations for name in NAME_PATTERN.findall(value)}
+    return _drop_keyframes(kept, used_names, removed)
+
+
+def _purge(rules, usage, removed):
+    kept = []
+    for rule in rules:
+        if rule['type'] == 'rule':
+            selectors = split_top_level(rule['selector'], ',')
+            used = [selector for selector in selectors if selector_used(selector, usage)]
+            if removed is not None:
+                removed.extend(selector.strip() for selector in selectors if selector not in used)
+            if used:
+                kept.append({**rule, 'selector': ','.join(used)})
+        elif rule['type'] == 'group':
+            inner = _purge(rule['rules'], usage, removed)
+            if inner:
+                kept.append({**rule, 'rules': inner})
+        else:
+            kept.append(rule)
+    return kept
+
+
+def _drop_keyframes(rules, used_names, removed):
+    kept = []
+    for rule in rules:
+        if rule['type'] == 'at':
+            match = KEYFRAMES_PATTERN.match(rule['prelude'])
+            if match and match.group(1) not in used_names:
+                if removed is not None:
+                    removed.append(rule['prelude'].strip())
+                continue
+        elif rule['type'] == 'group':
+            rule = {**rule, 'rules': _drop_keyframes(rule['rules'], used_names, removed)}
+        kept.append(rule)
+    return kept
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    from build_assets import collect_files
+
+    parser = argparse.ArgumentParser(description="사용하지 않는 CSS 규칙 제거 결과 확인")
+    parser.add_argument('-v', '--verbose', action='store_true', help="제거되는 선택자 출력")
+    args = parser.parse_args()
+
+    files = collect_files(project_root)
+    usage = collect_usage(files)
+    pages = [site_path for site_path in files if site_path.endswith('.html')]
+    print(f"Purging unused CSS ({len(pages)} page(s), {len(usage['classes'])} class names)")
+    print("=" * 60)
+
+    before_total = after_total = 0
+    for site_path in sorted(files):
+        if PurePosixPath(site_path).suffix.lower() != '.css':
+            continue
+        rules = parse_css(strip_comments(files[site_path].read_text(encoding='utf-8')))
+        removed = []
+        before = len(serialize(rules).encode('utf-8'))
+        after = len(serialize(purge_rules(rules, usage, removed)).encode('utf-8'))
+        before_total += before
+        after_total += after
+        print(f"  [OK] {site_path}: {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+              f"({len(removed)} selectors removed)")
+        if args.verbose:
+            for selector in removed:
+                print(f"     - {selector}")
+
+    print("\n" + "=" * 60)
+    saved = before_total - after_total
+    print(f"[SUMMARY] {before_total / 1024:.1f} KB -> {after_total / 1024:.1f} KB "
+          f"(saved {saved / 1024:.1f} KB, {saved / before_total * 100 if before_total else 0:.1f}%, minified)")
+
+
+if __name__ == "__main__":
+    main()
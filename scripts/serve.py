@@ -0,0 +1,346 @@
+"""
+로컬 정적 서버 (Vercel 동작 재현)
+배포 전에 캐시/전송 동작을 측정하기 위해 vercel.json의 rewrites와 headers 규칙을 그대로 적용하는
+asyncio HTTP/1.1 서버
+
+- rewrites: 요청 경로에 맞는 파일이 없을 때 규칙에 따라 다른 파일로 응답 (/ -> /src/html/index.html)
+- headers: 요청 경로에 맞는 모든 규칙의 헤더 추가 (Cache-Control이 없으면 Vercel 기본값)
+- ETag/If-None-Match: 내용 해시 기반 ETag, 일치하면 304
+- Range: 단일 바이트 범위 요청에 206 (히어로 영상 탐색 등), If-Range 지원
+- 사전 압축: Accept-Encoding에 맞는 .br/.gz 파일(compress_assets.py)이 있으면 그대로 전송
+- 파일 본문은 loop.sendfile()로 전송 (os.sendfile을 못 쓰는 환경에서는 자동으로 읽어서 전송)
+
+사용법:
+    python scripts/build_assets.py && python scripts/compress_assets.py
+    python scripts/serve.py                 # dist/ 제공 (http://127.0.0.1:8000)
+    python scripts/serve.py --root . -p 3000
+"""
+
+import argparse
+import asyncio
+import json
+import mimetypes
+import re
+import sys
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from image_manifest import file_hash
+
+# Vercel이 규칙 없는 정적 파일에 붙이는 기본 캐시 헤더
+DEFAULT_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+# Accept-Encoding 우선순위 순서의 (인코딩, 사전 압축 파일 확장자)
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+MAX_HEADER_BYTES = 64 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+
+STATUS_TEXT = {
+    200: 'OK', 206: 'Partial Content', 304: 'Not Modified', 400: 'Bad Request',
+    404: 'Not Found', 405: 'Method Not Allowed', 416: 'Range Not Satisfiable',
+}
+# mimetypes 기본 목록에 없거나 플랫폼마다 다른 형식
+EXTRA_TYPES = {
+    '.avif': 'image/avif', '.webp': 'image/webp', '.woff2': 'font/woff2', '.woff': 'font/woff',
+    '.svg': 'image/svg+xml', '.js': 'text/javascript', '.mp4': 'video/mp4', '.webm': 'video/webm',
+}
+TEXT_TYPES = ('text/', 'application/json', 'image/svg+xml')
+
+
+def compile_source(source):
+    """
+    vercel.json의 source 패턴(path-to-regexp)을 정규식으로 변환
+    (.*) 같은 그룹은 그대로, :name은 경로 한 조각, :name*은 나머지 전체
+    """
+    pattern = ''
+    pos = 0
+    for match in re.finditer(r':(\w+)(\*)?|\([^)]*\)', source):
+        pattern += re.escape(source[pos:match.start()])
+        if match.group(1):
+            body = '.*' if match.group(2) else '[^/]+'
+            pattern += f"(?P<{match.group(1)}>{body})"
+        else:
+            pattern += match.group(0)
+        pos = match.end()
+    pattern += re.escape(source[pos:])
+    return re.compile(pattern + '$')
+
+
+def substitute(destination, match):
+    """rewrite destination의 $1, :name을 매치 결과로 치환"""
+    destination = re.sub(r'\$(\d+)', lambda m: match.group(int(m.group(1))) or '', destination)
+    return re.sub(r':(\w+)', lambda m: match.groupdict().get(m.group(1), m.group(0)) or '', destination)
+
+
+def load_vercel_config(config_path):
+    """vercel.json의 rewrites/headers를 (정규식, 값) 목록으로 읽기"""
+    config_path = Path(config_path)
+    if not config_path.exists():
+        print(f"[WARN] {config_path} not found, serving without rewrites/headers")
+        return {'rewrites': [], 'headers': []}
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    return {
+        'rewrites': [(compile_source(rule['source']), rule['destination']) for rule in config.get('rewrites', [])],
+        'headers': [
+            (compile_source(rule['source']), [(header['key'], header['value']) for header in rule['headers']])
+            for rule in config.get('headers', [])
+        ],
+    }
+
+
+def content_type(path):
+    """파일 확장자로 Content-Type 결정 (텍스트는 UTF-8)"""
+    suffix = Path(path).suffix.lower()
+    mime = EXTRA_TYPES.get(suffix) or mimetypes.guess_type(str(path))[0] or 'application/octet-stream'
+    if mime.startswith(TEXT_TYPES):
+        mime += '; charset=utf-8'
+    return mime
+
+
+def parse_accept_encoding(value):
+    """Accept-Encoding의 {인코딩: q} (q=0은 거부)"""
+    accepted = {}
+    for item in (value or '').split(','):
+        name, _, params = item.strip().partition(';')
+        if not name:
+            continue
+        q = 1.0
+        match = re.search(r'q\s*=\s*([\d.]+)', params)
+        if match:
+            q = float(match.group(1))
+        accepted[name.strip().lower()] = q
+    return accepted
+
+
+def parse_range(value, size):
+    """
+    단일 바이트 범위 헤더 해석
+
+    Returns:
+        (시작, 끝) 포함 범위, 범위 헤더가 아니면 None, 만족할 수 없으면 False
+    """
+    match = re.fullmatch(r'\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*', value or '')
+    if not match or not (match.group(1) or match.group(2)):
+        return None  # 여러 범위 등 지원하지 않는 형식은 전체 응답
+    if match.group(1):
+        start = int(match.group(1))
+        end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+    else:
+        length = int(match.group(2))
+        if length == 0:
+            return False
+        start, end = max(0, size - length), size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+class StaticServer:
+    """vercel.json 규칙을 적용하는 정적 파일 서버"""
+
+    def __init__(self, root, config, quiet=False):
+        self.root = Path(root).resolve()
+        self.config = config
+        self.quiet = quiet
+        # (경로, 크기, 수정 시각) -> ETag (내용이 바뀌면 키가 바뀜)
+        self.etags = {}
+
+    def find_file(self, path):
+        """요청 경로에 해당하는 파일 (루트 밖이나 디렉토리는 None)"""
+        candidate = (self.root / path.lstrip('/')).resolve()
+        if candidate != self.root and self.root not in candidate.parents:
+            return None
+        return candidate if candidate.is_file() else None
+
+    def resolve(self, path):
+        """파일을 먼저 찾고, 없으면 rewrites 규칙 적용 (Vercel과 같은 순서)"""
+        found = self.find_file(path)
+        if found is not None:
+            return found, path
+        for pattern, destination in self.config['rewrites']:
+            match = pattern.match(path)
+            if match:
+                target = substitute(destination, match)
+                return self.find_file(urlsplit(target).path), target
+        return None, path
+
+    def etag(self, path, encoding=None):
+        """내용 해시 기반 강한 ETag (인코딩별로 다른 값)"""
+        stat = path.stat()
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        if key not in self.etags:
+            self.etags[key] = file_hash(path)[:16]
+        return f'"{self.etags[key]}-{encoding}"' if encoding else f'"{self.etags[key]}"'
+
+    def rule_headers(self, path):
+        """요청 경로에 맞는 headers 규칙의 헤더 목록"""
+        headers = []
+        for pattern, values in self.config['headers']:
+            if pattern.match(path):
+                headers.extend(values)
+        if not any(key.lower() == 'cache-control' for key, _ in headers):
+            headers.append(('Cache-Control', DEFAULT_CACHE_CONTROL))
+        return headers
+
+    def select_representation(self, file_path, request_headers):
+        """Accept-Encoding에 맞는 사전 압축 파일 선택 (범위 요청은 원본만)"""
+        if 'range' in request_headers:
+            return file_path, None
+        accepted = parse_accept_encoding(request_headers.get('accept-encoding'))
+        for encoding, suffix in PRECOMPRESSED:
+            q = accepted.get(encoding, accepted.get('*', 0))
+            if q <= 0:
+                continue
+            compressed = file_path.with_name(file_path.name + suffix)
+            if compressed.is_file():
+                return compressed, encoding
+        return file_path, None
+
+    async def handle(self, reader, writer):
+        """연결 하나의 요청 처리 (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError):
+                    break
+                keep_alive = await self.respond(head.decode('latin-1'), writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, head, writer):
+        """요청 하나에 응답하고 연결 유지 여부 반환"""
+        lines = head.split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            self.send_head(writer, 400, [('Content-Length', '0')], keep_alive=False)
+            return False
+        request_headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                request_headers[key.strip().lower()] = value.strip()
+
+        connection = request_headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+        path = unquote(urlsplit(target).path)
+
+        if method not in ('GET', 'HEAD'):
+            self.send_head(writer, 405, [('Allow', 'GET, HEAD'), ('Content-Length', '0')], keep_alive)
+            self.log(405, method, path)
+            return keep_alive
+
+        file_path, resolved = self.resolve(path)
+        if file_path is None:
+            body = b"404 Not Found\n"
+            self.send_head(writer, 404, [('Content-Type', 'text/plain; charset=utf-8'),
+                                         ('Content-Length', str(len(body)))], keep_alive)
+            if method == 'GET':
+                writer.write(body)
+            self.log(404, method, path)
+            return keep_alive
+
+        body_path, encoding = self.select_representation(file_path, request_headers)
+        etag = self.etag(body_path, encoding)
+        size = body_path.stat().st_size
+        headers = [
+            ('Content-Type', content_type(file_path)),
+            ('ETag', etag),
+            ('Accept-Ranges', 'bytes'),
+            ('Vary', 'Accept-Encoding'),
+        ] + self.rule_headers(path)
+        if encoding:
+            headers.append(('Content-Encoding', encoding))
+
+        if_none_match = request_headers.get('if-none-match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [tag.strip() for tag in if_none_match.split(',')]):
+            self.send_head(writer, 304, headers, keep_alive)
+            self.log(304, method, path, resolved)
+            return keep_alive
+
+        status, offset, count = 200, 0, size
+        if encoding is None and 'range' in request_headers:
+            if_range = request_headers.get('if-range')
+            byte_range = parse_range(request_headers['range'], size) if if_range in (None, etag) else None
+            if byte_range is False:
+                headers.append(('Content-Range', f"bytes */{size}"))
+                headers.append(('Content-Length', '0'))
+                self.send_head(writer, 416, headers, keep_alive)
+                self.log(416, method, path, resolved)
+                return keep_alive
+            if byte_range:
+                status, offset, count = 206, byte_range[0], byte_range[1] - byte_range[0] + 1
+                headers.append(('Content-Range', f"bytes {byte_range[0]}-{byte_range[1]}/{size}"))
+
+        headers.append(('Content-Length', str(count)))
+        self.send_head(writer, status, headers, keep_alive)
+        if method == 'GET' and count:
+            await writer.drain()
+            with open(body_path, 'rb') as f:
+                await asyncio.get_running_loop().sendfile(writer.transport, f, offset, count)
+        self.log(status, method, path, resolved, encoding, count)
+        return keep_alive
+
+    def send_head(self, writer, status, headers, keep_alive):
+        """상태 줄과 헤더 전송"""
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}",
+                 f"Date: {formatdate(usegmt=True)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines.extend(f"{key}: {value}" for key, value in headers)
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+    def log(self, status, method, path, resolved=None, encoding=None, count=None):
+        """요청 로그 한 줄"""
+        if self.quiet:
+            return
+        details = []
+        if resolved and resolved != path:
+            details.append(f"-> {resolved}")
+        if encoding:
+            details.append(encoding)
+        if count is not None:
+            details.append(f"{count / 1024:.1f} KB")
+        print(f"  [{status}] {method} {path} {' '.join(details)}".rstrip())
+
+
+async def serve(root, config, host, port, quiet=False):
+    """서버 실행 (Ctrl+C로 종료)"""
+    server = StaticServer(root, config, quiet=quiet)
+    listener = await asyncio.start_server(server.handle, host, port, limit=MAX_HEADER_BYTES)
+    print(f"[INFO] Serving {server.root} at http://{host}:{port}/")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="vercel.json 규칙을 적용하는 로컬 정적 서버")
+    parser.add_argument('--root', default=project_root / "dist", type=Path,
+                        help="제공할 디렉토리 (기본값: dist)")
+    parser.add_argument('--config', default=project_root / "vercel.json", type=Path,
+                        help="Vercel 설정 파일 (기본값: vercel.json)")
+    parser.add_argument('--host', default='127.0.0.1', help="바인드 주소 (기본값: 127.0.0.1)")
+    parser.add_argument('-p', '--port', type=int, default=8000, help="포트 (기본값: 8000)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="요청 로그 출력 안 함")
+    args = parser.parse_args()
+
+    if not args.root.exists():
+        print(f"[ERROR] {args.root} not found (run scripts/build_assets.py first)")
+        sys.exit(1)
+
+    try:
+        asyncio.run(serve(args.root, load_vercel_config(args.config), args.host, args.port, quiet=args.quiet))
+    except KeyboardInterrupt:
+        print("\n[DONE] Server stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+서비스 워커(sw.js) 생성
+build_assets.py로 빌드한 결과(dist/)의 자산 참조 그래프(asset_graph.py)에서 각 페이지가 내려받는
+같은 출처의 자산(해시된 CSS/JS/폰트, 히어로/새소식/게임 특징 이미지 등)을 모아 precache 목록을 만들고,
+dist/sw.js로 저장함
+
+- precache 캐시 이름에 버전(페이지 HTML과 precache 목록의 내용 해시)을 붙이므로,
+  자산이 바뀌면 sw.js 내용도 바뀌어 브라우저가 새 서비스 워커를 설치하고 이전 캐시를 지움
+- 페이지 이동: 네트워크 우선, 오프라인/연결 실패 시 캐시된 페이지
+- 새소식 썸네일(NEWS_PREFIX): stale-while-revalidate (캐시를 바로 응답하고 백그라운드에서 갱신)
+- precache에 있는 자산: 캐시 우선 (해시된 URL이므로 내용이 바뀌지 않음)
+- 그 외 요청(외부 CDN, Range 요청 등)은 서비스 워커가 관여하지 않음
+
+vercel.json의 rewrites(/ -> /src/html/index.html)로 접근하는 페이지 URL도 precache에 포함
+
+사용법 (build_assets.py가 빌드 후 자동 실행, 단독 실행 시 이미 빌드한 결과에 다시 생성):
+    python scripts/service_worker.py
+    python scripts/service_worker.py --dist dist
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from asset_graph import build_graph, collect_site_files, page_assets
+from image_manifest import content_hash
+
+SERVICE_WORKER_NAME = "sw.js"
+CACHE_PREFIX = "sf-"
+VERSION_LENGTH = 12
+# stale-while-revalidate로 제공하는 새소식 썸네일 경로
+NEWS_PREFIX = "/assets/images/news/"
+# 런타임 새소식 캐시에 보관할 최대 항목 수
+NEWS_CACHE_LIMIT = 40
+
+SERVICE_WORKER_TEMPLATE = """\
+// SF 리마스터 서비스 워커 (scripts/service_worker.py가 생성, 직접 수정하지 마세요)
+const VERSION = '__VERSION__';
+const PRECACHE = '__PREFIX__precache-' + VERSION;
+const NEWS_CACHE = '__PREFIX__news';
+const NEWS_PREFIX = '__NEWS_PREFIX__';
+const NEWS_CACHE_LIMIT = __NEWS_CACHE_LIMIT__;
+const PAGES = __PAGES__;
+const PRECACHE_URLS = __PRECACHE_URLS__;
+const PRECACHED = new Set(PRECACHE_URLS);
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then(cache => cache.addAll(PRECACHE_URLS))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    // 이전 버전의 precache 삭제 (새소식 캐시는 버전과 무관하게 유지)
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys
+                    .filter(key => key.startsWith('__PREFIX__') && key !== PRECACHE && key !== NEWS_CACHE)
+                    .map(key => caches.delete(key))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+// 새소식 캐시 항목 수 제한 (오래 저장된 것부터 삭제)
+function trimCache(cacheName, limit) {
+    return caches.open(cacheName).then(cache =>
+        cache.keys().then(keys =>
+            Promise.all(keys.slice(0, Math.max(0, keys.length - limit)).map(key => cache.delete(key)))
+        )
+    );
+}
+
+// 네트워크 우선, 실패 시 캐시된 페이지
+function networkFirst(request, url) {
+    return fetch(request).catch(() =>
+        caches.match(request, { ignoreSearch: true })
+            .then(response => response || caches.match(PAGES[url.pathname] || '/'))
+    );
+}
+
+// 캐시를 바로 응답하고 백그라운드에서 갱신
+function staleWhileRevalidate(event) {
+    const request = event.request;
+    const update = fetch(request);
+    const store = update.then(response => {
+        if (!response.ok) {
+            return undefined;
+        }
+        return caches.open(NEWS_CACHE)
+            .then(cache => cache.put(request, response.clone()))
+            .then(() => trimCache(NEWS_CACHE, NEWS_CACHE_LIMIT));
+    });
+    event.waitUntil(store.catch(() => undefined));
+    return caches.match(request).then(cached => cached || update);
+}
+
+// 캐시 우선 (해시된 자산)
+function cacheFirst(request) {
+    return caches.match(request).then(cached => cached || fetch(request));
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || request.headers.has('range')) {
+        return;
+    }
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(request, url));
+    } else if (url.pathname.startsWith(NEWS_PREFIX)) {
+        event.respondWith(staleWhileRevalidate(event));
+    } else if (PRECACHED.has(url.pathname)) {
+        event.respondWith(cacheFirst(request));
+    }
+});
+"""
+
+
+def page_urls(site_root, config_path=None):
+    """
+    페이지 사이트 경로별 접근 URL 목록
+    vercel.json의 rewrites 중 목적지가 HTML 페이지이고 매개변수가 없는 규칙만 사용 (/ -> src/html/index.html)
+
+    Returns:
+        {페이지 사이트 경로: [URL, ...]} (페이지 자신의 URL 포함)
+    """
+    pages = {
+        path.relative_to(site_root).as_posix(): []
+        for path in sorted((Path(site_root) / 'src').rglob('*.html'))
+    }
+    rewrites = []
+    if config_path is not None and Path(config_path).exists():
+        with open(config_path, 'r', encoding='utf-8') as f:
+            rewrites = json.load(f).get('rewrites', [])
+    for rule in rewrites:
+        page = rule['destination'].lstrip('/')
+        if page in pages and not any(char in rule['source'] for char in ':*('):
+            pages[page].append(rule['source'])
+    for page, urls in pages.items():
+        urls.append('/' + page)
+    return pages
+
+
+def precache_list(site_root, pages):
+    """
+    precache할 URL 목록 (페이지 URL + 페이지가 내려받는 같은 출처 자산, 지연 로딩 이미지 포함)
+
+    Args:
+        site_root: 빌드 결과 디렉토리
+        pages: page_urls() 결과
+
+    Returns:
+        정렬된 URL 리스트
+    """
+    graph = build_graph(collect_site_files(site_root))
+    urls = set()
+    for page, aliases in pages.items():
+        urls.update(aliases)
+        for path, asset in page_assets(graph, page).items():
+            if asset['external'] or not asset['exists'] or asset['kind'] == 'document':
+                continue
+            urls.add('/' + path)
+    return sorted(urls)
+
+
+def cache_version(site_root, pages, urls):
+    """precache 목록과 페이지 HTML 내용으로 만든 캐시 버전 (자산 이름은 내용 해시이므로 내용 변경도 반영됨)"""
+    data = json.dumps(urls).encode('utf-8')
+    for page in sorted(pages):
+        data += (Path(site_root) / page).read_bytes()
+    return content_hash(data)[:VERSION_LENGTH]
+
+
+def generate_service_worker(site_root, config_path=None):
+    """
+    빌드 결과에 sw.js 생성
+
+    Args:
+        site_root: 빌드 결과 디렉토리 (dist/)
+        config_path: vercel.json 경로 (페이지 URL rewrites)
+
+    Returns:
+        {'path': sw.js 경로, 'version': 캐시 버전, 'urls': precache URL 리스트}
+    """
+    site_root = Path(site_root)
+    pages = page_urls(site_root, config_path)
+    urls = precache_list(site_root, pages)
+    version = cache_version(site_root, pages, urls)
+    # 페이지 URL -> 오프라인일 때 대신 응답할 precache URL
+    fallbacks = {url: aliases[0] for aliases in pages.values() for url in aliases}
+
+    script = SERVICE_WORKER_TEMPLATE
+    for key, value in (
+        ('__VERSION__', version),
+        ('__PREFIX__', CACHE_PREFIX),
+        ('__NEWS_PREFIX__', NEWS_PREFIX),
+        ('__NEWS_CACHE_LIMIT__', str(NEWS_CACHE_LIMIT)),
+        ('__PAGES__', json.dumps(fallbacks, ensure_ascii=False, sort_keys=True)),
+        ('__PRECACHE_URLS__', json.dumps(urls, ensure_ascii=False, indent=4)),
+    ):
+        script = script.replace(key, value)
+
+    path = site_root / SERVICE_WORKER_NAME
+    path.write_text(script, encoding='utf-8')
+    return {'path': path, 'version': version, 'urls': urls}
+
+
+def main():
+    project_root = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="빌드 결과에 서비스 워커(sw.js) 생성")
+    parser.add_argument('--dist', type=Path, default=project_root / "dist",
+                        help="빌드 결과 디렉토리 (기본값: dist)")
+    args = parser.parse_args()
+
+    if not args.dist.exists():
+        print(f"[ERROR] {args.dist} not found (run scripts/build_assets.py first)")
+        sys.exit(1)
+
+    result = generate_service_worker(args.dist, project_root / "vercel.json")
+    for url in result['urls']:
+        print(f"  [OK] {url}")
+    print("\n" + "=" * 60)
+    print(f"[DONE] {result['path']} (version {result['version']}, {len(result['urls'])} precached URLs)")
+
+
+if __name__ == "__main__":
+    main()
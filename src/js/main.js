@@ -197,7 +197,8 @@ document.addEventListener('DOMContentLoaded', function() {
   // 모든 이미지에 오류 핸들러 추가
   document.querySelectorAll('img').forEach(img => {
     // 이미 로드된 이미지 중 실패한 것 처리
-    if (!img.complete || img.naturalHeight === 0) {
+    // (loading="lazy" 이미지는 아직 요청 전이라 complete가 false이므로 실패로 보지 않음)
+    if (img.complete && img.naturalHeight === 0) {
       handleImageError(img);
     }
     
@@ -209,3 +210,13 @@ document.addEventListener('DOMContentLoaded', function() {
   
   console.log('SF 리마스터 웹사이트 로드 완료');
 });
+
+// ============================================
+// Service Worker (재방문 시 캐시에서 바로 로드)
+// ============================================
+// sw.js는 빌드(scripts/build_assets.py) 결과에만 있으므로 원본을 직접 열 때는 등록에 실패해도 무시
+if ('serviceWorker' in navigator) {
+  window.addEventListener('load', function() {
+    navigator.serviceWorker.register('/sw.js').catch(function() {});
+  });
+}